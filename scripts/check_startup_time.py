@@ -0,0 +1,101 @@
+#!/usr/bin/env python3
+"""
+Start-up time benchmark for the zen CLI.
+
+Imports ``zen.cli.main`` in fresh interpreters under ``python -X importtime``
+and fails when the cumulative import time exceeds the budget, or when a heavy
+dependency that should only be imported lazily shows up at start-up.
+
+Usage:
+    python scripts/check_startup_time.py
+    python scripts/check_startup_time.py --budget-ms 80 --runs 7
+"""
+
+import argparse
+import os
+import statistics
+import subprocess
+import sys
+from pathlib import Path
+
+# Default budget for importing zen.cli.main (median over all runs)
+DEFAULT_BUDGET_MS = 60.0
+
+# Modules that must not be imported just to start the CLI
+LAZY_MODULES = [
+    "requests",
+    "pydantic",
+    "yaml",
+    "rich.console",
+    "rich.live",
+    "rich.progress",
+    "rich.table",
+    "zen.core.logger",
+    "zen.core.installer",
+    "zen.schemas.component",
+]
+
+
+def measure(module: str):
+    """Import a module in a fresh interpreter and return (total_ms, imported module names)."""
+    repo_root = Path(__file__).resolve().parent.parent
+    env = dict(os.environ, PYTHONPATH=str(repo_root) + os.pathsep + os.environ.get("PYTHONPATH", ""))
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        capture_output=True, text=True, env=env, check=True,
+    )
+
+    imported = set()
+    total_us = 0
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:") or line.count("|") != 2:
+            continue
+        _, cumulative, raw_name = line.split("|")
+        try:
+            cumulative_us = int(cumulative.strip())
+        except ValueError:
+            # Header line
+            continue
+        name = raw_name.strip()
+        imported.add(name)
+        # The requested module's own top-level line covers everything it imported
+        if name == module and raw_name.startswith(" ") and not raw_name.startswith("  "):
+            total_us = cumulative_us
+    return total_us / 1000.0, imported
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Check zen CLI import time against a budget")
+    parser.add_argument("--budget-ms", type=float, default=DEFAULT_BUDGET_MS,
+                        help=f"Maximum median import time in ms (default: {DEFAULT_BUDGET_MS})")
+    parser.add_argument("--runs", type=int, default=5, help="Number of fresh interpreters to measure")
+    parser.add_argument("--module", default="zen.cli.main", help="Module to import")
+    args = parser.parse_args()
+
+    timings = []
+    imported = set()
+    for _ in range(args.runs):
+        total_ms, imported = measure(args.module)
+        timings.append(total_ms)
+
+    median = statistics.median(timings)
+    print(f"import {args.module}: median {median:.1f} ms, min {min(timings):.1f} ms "
+          f"over {args.runs} runs (budget {args.budget_ms:.1f} ms)")
+
+    failed = False
+    eager = sorted(m for m in LAZY_MODULES if m in imported)
+    if eager:
+        print(f"FAIL: imported at start-up but should be lazy: {', '.join(eager)}")
+        failed = True
+    if median > args.budget_ms:
+        print(f"FAIL: import time {median:.1f} ms exceeds budget of {args.budget_ms:.1f} ms")
+        failed = True
+
+    if failed:
+        return 1
+    print("OK")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,159 @@
+"""
+Shared fixtures for the zen test suite.
+
+Nothing here touches the network: `http_server` serves a temporary directory
+with Python's ``http.server`` (which answers ``If-Modified-Since`` with 304),
+and `github` routes raw.githubusercontent.com and the GitHub API to it.
+"""
+
+import functools
+import http.server
+import json
+import os
+import threading
+from pathlib import Path
+
+import pytest
+
+from zen.core import cache, lockfile, mirror
+
+
+class _Handler(http.server.SimpleHTTPRequestHandler):
+    """Static files, plus ``/repos/<owner>/<repo>/commits/<ref>`` answered from `server.commits`."""
+
+    protocol_version = "HTTP/1.1"
+
+    def log_message(self, *args):
+        pass
+
+    def send_response(self, code, message=None):
+        self.server.requests.append((self.path, int(code)))
+        super().send_response(code, message)
+
+    def do_GET(self):
+        if self.path.startswith("/repos/"):
+            return self._commit()
+        return super().do_GET()
+
+    def _commit(self):
+        # /repos/<owner>/<repo>/commits/<ref>
+        parts = self.path.split("/")
+        sha = self.server.commits.get((parts[2], parts[3], parts[5]))
+        if self.server.rate_limited:
+            status, body = 403, b""
+        elif sha is None:
+            status, body = 404, b""
+        else:
+            status, body = 200, sha.encode()
+        self.server.api_headers.append(dict(self.headers))
+        self.send_response(status)
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+
+class LocalServer:
+    """A directory served over HTTP, recording every (path, status) it answered."""
+
+    def __init__(self, root: Path):
+        self.root = root
+        self._server = http.server.ThreadingHTTPServer(
+            ("127.0.0.1", 0), functools.partial(_Handler, directory=str(root))
+        )
+        self._server.requests = []
+        self._server.commits = {}
+        self._server.api_headers = []
+        self._server.rate_limited = False
+        self.url = f"http://127.0.0.1:{self._server.server_address[1]}"
+        threading.Thread(target=self._server.serve_forever, args=(0.05,), daemon=True).start()
+
+    @property
+    def requests(self):
+        return self._server.requests
+
+    @property
+    def commits(self):
+        return self._server.commits
+
+    @property
+    def api_headers(self):
+        return self._server.api_headers
+
+    def rate_limit(self, limited: bool = True):
+        self._server.rate_limited = limited
+
+    def write(self, path: str, content, mtime: float = None) -> Path:
+        """Create a served file; a fixed `mtime` keeps If-Modified-Since answering 304."""
+        target = self.root / path
+        target.parent.mkdir(parents=True, exist_ok=True)
+        if isinstance(content, bytes):
+            target.write_bytes(content)
+        else:
+            target.write_text(content)
+        if mtime is not None:
+            os.utime(target, (mtime, mtime))
+        return target
+
+    def write_component(self, directory: str, component: dict, files: dict, mtime: float = None) -> str:
+        """Publish a component.json and its files; returns the component.json URL."""
+        self.write(f"{directory}/component.json", json.dumps(component), mtime)
+        for name, content in files.items():
+            self.write(f"{directory}/{name}", content, mtime)
+        return f"{self.url}/{directory}/component.json"
+
+    def fetched(self, suffix: str):
+        """Statuses of every request whose path ends with `suffix`."""
+        return [status for path, status in self.requests if path.endswith(suffix)]
+
+    def close(self):
+        self._server.shutdown()
+        self._server.server_close()
+
+
+@pytest.fixture(autouse=True)
+def isolated_zen(tmp_path, monkeypatch):
+    """A private fetch cache and no process-wide zen state leaking between tests."""
+    for var in ("ZEN_MIRROR", "ZEN_OFFLINE", "ZEN_NO_CACHE", "ZEN_CACHE_TTL", "ZEN_CACHE_MAX_SIZE",
+                "ZEN_GITHUB_ARCHIVE", "GITHUB_TOKEN", "ZEN_GITHUB_API_URL"):
+        monkeypatch.delenv(var, raising=False)
+    monkeypatch.setenv("ZEN_CACHE_DIR", str(tmp_path / "cache"))
+    monkeypatch.setattr(cache, "_fetch_cache", None)
+    monkeypatch.setattr(cache, "_fetch_cache_broken", False)
+    monkeypatch.setattr(lockfile, "_commits", {})
+    monkeypatch.setattr(lockfile, "_api_unavailable", False)
+    mirror.set_offline_mode(None)
+    yield
+    mirror.set_offline_mode(None)
+
+
+@pytest.fixture
+def http_server(tmp_path):
+    server = LocalServer(tmp_path / "served")
+    server.root.mkdir()
+    yield server
+    server.close()
+
+
+@pytest.fixture
+def github(http_server, monkeypatch):
+    """`http_server` standing in for raw.githubusercontent.com and api.github.com."""
+    from zen.core.http import SessionManager
+
+    get = SessionManager.get
+
+    def routed(self, url, timeout=30, **kwargs):
+        return get(self, url.replace("https://raw.githubusercontent.com", http_server.url), timeout, **kwargs)
+
+    monkeypatch.setattr(SessionManager, "get", routed)
+    monkeypatch.setenv("ZEN_GITHUB_API_URL", http_server.url)
+    return http_server
+
+
+@pytest.fixture
+def project(tmp_path, monkeypatch):
+    """An initialized, empty zen project as the working directory."""
+    root = tmp_path / "project"
+    (root / ".zen").mkdir(parents=True)
+    (root / ".zen" / "config.yaml").write_text("name: test-project\ncomponents: {}\n")
+    monkeypatch.chdir(root)
+    return root
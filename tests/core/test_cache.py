@@ -0,0 +1,113 @@
+"""Tests for the content-addressed fetch cache."""
+
+import time
+
+import pytest
+
+from zen.core import cache as cache_module
+from zen.core.cache import CacheEntry, FetchCache, get_fetch_cache
+
+
+@pytest.fixture
+def fetch_cache(tmp_path):
+    return FetchCache(cache_dir=tmp_path / "fetch-cache", ttl=60, max_size=1024)
+
+
+def test_put_then_get_returns_body(fetch_cache):
+    sha256 = fetch_cache.put("http://example.test/a.py", b"print('a')\n", etag='"v1"')
+
+    assert fetch_cache.get("http://example.test/a.py") == b"print('a')\n"
+    entry = fetch_cache.lookup("http://example.test/a.py")
+    assert entry.sha256 == sha256
+    assert entry.etag == '"v1"'
+
+
+def test_identical_bodies_are_stored_once(fetch_cache):
+    first = fetch_cache.put("http://example.test/a.py", b"same")
+    second = fetch_cache.put("http://example.test/b.py", b"same")
+
+    assert first == second
+    assert fetch_cache.total_size() == len(b"same")
+
+
+def test_entries_within_ttl_are_fresh(fetch_cache):
+    fresh = CacheEntry(url="u", sha256="0" * 64, fetched_at=time.time() - 30)
+    expired = CacheEntry(url="u", sha256="0" * 64, fetched_at=time.time() - 61)
+
+    assert fetch_cache.is_fresh(fresh)
+    assert not fetch_cache.is_fresh(expired)
+
+
+def test_zero_ttl_never_serves_without_revalidation(tmp_path):
+    fetch_cache = FetchCache(cache_dir=tmp_path / "fetch-cache", ttl=0)
+    fetch_cache.put("http://example.test/a.py", b"body")
+
+    assert fetch_cache.get("http://example.test/a.py") is None
+    # The body is still there for a conditional request
+    assert fetch_cache.lookup("http://example.test/a.py") is not None
+
+
+def test_conditional_headers_carry_validators(fetch_cache):
+    fetch_cache.put("http://example.test/a.py", b"body", etag='"v1"', last_modified="Mon, 01 Jan 2024 00:00:00 GMT")
+
+    headers = fetch_cache.conditional_headers(fetch_cache.lookup("http://example.test/a.py"))
+
+    assert headers == {"If-None-Match": '"v1"', "If-Modified-Since": "Mon, 01 Jan 2024 00:00:00 GMT"}
+
+
+def test_eviction_drops_least_recently_used_bodies(tmp_path):
+    fetch_cache = FetchCache(cache_dir=tmp_path / "fetch-cache", ttl=60, max_size=20)
+    fetch_cache.put("http://example.test/a", b"a" * 8)
+    time.sleep(0.01)
+    fetch_cache.put("http://example.test/b", b"b" * 8)
+    time.sleep(0.01)
+    # Reading "a" makes "b" the least recently used body
+    assert fetch_cache.get("http://example.test/a") == b"a" * 8
+    time.sleep(0.01)
+
+    fetch_cache.put("http://example.test/c", b"c" * 8)
+
+    assert fetch_cache.lookup("http://example.test/b") is None
+    assert fetch_cache.get("http://example.test/a") == b"a" * 8
+    assert fetch_cache.get("http://example.test/c") == b"c" * 8
+    assert fetch_cache.total_size() <= 20
+
+
+def test_clear_removes_everything(fetch_cache):
+    fetch_cache.put("http://example.test/a", b"a")
+    fetch_cache.clear()
+
+    assert fetch_cache.total_size() == 0
+    assert fetch_cache.lookup("http://example.test/a") is None
+
+
+def test_branch_memo_round_trip(fetch_cache):
+    fetch_cache.set_branch("https://github.com/o/r", "main")
+    assert fetch_cache.get_branch("https://github.com/o/r") == "main"
+
+    fetch_cache.set_branch("https://github.com/o/r", None)
+    assert fetch_cache.get_branch("https://github.com/o/r") is None
+
+
+def test_unusable_cache_is_disabled_once_per_process(tmp_path, monkeypatch):
+    not_a_dir = tmp_path / "file"
+    not_a_dir.write_text("x")
+    monkeypatch.setenv("ZEN_CACHE_DIR", str(not_a_dir))
+    attempts = []
+    init = FetchCache.__init__
+
+    def counting_init(self, *args, **kwargs):
+        attempts.append(1)
+        init(self, *args, **kwargs)
+
+    monkeypatch.setattr(FetchCache, "__init__", counting_init)
+
+    assert [get_fetch_cache() for _ in range(3)] == [None, None, None]
+    assert len(attempts) == 1
+    assert cache_module._fetch_cache_broken
+
+
+def test_no_cache_env_disables_the_cache(monkeypatch):
+    monkeypatch.setenv("ZEN_NO_CACHE", "1")
+
+    assert get_fetch_cache() is None
@@ -0,0 +1,206 @@
+"""Tests for ComponentInstaller: incremental reinstalls, removal and updates."""
+
+import hashlib
+import os
+
+import pytest
+
+from zen.core.installer import ComponentInstaller
+from zen.core.lockfile import load_lockfile
+from zen.schemas.component import load_component_from_url
+
+MTIME = 1_700_000_000
+
+
+def sha256(text: str) -> str:
+    return hashlib.sha256(text.encode()).hexdigest()
+
+
+def empty_report() -> dict:
+    return {"written": [], "unchanged": [], "conflicting": [], "hashes": {}}
+
+
+@pytest.fixture
+def installer(project):
+    return ComponentInstaller(str(project))
+
+
+@pytest.fixture
+def component_url(http_server, monkeypatch):
+    # Revalidate every fetch so upstream changes are seen right away
+    monkeypatch.setenv("ZEN_CACHE_TTL", "0")
+    return http_server.write_component("widget", {
+        "name": "widget", "version": "1.0.0", "description": "d",
+        "files": [
+            {"name": "a.py", "path": "src/widget/a.py", "url": "a.py"},
+            {"name": "b.py", "path": "src/widget/b.py", "url": "b.py"},
+        ],
+    }, {"a.py": "A = 1\n", "b.py": "B = 1\n"}, MTIME)
+
+
+class TestShouldWrite:
+    def test_missing_file_is_written(self, installer, project):
+        report = empty_report()
+
+        assert installer._should_write(project / "a.py", sha256("a"), {}, False, report)
+        assert report["hashes"] == {"a.py": sha256("a")}
+
+    def test_identical_file_is_unchanged(self, installer, project):
+        (project / "a.py").write_text("a")
+        report = empty_report()
+
+        assert not installer._should_write(project / "a.py", sha256("a"), {}, False, report)
+        assert report["unchanged"] == [str(project / "a.py")]
+
+    def test_file_still_as_installed_is_replaced(self, installer, project):
+        (project / "a.py").write_text("v1")
+        report = empty_report()
+
+        assert installer._should_write(project / "a.py", sha256("v2"), {"a.py": sha256("v1")}, False, report)
+        assert report["hashes"] == {"a.py": sha256("v2")}
+
+    def test_locally_modified_file_conflicts(self, installer, project):
+        (project / "a.py").write_text("edited")
+        report = empty_report()
+
+        assert not installer._should_write(project / "a.py", sha256("v2"), {"a.py": sha256("v1")}, False, report)
+        assert report["conflicting"] == [str(project / "a.py")]
+        # The hash of what zen installed is kept
+        assert report["hashes"] == {"a.py": sha256("v1")}
+
+    def test_unrecorded_file_conflicts(self, installer, project):
+        (project / "a.py").write_text("mine")
+        report = empty_report()
+
+        assert not installer._should_write(project / "a.py", sha256("v2"), {}, False, report)
+        assert report["conflicting"] == [str(project / "a.py")]
+        assert report["hashes"] == {}
+
+    def test_overwrite_replaces_modified_file(self, installer, project):
+        (project / "a.py").write_text("edited")
+        report = empty_report()
+
+        assert installer._should_write(project / "a.py", sha256("v2"), {"a.py": sha256("v1")}, True, report)
+        assert report["hashes"] == {"a.py": sha256("v2")}
+
+
+def test_reinstall_leaves_unchanged_files_alone(installer, project, component_url):
+    installer.install_from_url(component_url)
+    a = project / "src" / "widget" / "a.py"
+    os.utime(a, (MTIME, MTIME))
+
+    result = ComponentInstaller(str(project)).install_from_url(component_url)
+
+    assert result["files_installed"] == 0
+    assert result["files_unchanged"] == 2
+    assert a.stat().st_mtime == MTIME
+
+
+def test_reinstall_replaces_files_changed_upstream(installer, project, http_server, component_url):
+    installer.install_from_url(component_url)
+    b = project / "src" / "widget" / "b.py"
+    os.utime(b, (MTIME, MTIME))
+    http_server.write("widget/a.py", "A = 2\n", MTIME + 60)
+
+    result = ComponentInstaller(str(project)).install_from_url(component_url)
+
+    assert result["files_installed"] == 1
+    assert (project / "src" / "widget" / "a.py").read_text() == "A = 2\n"
+    assert b.stat().st_mtime == MTIME
+
+
+def test_reinstall_keeps_local_edits_unless_overwriting(installer, project, http_server, component_url):
+    installer.install_from_url(component_url)
+    a = project / "src" / "widget" / "a.py"
+    a.write_text("A = 'mine'\n")
+    http_server.write("widget/a.py", "A = 2\n", MTIME + 60)
+
+    result = ComponentInstaller(str(project)).install_from_url(component_url)
+    assert result["files_conflicting"] == 1
+    assert a.read_text() == "A = 'mine'\n"
+
+    ComponentInstaller(str(project)).install_from_url(component_url, overwrite=True)
+    assert a.read_text() == "A = 2\n"
+
+
+class TestRemove:
+    @pytest.fixture
+    def installed(self, installer, project, http_server):
+        urls = [
+            http_server.write_component(name, {
+                "name": name, "version": "1.0.0", "description": "d", "dependencies": ["click", f"{name}-lib"],
+                "files": [{"name": f"{name}.py", "path": f"src/{name}/{name}.py", "content": f"{name} = 1\n"}],
+            }, {})
+            for name in ("first", "second")
+        ]
+        for url in urls:
+            ComponentInstaller(str(project)).install_from_url(url)
+        return project
+
+    def test_files_and_own_requirements_are_removed(self, installed):
+        result = ComponentInstaller(str(installed)).remove_components(["first"])[0]
+
+        assert result["files_removed"] == 1
+        assert result["dependencies_removed"] == 1
+        assert not (installed / "src" / "first").exists()
+        assert (installed / "src" / "second" / "second.py").exists()
+
+    def test_shared_requirements_stay_until_the_last_user_goes(self, installed):
+        ComponentInstaller(str(installed)).remove_components(["first"])
+        assert (installed / "requirements.txt").read_text().splitlines() == ["click", "second-lib"]
+
+        ComponentInstaller(str(installed)).remove_components(["second"])
+        assert (installed / "requirements.txt").read_text().strip() == ""
+
+    def test_locally_modified_files_are_kept(self, installed):
+        (installed / "src" / "first" / "first.py").write_text("edited\n")
+
+        result = ComponentInstaller(str(installed)).remove_components(["first"])[0]
+
+        assert result["files_modified"] == [str(installed / "src" / "first" / "first.py")]
+        assert (installed / "src" / "first" / "first.py").read_text() == "edited\n"
+
+
+class TestUpdate:
+    SHA = "1111111111111111111111111111111111111111"
+    NEW_SHA = "2222222222222222222222222222222222222222"
+    URL = "https://raw.githubusercontent.com/owner/repo/main/widget/component.json"
+
+    def publish(self, server, commit, version, files, mtime=MTIME):
+        """Serve the component on the branch and at `commit`, which the branch now points to."""
+        server.commits[("owner", "repo", "main")] = commit
+        component = {
+            "name": "widget", "version": version, "description": "d",
+            "files": [{"name": name, "path": f"src/widget/{name}", "url": name} for name in sorted(files)],
+        }
+        for ref in ("main", commit):
+            server.write_component(f"owner/repo/{ref}/widget", component, files, mtime)
+
+    def test_only_changed_files_are_downloaded(self, installer, project, github):
+        files = {"a.py": "A = 1\n", "b.py": "B = 1\n", "c.py": "C = 1\n"}
+        self.publish(github, self.SHA, "1.0.0", files)
+        installer.install_component(load_component_from_url(self.URL, fetch_files=False), self.URL)
+        self.publish(github, self.NEW_SHA, "1.1.0", {**files, "a.py": "A = 2\n"})
+        github.write(f"owner/repo/{self.NEW_SHA}/widget/a.py", "A = 2\n", MTIME + 60)
+
+        result = ComponentInstaller(str(project)).update_components()[0]
+
+        assert result["previous_version"] == "1.0.0"
+        assert result["files_installed"] == 1
+        assert result["files_unchanged"] == 2
+        assert (project / "src" / "widget" / "a.py").read_text() == "A = 2\n"
+        assert github.fetched(f"{self.NEW_SHA}/widget/a.py") == [200]
+        assert github.fetched(f"{self.NEW_SHA}/widget/b.py") == [304]
+        assert github.fetched(f"{self.NEW_SHA}/widget/c.py") == [304]
+        assert load_lockfile(project)["components"]["widget"]["commit"] == self.NEW_SHA
+
+    def test_files_dropped_upstream_are_removed(self, installer, project, github):
+        self.publish(github, self.SHA, "1.0.0", {"a.py": "A = 1\n", "b.py": "B = 1\n"})
+        installer.install_component(load_component_from_url(self.URL, fetch_files=False), self.URL)
+        self.publish(github, self.NEW_SHA, "2.0.0", {"a.py": "A = 1\n"}, MTIME + 60)
+
+        result = ComponentInstaller(str(project)).update_components(["widget"])[0]
+
+        assert result["files_removed"] == 1
+        assert not (project / "src" / "widget" / "b.py").exists()
+        assert (project / "src" / "widget" / "a.py").exists()
@@ -0,0 +1,161 @@
+"""Tests for zen.lock: commit pinning, frozen installs and reinstalls."""
+
+import json
+
+import pytest
+from click.testing import CliRunner
+
+from zen.cli.main import cli
+from zen.core import lockfile
+from zen.core.exceptions import ConfigurationError, InstallationError
+from zen.core.installer import ComponentInstaller
+from zen.core.lockfile import (CommitResolver, github_raw_ref, load_lockfile, parse_lockfile, pin_url,
+                               resolve_github_commit)
+from zen.schemas.component import load_component_from_url
+
+SHA = "0123456789abcdef0123456789abcdef01234567"
+OTHER_SHA = "89abcdef0123456789abcdef0123456789abcdef"
+RAW = "https://raw.githubusercontent.com"
+
+
+@pytest.fixture
+def component_url(http_server):
+    return http_server.write_component("widget", {
+        "name": "widget", "version": "1.0.0", "description": "d", "dependencies": ["click"],
+        "files": [
+            {"name": "a.py", "path": "src/widget/a.py", "url": "a.py"},
+            {"name": "b.py", "path": "src/widget/b.py", "content": "B = 1\n"},
+        ],
+    }, {"a.py": "A = 1\n"})
+
+
+def test_github_raw_ref():
+    assert github_raw_ref(f"{RAW}/owner/repo/main/src/a.py") == ("owner", "repo", "main")
+    assert github_raw_ref(f"{RAW}/owner/repo") is None
+    assert github_raw_ref("https://example.com/owner/repo/main/a.py") is None
+
+
+def test_pin_url_replaces_the_ref():
+    assert pin_url(f"{RAW}/owner/repo/main/src/a.py", SHA) == f"{RAW}/owner/repo/{SHA}/src/a.py"
+
+
+def test_parse_lockfile():
+    assert parse_lockfile(None) == {"version": 1, "components": {}}
+    with pytest.raises(ConfigurationError):
+        parse_lockfile("{not json")
+    with pytest.raises(ConfigurationError):
+        parse_lockfile(json.dumps({"version": 99}))
+
+
+class TestResolveGithubCommit:
+    def test_each_ref_is_asked_for_once(self, github):
+        github.commits[("owner", "repo", "main")] = SHA
+
+        assert resolve_github_commit("owner", "repo", "main") == SHA
+        assert resolve_github_commit("owner", "repo", "main") == SHA
+        assert github.fetched("/commits/main") == [200]
+
+    def test_answers_are_kept_in_the_fetch_cache(self, github, monkeypatch):
+        github.commits[("owner", "repo", "main")] = SHA
+        resolve_github_commit("owner", "repo", "main")
+        # A new process: only the fetch cache remembers
+        monkeypatch.setattr(lockfile, "_commits", {})
+
+        assert resolve_github_commit("owner", "repo", "main") == SHA
+        assert github.fetched("/commits/main") == [200]
+
+    def test_commit_shas_are_not_resolved(self, github):
+        assert resolve_github_commit("owner", "repo", SHA.upper()) == SHA
+        assert github.requests == []
+
+    def test_token_is_sent_when_set(self, github, monkeypatch):
+        monkeypatch.setenv("GITHUB_TOKEN", "secret")
+        github.commits[("owner", "repo", "main")] = SHA
+
+        resolve_github_commit("owner", "repo", "main")
+
+        assert github.api_headers[0]["Authorization"] == "Bearer secret"
+
+    def test_rate_limit_stops_further_calls(self, github):
+        github.rate_limit()
+        github.commits[("owner", "other", "main")] = SHA
+        resolver = CommitResolver()
+
+        assert resolver.pin(f"{RAW}/owner/repo/main/a.py") == f"{RAW}/owner/repo/main/a.py"
+        resolver.resolve([f"{RAW}/owner/other/main/a.py", f"{RAW}/owner/third/dev/a.py"])
+
+        assert github.requests == [("/repos/owner/repo/commits/main", 403)]
+        assert resolver.pin(f"{RAW}/owner/other/main/a.py") == f"{RAW}/owner/other/main/a.py"
+
+    def test_unknown_ref_is_left_unpinned(self, github):
+        resolver = CommitResolver()
+
+        assert resolver.pin(f"{RAW}/owner/repo/nope/a.py") == f"{RAW}/owner/repo/nope/a.py"
+        assert resolver.pin(f"{RAW}/owner/repo/nope/b.py") == f"{RAW}/owner/repo/nope/b.py"
+        assert github.fetched("/commits/nope") == [404]
+
+
+def test_install_pins_github_files_to_their_commit(project, github):
+    github.commits[("owner", "repo", "main")] = SHA
+    github.write("owner/repo/main/widget/component.json", json.dumps({
+        "name": "widget", "version": "1.0.0", "description": "d",
+        "files": [{"name": "a.py", "path": "src/widget/a.py", "url": "a.py"}],
+    }))
+    github.write(f"owner/repo/{SHA}/widget/a.py", "A = 1\n")
+    url = f"{RAW}/owner/repo/main/widget/component.json"
+
+    ComponentInstaller(str(project)).install_component(load_component_from_url(url, fetch_files=False), url)
+
+    entry = load_lockfile(project)["components"]["widget"]
+    assert entry["commit"] == SHA
+    assert entry["files"]["src/widget/a.py"]["url"] == f"{RAW}/owner/repo/{SHA}/widget/a.py"
+    assert (project / "src" / "widget" / "a.py").read_text() == "A = 1\n"
+    assert github.fetched(f"/{SHA}/widget/a.py") == [200]
+
+
+def test_frozen_install_is_served_from_the_cache(project, http_server, component_url):
+    ComponentInstaller(str(project)).install_from_url(component_url)
+    (project / "src" / "widget" / "a.py").unlink()
+    (project / "src" / "widget" / "b.py").unlink()
+    requests_before = len(http_server.requests)
+
+    results = ComponentInstaller(str(project)).install_from_lock()
+
+    assert results[0]["files_installed"] == 2
+    assert (project / "src" / "widget" / "a.py").read_text() == "A = 1\n"
+    assert (project / "src" / "widget" / "b.py").read_text() == "B = 1\n"
+    assert len(http_server.requests) == requests_before
+
+
+def test_frozen_install_refuses_a_hash_mismatch(project, http_server, component_url, monkeypatch):
+    ComponentInstaller(str(project)).install_from_url(component_url)
+    (project / "src" / "widget" / "a.py").unlink()
+    http_server.write("widget/a.py", "A = 'tampered'\n")
+    # Nothing cached: the locked URL has to be downloaded again
+    monkeypatch.setenv("ZEN_NO_CACHE", "1")
+    monkeypatch.setattr("zen.core.cache._fetch_cache", None)
+
+    with pytest.raises(InstallationError, match="Hash mismatch"):
+        ComponentInstaller(str(project)).install_from_lock()
+
+    assert not (project / "src" / "widget" / "a.py").exists()
+
+
+def test_reinstall_keeps_the_recorded_custom_path(project, http_server, component_url):
+    runner = CliRunner()
+    result = runner.invoke(cli, ["add", component_url, "--path", "lib/custom", "--yes"])
+    assert result.exit_code == 0, result.output
+    custom = project / "lib" / "custom"
+    assert (custom / "a.py").read_text() == "A = 1\n"
+    assert load_lockfile(project)["components"]["widget"]["path"] == "lib/custom"
+
+    (custom / "a.py").unlink()
+    result = runner.invoke(cli, ["install"])
+    assert result.exit_code == 0, result.output
+    assert (custom / "a.py").read_text() == "A = 1\n"
+
+    (custom / "b.py").unlink()
+    result = runner.invoke(cli, ["install", "--frozen"])
+    assert result.exit_code == 0, result.output
+    assert (custom / "b.py").read_text() == "B = 1\n"
+    assert not (project / "src").exists()
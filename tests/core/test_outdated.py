@@ -0,0 +1,82 @@
+"""Tests for `zen outdated` version checks."""
+
+import threading
+
+from zen.core.cache import _revalidate, revalidating
+from zen.core.outdated import check_versions, compare_versions
+
+MTIME = 1_700_000_000
+
+
+def publish(server, name, version, mtime=MTIME):
+    return server.write_component(name, {
+        "name": name, "version": version, "description": "d",
+        "files": [{"name": "a.py", "path": "src/a.py", "url": "a.py"}],
+    }, {"a.py": "A = 1\n"}, mtime)
+
+
+def test_compare_versions():
+    assert compare_versions("1.0.0", "1.2.0") < 0
+    assert compare_versions("1.10.0", "1.9.0") > 0
+    assert compare_versions("1.0.0", "1.0") == 0
+    assert compare_versions("nightly", "nightly") == 0
+    assert compare_versions("nightly", "1.0.0") < 0
+
+
+def test_statuses(http_server):
+    components = {
+        "old": {"version": "1.0.0", "source": publish(http_server, "old", "1.1.0")},
+        "same": {"version": "2.0.0", "source": publish(http_server, "same", "2.0.0")},
+        "newer": {"version": "3.1.0", "source": publish(http_server, "newer", "3.0.0")},
+        "gone": {"version": "1.0.0", "source": f"{http_server.url}/gone/component.json"},
+        "local": {"version": "1.0.0"},
+    }
+
+    checks = {check.name: check for check in check_versions(components)}
+
+    assert {name: check.status for name, check in checks.items()} == {
+        "gone": "error", "local": "error", "newer": "ahead", "old": "outdated", "same": "up-to-date",
+    }
+    assert checks["old"].latest == "1.1.0"
+    assert checks["local"].error == "no source recorded"
+    # Definitions only: no file body is fetched
+    assert http_server.fetched("/a.py") == []
+
+
+def test_checks_revalidate_cached_definitions(http_server):
+    source = publish(http_server, "widget", "1.0.0")
+    check_versions({"widget": {"version": "1.0.0", "source": source}})
+
+    # Within the TTL, but a check must still see upstream changes
+    publish(http_server, "widget", "1.1.0", MTIME + 60)
+    check = check_versions({"widget": {"version": "1.0.0", "source": source}})[0]
+
+    assert check.latest == "1.1.0"
+
+
+def test_check_of_an_unchanged_definition_costs_a_304(http_server):
+    source = publish(http_server, "widget", "1.0.0")
+    check_versions({"widget": {"version": "1.0.0", "source": source}})
+    check_versions({"widget": {"version": "1.0.0", "source": source}})
+
+    assert http_server.fetched("/widget/component.json") == [200, 304]
+
+
+def test_overlapping_revalidating_blocks_across_threads():
+    entered, release = threading.Event(), threading.Event()
+
+    def other():
+        with revalidating():
+            entered.set()
+            release.wait()
+
+    thread = threading.Thread(target=other)
+    with revalidating():
+        thread.start()
+        entered.wait()
+    # The other thread's block is still open
+    assert _revalidate()
+    release.set()
+    thread.join()
+
+    assert not _revalidate()
@@ -0,0 +1,92 @@
+"""Tests for requirements.txt parsing and indexing."""
+
+from zen.core.installer import ComponentInstaller
+from zen.core.requirements import RequirementsIndex, canonicalize_name, parse_requirement
+
+
+def test_names_are_pep_503_normalized():
+    assert canonicalize_name("Foo_Bar.baz") == "foo-bar-baz"
+    assert canonicalize_name("foo--bar") == "foo-bar"
+
+
+def test_parse_requirement_fields():
+    requirement = parse_requirement("Requests[Socks, security] >=2.0 ; python_version < '3.9'  # pinned")
+
+    assert requirement.name == "requests"
+    assert requirement.extras == ("security", "socks")
+    assert requirement.specifier == ">=2.0"
+    assert requirement.marker == "python_version < '3.9'"
+
+
+def test_blank_comment_and_option_lines_are_skipped():
+    for line in ("", "   ", "# comment", "--index-url https://example.com", "-e ."):
+        assert parse_requirement(line) is None
+
+
+def test_url_requirements_are_named_by_their_egg():
+    requirement = parse_requirement("git+https://github.com/o/r.git#egg=My_Pkg")
+
+    assert requirement.name == "my-pkg"
+    assert parse_requirement("https://example.com/archive.zip") is None
+
+
+def test_same_project_under_another_spelling_is_present(tmp_path):
+    path = tmp_path / "requirements.txt"
+    path.write_text("Django_Rest.Framework>=3\n")
+    index = RequirementsIndex.load(path)
+
+    assert "django-rest-framework" in index
+    assert "DJANGO_REST_FRAMEWORK==3.14" in index
+
+
+def test_markers_distinguish_requirements(tmp_path):
+    path = tmp_path / "requirements.txt"
+    path.write_text("numpy; python_version < '3.9'\n")
+    index = RequirementsIndex.load(path)
+
+    assert "numpy ;python_version <  '3.9'" in index
+    assert "numpy" not in index
+    assert index.add("numpy")
+    assert len(index) == 2
+
+
+def test_includes_are_followed_once(tmp_path):
+    (tmp_path / "requirements.txt").write_text("-r base.txt\nclick\n")
+    (tmp_path / "base.txt").write_text("--requirement=requirements.txt\nrequests\n")
+
+    index = RequirementsIndex.load(tmp_path / "requirements.txt")
+
+    assert "requests" in index
+    assert "click" in index
+    assert len(index) == 2
+
+
+def test_add_reports_only_new_requirements(tmp_path):
+    index = RequirementsIndex.load(tmp_path / "missing.txt")
+
+    assert index.add("rich>=13")
+    assert not index.add("Rich")
+    assert not index.add("# just a comment")
+
+
+def test_read_text_overrides_the_top_level_file(tmp_path):
+    path = tmp_path / "requirements.txt"
+    path.write_text("on-disk\n")
+
+    index = RequirementsIndex.load(path, read_text=lambda p: "staged\n")
+
+    assert "staged" in index
+    assert "on-disk" not in index
+
+
+def test_install_only_appends_missing_requirements(project, http_server):
+    (project / "requirements.txt").write_text("Requests\n")
+    url = http_server.write_component("widget", {
+        "name": "widget", "version": "1.0.0", "description": "d", "dependencies": ["requests>=2", "click"],
+        "files": [{"name": "a.py", "path": "src/a.py", "content": "A = 1\n"}],
+    }, {})
+
+    result = ComponentInstaller(str(project)).install_from_url(url)
+
+    assert result["dependencies_added"] == 1
+    assert (project / "requirements.txt").read_text().splitlines() == ["Requests", "click"]
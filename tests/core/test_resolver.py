@@ -0,0 +1,95 @@
+"""Tests for registry dependency resolution."""
+
+import pytest
+
+from zen.core.exceptions import DependencyConflictError
+from zen.core.resolver import (DependencyGraph, _topological_order, resolve_dependency_graph,
+                               resolve_dependency_reference)
+
+
+def publish(server, name, deps=(), directory=None):
+    return server.write_component(directory or name, {
+        "name": name, "version": "1.0.0", "description": "d",
+        "registry_dependencies": list(deps),
+        "files": [{"name": f"{name}.py", "path": f"src/{name}.py", "content": "x = 1\n"}],
+    }, {})
+
+
+def test_dependencies_come_first():
+    edges = {"app": ["auth", "db"], "auth": ["db"], "db": []}
+
+    assert _topological_order(["app", "auth", "db"], edges) == ["db", "auth", "app"]
+
+
+def test_independent_nodes_keep_discovery_order():
+    assert _topological_order(["a", "b", "c"], {}) == ["a", "b", "c"]
+
+
+def test_cycle_is_reported_with_its_path():
+    edges = {"a": ["b"], "b": ["c"], "c": ["a"], "d": []}
+
+    with pytest.raises(DependencyConflictError) as exc:
+        _topological_order(["a", "b", "c", "d"], edges, labels={"a": "alpha"})
+
+    assert "alpha -> b -> c -> alpha" in str(exc.value)
+
+
+def test_critical_path_follows_the_slowest_chain():
+    graph = DependencyGraph(
+        order=["leaf", "slow", "fast", "root"],
+        components={},
+        edges={"root": ["slow", "fast"], "slow": ["leaf"], "fast": [], "leaf": []},
+        fetch_times={"root": 1.0, "slow": 2.0, "fast": 2.5, "leaf": 1.0},
+    )
+
+    assert graph.critical_path() == (["root", "slow", "leaf"], 4.0)
+
+
+def test_critical_path_of_an_empty_graph():
+    assert DependencyGraph(order=[], components={}, edges={}).critical_path() == ([], 0.0)
+
+
+def test_relative_references_resolve_against_the_dependent():
+    base = "https://example.com/registry/app/component.json"
+
+    assert resolve_dependency_reference("../auth", base) == "https://example.com/registry/auth/component.json"
+    assert resolve_dependency_reference("../db/db.json", base) == "https://example.com/registry/db/db.json"
+    assert resolve_dependency_reference("https://other.test/x.json", base) == "https://other.test/x.json"
+    assert resolve_dependency_reference("../auth", "file:///r/app/component.json") == "file:///r/auth/component.json"
+
+
+def test_graph_is_fetched_and_ordered(http_server):
+    app = publish(http_server, "app", ["../auth", "../db"])
+    publish(http_server, "auth", ["../db"])
+    db = publish(http_server, "db")
+
+    graph = resolve_dependency_graph([app])
+
+    assert [c.name for c, _ in graph.ordered()] == ["db", "auth", "app"]
+    # Reached through two dependents, fetched once
+    assert http_server.fetched("/db/component.json") == [200]
+    assert graph.edges[app][1] == db
+
+
+def test_remote_cycle_is_refused(http_server):
+    a = publish(http_server, "a", ["../b"])
+    publish(http_server, "b", ["../a"])
+
+    with pytest.raises(DependencyConflictError, match="a -> b -> a"):
+        resolve_dependency_graph([a])
+
+
+def test_two_sources_for_one_name_are_refused(http_server):
+    app = publish(http_server, "app", ["../one", "../two"])
+    publish(http_server, "db", directory="one")
+    publish(http_server, "db", directory="two")
+
+    with pytest.raises(DependencyConflictError, match="provided by both"):
+        resolve_dependency_graph([app])
+
+
+def test_unreachable_dependency_fails_resolution(http_server):
+    app = publish(http_server, "app", ["../missing"])
+
+    with pytest.raises(ValueError, match="missing"):
+        resolve_dependency_graph([app])
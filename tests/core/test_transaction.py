@@ -0,0 +1,136 @@
+"""Tests for transactional installs and their rollback."""
+
+import json
+import os
+
+import pytest
+
+from zen.core.exceptions import InstallationError
+from zen.core import transaction as transaction_module
+from zen.core.installer import ComponentInstaller
+from zen.core.transaction import STAGING_DIR, InstallTransaction, recover_transactions
+from zen.schemas.component import load_component_from_url
+
+
+def test_commit_moves_staged_files_into_place(tmp_path):
+    (tmp_path / "old.py").write_text("old")
+
+    with InstallTransaction(tmp_path) as transaction:
+        transaction.write_text(tmp_path / "pkg" / "new.py", "new")
+        transaction.write_text(tmp_path / "old.py", "replaced")
+        transaction.remove(tmp_path / "gone.py")
+        # Nothing outside the staging area changes before the commit
+        assert not (tmp_path / "pkg").exists()
+        assert (tmp_path / "old.py").read_text() == "old"
+
+    assert (tmp_path / "pkg" / "new.py").read_text() == "new"
+    assert (tmp_path / "old.py").read_text() == "replaced"
+    assert not (tmp_path / STAGING_DIR).exists()
+
+
+def test_exception_rolls_back_everything(tmp_path):
+    (tmp_path / "old.py").write_text("old")
+
+    with pytest.raises(RuntimeError):
+        with InstallTransaction(tmp_path) as transaction:
+            transaction.write_text(tmp_path / "pkg" / "new.py", "new")
+            transaction.write_text(tmp_path / "old.py", "replaced")
+            raise RuntimeError("boom")
+
+    assert not (tmp_path / "pkg").exists()
+    assert (tmp_path / "old.py").read_text() == "old"
+    assert not (tmp_path / ".zen").exists()
+
+
+def test_failed_move_restores_files_already_committed(tmp_path, monkeypatch):
+    (tmp_path / "a.py").write_text("old a")
+    (tmp_path / "b.py").write_text("old b")
+    transaction = InstallTransaction(tmp_path)
+    transaction.write_text(tmp_path / "a.py", "new a")
+    transaction.write_text(tmp_path / "b.py", "new b")
+    moves = []
+    real_move = transaction_module._move
+
+    def failing_move(source, target):
+        moves.append(target)
+        if len(moves) == 2:
+            raise OSError("disk full")
+        real_move(source, target)
+
+    monkeypatch.setattr(transaction_module, "_move", failing_move)
+    with pytest.raises(OSError):
+        transaction.commit()
+
+    assert (tmp_path / "a.py").read_text() == "old a"
+    assert (tmp_path / "b.py").read_text() == "old b"
+
+
+def test_unstage_never_reuses_a_staging_file(tmp_path):
+    transaction = InstallTransaction(tmp_path)
+    first = transaction.stage(tmp_path / "a.py")
+    first.write_text("a")
+    transaction.unstage(tmp_path / "a.py")
+
+    second = transaction.stage(tmp_path / "b.py")
+    assert second != first
+    transaction.rollback()
+
+
+def test_recovery_undoes_an_interrupted_commit(tmp_path):
+    (tmp_path / "a.py").write_text("original")
+    # Leftovers of a crashed process: a.py was moved aside and replaced
+    crashed = tmp_path / STAGING_DIR / "tx-999999-crashed"
+    (crashed / "backup").mkdir(parents=True)
+    (crashed / "files").mkdir()
+    backup = crashed / "backup" / "00000-a.py"
+    os.replace(tmp_path / "a.py", backup)
+    (tmp_path / "a.py").write_text("half-installed")
+    (tmp_path / "b.py").write_text("new")
+    journal = {"state": "committing", "entries": [
+        {"target": str(tmp_path / "a.py"), "staged": str(crashed / "files" / "00000-a.py"),
+         "backup": str(backup), "existed": True},
+        {"target": str(tmp_path / "b.py"), "staged": str(crashed / "files" / "00001-b.py"),
+         "backup": str(crashed / "backup" / "00001-b.py"), "existed": False},
+    ]}
+    (crashed / "journal.json").write_text(json.dumps(journal))
+
+    assert recover_transactions(tmp_path) == 1
+
+    assert (tmp_path / "a.py").read_text() == "original"
+    assert not (tmp_path / "b.py").exists()
+    assert not crashed.exists()
+
+
+def test_recovery_leaves_live_transactions_alone(tmp_path):
+    transaction = InstallTransaction(tmp_path)
+
+    assert recover_transactions(tmp_path) == 0
+    assert transaction.path.exists()
+    transaction.rollback()
+
+
+def test_install_rolls_back_after_a_mid_install_404(project, http_server):
+    (project / "requirements.txt").write_text("requests\n")
+    good = http_server.write_component("good", {
+        "name": "good", "version": "1.0.0", "description": "d", "dependencies": ["click"],
+        "files": [{"name": "good.py", "path": "src/good.py", "url": "good.py"}],
+    }, {"good.py": "GOOD = 1\n"})
+    broken = http_server.write_component("broken", {
+        "name": "broken", "version": "1.0.0", "description": "d",
+        "files": [
+            {"name": "one.py", "path": "src/broken/one.py", "url": "one.py"},
+            {"name": "two.py", "path": "src/broken/two.py", "url": "two.py"},
+        ],
+    }, {"one.py": "ONE = 1\n"})
+    config = (project / ".zen" / "config.yaml").read_text()
+    components = [(load_component_from_url(url, fetch_files=False), url) for url in (good, broken)]
+
+    with pytest.raises(InstallationError):
+        ComponentInstaller(str(project)).install_components(components)
+
+    assert 404 in http_server.fetched("/broken/two.py")
+    assert not (project / "src").exists()
+    assert (project / "requirements.txt").read_text() == "requests\n"
+    assert (project / ".zen" / "config.yaml").read_text() == config
+    assert not (project / "zen.lock").exists()
+    assert not (project / STAGING_DIR).exists()
@@ -0,0 +1,68 @@
+"""Tests for conditional revalidation of remote component fetches."""
+
+from zen.core.cache import get_fetch_cache
+from zen.schemas.component import _fetch_remote, download_file, fetch_file_bytes
+
+MTIME = 1_700_000_000
+
+
+def test_fresh_cache_entry_is_served_without_a_request(http_server):
+    http_server.write("a.py", "print('a')\n", MTIME)
+    url = f"{http_server.url}/a.py"
+
+    assert fetch_file_bytes(url) == b"print('a')\n"
+    assert fetch_file_bytes(url) == b"print('a')\n"
+
+    assert http_server.fetched("/a.py") == [200]
+
+
+def test_expired_entry_is_revalidated_with_a_conditional_get(http_server, monkeypatch):
+    monkeypatch.setenv("ZEN_CACHE_TTL", "0")
+    http_server.write("a.py", "print('a')\n", MTIME)
+    url = f"{http_server.url}/a.py"
+
+    assert fetch_file_bytes(url) == b"print('a')\n"
+    assert fetch_file_bytes(url) == b"print('a')\n"
+
+    assert http_server.fetched("/a.py") == [200, 304]
+
+
+def test_changed_body_replaces_the_cached_one(http_server, monkeypatch):
+    monkeypatch.setenv("ZEN_CACHE_TTL", "0")
+    http_server.write("a.py", "old\n", MTIME)
+    url = f"{http_server.url}/a.py"
+    assert fetch_file_bytes(url) == b"old\n"
+
+    http_server.write("a.py", "new\n", MTIME + 60)
+
+    assert fetch_file_bytes(url) == b"new\n"
+    assert http_server.fetched("/a.py") == [200, 200]
+    assert get_fetch_cache().get(url) is None  # TTL 0: present, but never fresh
+    assert get_fetch_cache().lookup(url) is not None
+
+
+def test_304_streams_the_cached_body_to_dest(http_server, tmp_path, monkeypatch):
+    monkeypatch.setenv("ZEN_CACHE_TTL", "0")
+    http_server.write("data.bin", bytes(range(256)), MTIME)
+    url = f"{http_server.url}/data.bin"
+    download_file(url, tmp_path / "first.bin")
+
+    size = download_file(url, tmp_path / "second.bin")
+
+    assert size == 256
+    assert (tmp_path / "second.bin").read_bytes() == bytes(range(256))
+    assert http_server.fetched("/data.bin") == [200, 304]
+
+
+def test_body_evicted_after_lookup_is_fetched_again(http_server, tmp_path):
+    http_server.write("a.py", "print('a')\n", MTIME)
+    url = f"{http_server.url}/a.py"
+    fetch_file_bytes(url)
+    fetch_cache = get_fetch_cache()
+    # Another process removed the body but the index row is still there
+    fetch_cache.object_file(fetch_cache.lookup(url).sha256).unlink()
+
+    _fetch_remote(url, dest=tmp_path / "a.py")
+
+    assert (tmp_path / "a.py").read_bytes() == b"print('a')\n"
+    assert http_server.fetched("/a.py") == [200, 200]
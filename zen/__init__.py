@@ -6,9 +6,14 @@ __version__ = "1.1.1"
 __author__ = "TheRaj71"
 __description__ = "A component registry for discovering, installing, and managing reusable code components"
 
-# Core imports
-from zen.core.exceptions import InstallationError, ConfigurationError
-from zen.schemas.component import ComponentSchema, load_component_from_json, load_component_from_url
+# Core imports, resolved lazily so `import zen` (and CLI start-up) stays cheap
+_LAZY_IMPORTS = {
+    "InstallationError": "zen.core.exceptions",
+    "ConfigurationError": "zen.core.exceptions",
+    "ComponentSchema": "zen.schemas.component",
+    "load_component_from_json": "zen.schemas.component",
+    "load_component_from_url": "zen.schemas.component",
+}
 
 __all__ = [
     "InstallationError",
@@ -17,3 +22,12 @@ __all__ = [
     "load_component_from_json",
     "load_component_from_url"
 ]
+
+
+def __getattr__(name):
+    if name in _LAZY_IMPORTS:
+        import importlib
+        value = getattr(importlib.import_module(_LAZY_IMPORTS[name]), name)
+        globals()[name] = value
+        return value
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -6,26 +6,43 @@ zen CLI - A component registry for discovering, installing, and managing reusabl
 import click
 import sys
 from pathlib import Path
-from zen.core.logger import get_logger, setup_logging
-from zen.core.installer import ComponentInstaller
 from zen.core.exceptions import (
     InstallationError, 
     ConfigurationError
 )
 
-logger = get_logger()
+
+class _LazyLogger:
+    """Stand-in for the global logger that defers importing rich until first use.
+    
+    Keeps start-up cheap for commands like `zen --version` that never log.
+    """
+    
+    def __getattr__(self, name):
+        from zen.core.logger import get_logger
+        return getattr(get_logger(), name)
+
+
+logger = _LazyLogger()
 
 @click.group()
 @click.version_option(version="1.0.0", prog_name="zen")
 @click.option("--verbose", "-v", is_flag=True, help="Enable verbose logging")
-def cli(verbose):
+@click.option("--offline", is_flag=True, help="Never touch the network; use ZEN_MIRROR and the fetch cache only")
+def cli(verbose, offline):
     """zen - A component registry for discovering, installing, and managing reusable code components
     
     Inspired by shadcn/ui, zen helps you build projects by installing individual components
     rather than full project templates. Each component is self-contained and can be
     easily integrated into your existing codebase.
     """
-    setup_logging(verbose=verbose)
+    if verbose:
+        # INFO is already the default level, so only load the logger when needed
+        from zen.core.logger import setup_logging
+        setup_logging(verbose=True)
+    if offline:
+        from zen.core.mirror import set_offline_mode
+        set_offline_mode(True)
 
 @cli.command()
 @click.option("--force", "-f", is_flag=True, help="Overwrite existing configuration")
@@ -65,24 +82,39 @@ def init(force):
         sys.exit(1)
 
 @cli.command()
-@click.argument("component_url")
+@click.argument("component_urls", nargs=-1)
+@click.option("--file", "-r", "url_file", type=click.Path(exists=True, dir_okay=False),
+              help="Read component URLs from a file (one per line)")
 @click.option("--path", "-p", help="Custom installation path")
 @click.option("--overwrite", "-o", is_flag=True, help="Overwrite existing files")
 @click.option("--dry-run", "-d", is_flag=True, help="Show what would be done without doing it")
 @click.option("--yes", "-y", is_flag=True, help="Skip confirmation prompts")
-def add(component_url, path, overwrite, dry_run, yes):
-    """Install a reusable component from a URL into your project
+@click.option("--archive", is_flag=True, help="Fetch GitHub tree components from a single repository tarball")
+def add(component_urls, url_file, path, overwrite, dry_run, yes, archive):
+    """Install reusable components from URLs into your project
     
-    Downloads and installs a component along with its dependencies. Components are
+    Downloads and installs components along with their dependencies. Components are
     self-contained pieces of code that can be easily integrated into your project.
+    Several components can be installed at once; they are fetched concurrently and
+    requirements.txt and the project config are updated once at the end. Components
+    listed in registry_dependencies are resolved and installed first.
     
     Examples:
       zen add https://github.com/user/repo/component.json
       zen add https://github.com/user/components/tree/main/email-validator
       zen add https://raw.githubusercontent.com/user/repo/main/component.json
       zen add file:///path/to/component.json
+      zen add --archive https://github.com/user/components/tree/main/email-validator
+      zen add URL1 URL2 URL3
+      zen add -r components.txt
     """
     try:
+        urls = [*component_urls, *(_read_url_file(url_file) if url_file else [])]
+        if not urls:
+            logger.error("No component URLs given.")
+            logger.info("Usage: zen add <component-url>... or zen add -r components.txt")
+            sys.exit(1)
+        
         # Check if we're in a zen project, if not, offer to initialize
         config_path = Path(".zen/config.yaml")
         if not config_path.exists():
@@ -98,26 +130,39 @@ def add(component_url, path, overwrite, dry_run, yes):
                 logger.info("Run 'zen init' or use --yes to auto-initialize.")
                 sys.exit(1)
         
+        from zen.core.installer import ComponentInstaller
         installer = ComponentInstaller()
         
-        # Fetch component with elegant connecting lines animation
+        # Fetch component definitions (and their registry dependencies) only;
+        # their files are streamed to disk on install
         try:
-            from zen.schemas.component import load_component_from_url
+            from zen.core.resolver import resolve_dependency_graph
             
-            with logger.connection_loader(f"Fetching component from {component_url}"):
-                component = load_component_from_url(component_url)
+            message = f"Fetching component from {urls[0]}" if len(urls) == 1 else f"Fetching {len(urls)} components"
+            with logger.download_progress(message):
+                graph = resolve_dependency_graph(urls, archive=archive or None, fetch_files=False)
+            components = [component for component, _ in graph.ordered()]
+            
+            logger.info(f"Resolved {len(components)} components in {graph.elapsed:.2f}s")
+            if len(components) > len(set(urls)):
+                critical_path, critical_time = graph.critical_path()
+                logger.info(
+                    f"Critical path ({critical_time:.2f}s): "
+                    + " → ".join(f"{graph.components[url].name} ({graph.fetch_times[url]:.2f}s)" for url in critical_path)
+                )
             
             # Show beautiful component info
-            install_path = path or installer._get_default_path(component.category)
-            logger.show_component_info(
-                component.name, 
-                component.version, 
-                component.description,
-                component.category,
-                component.dependencies,
-                len(component.files)
-            )
-            logger.info(f"[cyan]📍 Install to:[/cyan] {install_path}")
+            for component in components:
+                install_path = path or installer._get_default_path(component.category)
+                logger.show_component_info(
+                    component.name, 
+                    component.version, 
+                    component.description,
+                    component.category,
+                    component.dependencies,
+                    len(component.files)
+                )
+                logger.info(f"[cyan]📍 Install to:[/cyan] {install_path}")
             
         except Exception as e:
             logger.error(f"Failed to fetch component: {e}")
@@ -127,34 +172,61 @@ def add(component_url, path, overwrite, dry_run, yes):
             logger.info("")
             logger.info("🔍 DRY RUN - No changes will be made")
             logger.info("Files that would be installed:")
-            for file_info in component.files:
-                target_path = path or file_info.path
-                logger.info(f"  • {file_info.name} -> {target_path}")
+            for component in components:
+                for file_info in component.files:
+                    target_path = path or file_info.path
+                    logger.info(f"  • {file_info.name} -> {target_path}")
             return
         
         # Confirmation prompt (unless --yes)
         if not yes:
             logger.info("")
-            if not click.confirm("Proceed with installation?"):
+            prompt = "Proceed with installation?" if len(components) == 1 else f"Install {len(components)} components?"
+            if not click.confirm(prompt):
                 logger.info("Installation cancelled.")
                 return
         
         logger.info("")
         
-        # Install component with beautiful wave animation
-        with logger.wave_loader("Installing component files and dependencies"):
-            result = installer.install_from_url(component_url, path, overwrite)
+        # Install the already-fetched components, showing per-file download progress
+        with logger.download_progress("Installing component files and dependencies"):
+            results = installer.install_components(graph.ordered(), path, overwrite)
         
-        # Show matrix transition effect before success
-        logger.show_matrix_transition(f"Component {result['component']} installed successfully!", 2.0)
+        if len(results) == 1:
+            result = results[0]
+            
+            # Show matrix transition effect, then the summary once it has finished
+            logger.show_matrix_transition(
+                f"Component {result['component']} installed successfully!", 2.0,
+                then=lambda: logger.show_success_summary(
+                    result['component'],
+                    result['files_installed'], 
+                    result['dependencies_added'],
+                    result['install_path'],
+                    files_unchanged=result['files_unchanged'],
+                    files_conflicting=result['files_conflicting']
+                ),
+            )
+        else:
+            logger.show_matrix_transition(
+                f"{len(results)} components installed successfully!", 2.0,
+                then=lambda: logger.show_success_summary(
+                    ", ".join(result['component'] for result in results),
+                    sum(result['files_installed'] for result in results),
+                    sum(result['dependencies_added'] for result in results),
+                    path or "component defaults",
+                    files_unchanged=sum(result['files_unchanged'] for result in results),
+                    files_conflicting=sum(result['files_conflicting'] for result in results)
+                ),
+            )
         
-        # Show beautiful success summary
-        logger.show_success_summary(
-            result['component'],
-            result['files_installed'], 
-            result['dependencies_added'],
-            result['install_path']
+        from zen.core.http import get_session_manager
+        http_stats = get_session_manager().stats()
+        logger.debug(
+            f"HTTP: {http_stats['requests']} requests over {http_stats['connections_opened']} connections "
+            f"({http_stats['connections_reused']} reused), {http_stats['bytes_received']} bytes received"
         )
+        logger.debug(f"UI: {logger.ui_time * 1000:.0f} ms spent blocked on effects")
         
     except (InstallationError, ConfigurationError) as e:
         logger.error(str(e))
@@ -165,6 +237,77 @@ def add(component_url, path, overwrite, dry_run, yes):
 
 
 
+@cli.command()
+@click.option("--frozen", is_flag=True, help="Install exactly what zen.lock pins, verifying every file hash")
+@click.option("--overwrite", "-o", is_flag=True, help="Overwrite existing files")
+def install(frozen, overwrite):
+    """Install every component recorded for this project
+    
+    Without --frozen, components are re-resolved from the sources recorded in
+    .zen/config.yaml and zen.lock is refreshed. With --frozen, nothing is
+    resolved: files are taken from the fetch cache where possible, only
+    missing ones are downloaded from their locked URLs, and any hash mismatch
+    aborts the install without touching the project.
+    
+    Examples:
+      zen install
+      zen install --frozen
+      zen --offline install --frozen
+    """
+    try:
+        config_path = Path(".zen/config.yaml")
+        if not config_path.exists():
+            if not frozen:
+                logger.error("Not in a zen project. Run 'zen init' first.")
+                sys.exit(1)
+            _initialize_zen_config()
+        
+        from zen.core.installer import ComponentInstaller
+        installer = ComponentInstaller()
+        
+        if frozen:
+            with logger.download_progress("Installing from zen.lock"):
+                results = installer.install_from_lock(overwrite=overwrite)
+        else:
+            from zen.core.project import get_project_state
+            records = [info for info in get_project_state().components.values() if info.get("source")]
+            if not records:
+                logger.info("No components installed.")
+                return
+            
+            from zen.schemas.component import load_components_from_urls
+            sources = [info["source"] for info in records]
+            with logger.download_progress(f"Resolving {len(sources)} components"):
+                components = load_components_from_urls(sources, fetch_files=False)
+            # Components added with --path are installed there again
+            groups = {}
+            for component, info in zip(components, records):
+                groups.setdefault(info.get("path"), []).append((component, info["source"]))
+            with logger.download_progress("Installing component files and dependencies"):
+                results = installer.install_component_groups(groups, overwrite)
+        
+        logger.show_success_summary(
+            ", ".join(result['component'] for result in results),
+            sum(result['files_installed'] for result in results),
+            sum(result['dependencies_added'] for result in results),
+            "zen.lock" if frozen else "component defaults",
+            files_unchanged=sum(result['files_unchanged'] for result in results),
+            files_conflicting=sum(result['files_conflicting'] for result in results)
+        )
+        
+        from zen.core.http import get_session_manager
+        http_stats = get_session_manager().stats()
+        logger.debug(
+            f"HTTP: {http_stats['requests']} requests, {http_stats['bytes_received']} bytes received"
+        )
+        
+    except (InstallationError, ConfigurationError) as e:
+        logger.error(str(e))
+        sys.exit(1)
+    except Exception as e:
+        logger.error(f"Unexpected error: {e}")
+        sys.exit(1)
+
 @cli.command()
 def list():
     """List all components installed in the current project
@@ -178,32 +321,38 @@ def list():
             logger.error("Not in a zen project. Run 'zen init' first.")
             sys.exit(1)
         
-        import yaml
-        with open(config_path, 'r') as f:
-            config = yaml.safe_load(f) or {}
-        
-        components = config.get("components", {})
+        import sqlite3
+        from zen.core.project import get_project_state
+        state = get_project_state()
+        try:
+            count = len(state.index)
+            # Rows come straight from the index, without loading full component records
+            rows = state.index.rows()
+        except (sqlite3.Error, OSError) as e:
+            # The index is disposable (e.g. read-only checkout): read the config instead
+            logger.debug(f"Component index unavailable, reading the config: {e}")
+            components = {key: c for key, c in state.components.items() if isinstance(c, dict)}
+            count = len(components)
+            rows = (
+                (str(c.get('name', key)), c.get('version'), c.get('category'), c.get('source'))
+                for key, c in components.items()
+            )
         
-        if not components:
+        if not count:
             logger.info("No components installed.")
             return
         
         # Show components in a beautiful table
         from rich.table import Table
         
-        table = Table(title=f"📦 Installed Components ({len(components)})", show_header=True, header_style="bold cyan")
+        table = Table(title=f"📦 Installed Components ({count})", show_header=True, header_style="bold cyan")
         table.add_column("Name", style="green", no_wrap=True)
         table.add_column("Version", style="blue")
         table.add_column("Category", style="yellow")
         table.add_column("Source", style="dim", overflow="ellipsis", max_width=50)
         
-        for comp_name, comp_info in components.items():
-            name = comp_info.get("name", comp_name)
-            version = comp_info.get("version", "unknown")
-            category = comp_info.get("category", "unknown")
-            source = comp_info.get("source", "unknown")
-            
-            table.add_row(name, version, category, source)
+        for name, version, category, source in rows:
+            table.add_row(name, version or "unknown", category or "unknown", source or "unknown")
         
         logger.console.print(table)
             
@@ -225,19 +374,21 @@ def info(component_name):
             logger.error("Not in a zen project. Run 'zen init' first.")
             sys.exit(1)
         
-        import yaml
-        with open(config_path, 'r') as f:
-            config = yaml.safe_load(f) or {}
-        
-        components = config.get("components", {})
+        import sqlite3
+        from zen.core.project import get_project_state
+        state = get_project_state()
+        try:
+            comp_info = state.index.lookup(component_name)
+        except (sqlite3.Error, OSError) as e:
+            # The index is disposable (e.g. read-only checkout): read the config instead
+            logger.debug(f"Component index unavailable, reading the config: {e}")
+            comp_info = state.get_component(component_name)
         
-        if component_name not in components:
+        if comp_info is None:
             logger.error(f"Component '{component_name}' not found.")
             logger.info("Run 'zen list' to see installed components.")
             sys.exit(1)
         
-        comp_info = components[component_name]
-        
         logger.info(f"📦 Component: {comp_info.get('name', component_name)}")
         logger.info(f"Version: {comp_info.get('version', 'unknown')}")
         logger.info(f"Category: {comp_info.get('category', 'unknown')}")
@@ -251,6 +402,137 @@ def info(component_name):
         logger.error(f"Failed to show component info: {e}")
         sys.exit(1)
 
+@cli.command()
+@click.option("--all", "-a", "show_all", is_flag=True, help="Also show components that are up to date")
+def outdated(show_all):
+    """Show installed components that have newer versions upstream
+    
+    Fetches only the component.json of every installed component, concurrently.
+    Cached definitions are revalidated with the server, so unchanged components
+    cost a single 304 response each.
+    
+    Examples:
+      zen outdated
+      zen outdated --all
+    """
+    try:
+        config_path = Path(".zen/config.yaml")
+        if not config_path.exists():
+            logger.error("Not in a zen project. Run 'zen init' first.")
+            sys.exit(1)
+        
+        from zen.core.project import get_project_state
+        components = get_project_state().components
+        if not components:
+            logger.info("No components installed.")
+            return
+        
+        import time
+        from zen.core.outdated import check_versions
+        started = time.perf_counter()
+        with logger.download_progress(f"Checking {len(components)} components"):
+            checks = check_versions(components)
+        logger.debug(f"Checked {len(checks)} components in {time.perf_counter() - started:.2f}s")
+        
+        outdated_checks = [check for check in checks if check.outdated]
+        failed = [check for check in checks if check.status == "error"]
+        shown = checks if show_all else [*outdated_checks, *failed]
+        
+        if shown:
+            from rich.table import Table
+            
+            table = Table(title=f"📦 Outdated Components ({len(outdated_checks)})", show_header=True, header_style="bold cyan")
+            table.add_column("Name", style="green", no_wrap=True)
+            table.add_column("Installed", style="blue")
+            table.add_column("Latest", style="blue")
+            table.add_column("Status")
+            
+            styles = {"outdated": "yellow", "up-to-date": "green", "ahead": "cyan", "error": "red"}
+            for check in shown:
+                table.add_row(check.name, check.installed, check.latest or "-",
+                              f"[{styles[check.status]}]{check.status}[/{styles[check.status]}]")
+            logger.console.print(table)
+        
+        for check in failed:
+            logger.warning(f"Could not check {check.name}: {check.error}")
+        if outdated_checks:
+            logger.info("Run 'zen update' to upgrade them.")
+        elif not failed:
+            logger.success("All components are up to date")
+        
+    except Exception as e:
+        logger.error(f"Failed to check for updates: {e}")
+        sys.exit(1)
+
+@cli.command()
+@click.argument("component_names", nargs=-1)
+@click.option("--overwrite", "-o", is_flag=True, help="Replace files modified since they were installed")
+def update(component_names, overwrite):
+    """Update installed components, downloading only files that changed
+    
+    Compares every file of the upstream version with the installed copy by
+    hash. Files with a declared sha256 that already match are not fetched at
+    all, and cached files are revalidated with the server, so unchanged files
+    cost at most a 304. Changes to all components are applied in one step.
+    
+    Examples:
+      zen update
+      zen update jwt-auth email-validator
+    """
+    try:
+        config_path = Path(".zen/config.yaml")
+        if not config_path.exists():
+            logger.error("Not in a zen project. Run 'zen init' first.")
+            sys.exit(1)
+        
+        from zen.core.http import get_session_manager
+        from zen.core.installer import ComponentInstaller
+        session = get_session_manager()
+        received = session.stats()["bytes_received"]
+        
+        with logger.download_progress("Updating components"):
+            results = ComponentInstaller().update_components([*component_names] or None, overwrite)
+        transferred = session.stats()["bytes_received"] - received
+        
+        if not results:
+            logger.info("Nothing to update.")
+            return
+        
+        from rich.filesize import decimal
+        from rich.table import Table
+        
+        table = Table(title=f"📦 Updated Components ({len(results)})", show_header=True, header_style="bold cyan")
+        table.add_column("Name", style="green", no_wrap=True)
+        table.add_column("Version", style="blue")
+        table.add_column("Changed", justify="right")
+        table.add_column("Unchanged", justify="right", style="dim")
+        table.add_column("Removed", justify="right")
+        table.add_column("Conflicting", justify="right", style="yellow")
+        
+        for result in results:
+            version = result["version"]
+            if result["previous_version"] != version:
+                version = f"{result['previous_version']} → {version}"
+            table.add_row(result["component"], version, str(result["files_installed"]),
+                          str(result["files_unchanged"]), str(result["files_removed"]),
+                          str(result["files_conflicting"]))
+        logger.console.print(table)
+        
+        total = sum(result["bytes_total"] for result in results)
+        share = f" ({transferred / total:.0%})" if total else ""
+        logger.info(f"Transferred {decimal(transferred)} of {decimal(total)}{share}")
+        if any(result["files_conflicting"] for result in results):
+            logger.info("💡 Modified files were kept; use --overwrite to replace them")
+        if any(result["dependencies_added"] for result in results):
+            logger.info("💡 Run 'pip install -r requirements.txt' to install new dependencies")
+        
+    except (InstallationError, ConfigurationError) as e:
+        logger.error(str(e))
+        sys.exit(1)
+    except Exception as e:
+        logger.error(f"Failed to update components: {e}")
+        sys.exit(1)
+
 @cli.command()
 @click.option("--show", is_flag=True, help="Show current animation settings")
 @click.option("--disable-all", is_flag=True, help="Disable all animations")
@@ -353,14 +635,19 @@ def animations(show, disable_all, enable_all, minimal, demo, reset):
         sys.exit(1)
 
 @cli.command()
-@click.argument("component_name")
+@click.argument("component_names", nargs=-1, required=True)
 @click.option("--force", "-f", is_flag=True, help="Force removal without confirmation")
-def remove(component_name, force):
-    """Remove a component from the project registry
+def remove(component_names, force):
+    """Remove components and the files they installed
+    
+    Deletes the files recorded when each component was installed, except files
+    you have modified since, and prunes directories left empty. Lines added to
+    requirements.txt are dropped unless another installed component still needs
+    them. The project config and zen.lock are updated in the same step.
     
-    Removes the component from the zen configuration. Note that this does not
-    automatically delete the component files - you may need to manually clean
-    up files and dependencies.
+    Examples:
+      zen remove jwt-auth
+      zen remove jwt-auth email-validator --force
     """
     try:
         config_path = Path(".zen/config.yaml")
@@ -368,37 +655,38 @@ def remove(component_name, force):
             logger.error("Not in a zen project. Run 'zen init' first.")
             sys.exit(1)
         
-        import yaml
-        with open(config_path, 'r') as f:
-            config = yaml.safe_load(f) or {}
-        
-        components = config.get("components", {})
+        from zen.core.project import get_project_state
+        components = get_project_state().components
         
-        if component_name not in components:
-            logger.error(f"Component '{component_name}' not found.")
+        missing = [name for name in component_names if name not in components]
+        if missing:
+            logger.error(f"Component '{missing[0]}' not found.")
             sys.exit(1)
         
-        comp_info = components[component_name]
-        
         if not force:
-            logger.info(f"This will remove component: {comp_info.get('name', component_name)}")
-            logger.warning("Note: Files will not be automatically deleted.")
-            logger.warning("You may need to manually remove files and clean up dependencies.")
+            names = ", ".join(components[name].get("name", name) for name in component_names)
+            logger.info(f"This will remove: {names}")
+            logger.info("Installed files you have not modified will be deleted.")
             
             if not click.confirm("Continue?"):
                 logger.info("Removal cancelled.")
                 return
         
-        # Remove from config
-        del components[component_name]
-        config["components"] = components
+        from zen.core.installer import ComponentInstaller
+        results = ComponentInstaller().remove_components(component_names)
         
-        with open(config_path, 'w') as f:
-            yaml.dump(config, f, default_flow_style=False, indent=2)
-        
-        logger.celebrate(f"Component {component_name} removed successfully!")
-        logger.info("💡 Consider manually removing files and cleaning up dependencies.")
+        logger.celebrate(f"Removed {', '.join(result['component'] for result in results)}")
+        logger.info(f"🗑️  Files deleted: {sum(result['files_removed'] for result in results)}")
+        logger.info(f"📦 Requirements removed: {sum(result['dependencies_removed'] for result in results)}")
+        kept = [path for result in results for path in result["files_modified"]]
+        if kept:
+            logger.warning(f"Kept {len(kept)} modified files:")
+            for path in kept:
+                logger.warning(f"  {path}")
         
+    except InstallationError as e:
+        logger.error(str(e))
+        sys.exit(1)
     except Exception as e:
         logger.error(f"Failed to remove component: {e}")
         sys.exit(1)
@@ -409,9 +697,66 @@ def remove(component_name, force):
 
 
 
+@cli.command()
+@click.argument("component_urls", nargs=-1)
+@click.option("--file", "-r", "url_file", type=click.Path(exists=True, dir_okay=False),
+              help="Read component URLs from a file (one per line)")
+@click.option("--dest", "-d", envvar="ZEN_MIRROR", default="zen-mirror", show_default=True,
+              help="Mirror directory (defaults to ZEN_MIRROR when set)")
+def mirror(component_urls, url_file, dest):
+    """Pre-populate a local mirror for offline installs
+    
+    Fetches each component and writes its component.json and every file it
+    references into DEST. Point ZEN_MIRROR at that directory (optionally with
+    --offline) to install those components without any network access.
+    
+    Examples:
+      zen mirror https://github.com/user/components/tree/main/email-validator
+      zen mirror -r components.txt --dest /srv/zen-mirror
+    """
+    try:
+        from zen.core.mirror import Mirror, recording
+        from zen.schemas.component import load_component_from_url
+        
+        urls = [*component_urls, *(_read_url_file(url_file) if url_file else [])]
+        if not urls:
+            logger.error("No component URLs given.")
+            sys.exit(1)
+        
+        target = Mirror(Path(dest))
+        failed = 0
+        with recording(target):
+            for url in urls:
+                try:
+                    with logger.connection_loader(f"Mirroring {url}"):
+                        component = load_component_from_url(url)
+                    logger.success(f"Mirrored {component.name} v{component.version} ({len(component.files)} files)")
+                except Exception as e:
+                    failed += 1
+                    logger.error(f"Failed to mirror {url}: {e}")
+        
+        logger.info(f"Mirror: {target.root}")
+        logger.info(f"💡 Install offline with: ZEN_MIRROR={target.root} zen --offline add <component-url>")
+        if failed:
+            sys.exit(1)
+        
+    except Exception as e:
+        logger.error(f"Failed to build mirror: {e}")
+        sys.exit(1)
+
+def _read_url_file(url_file: str):
+    """Read component URLs from a file, skipping blank lines and comments."""
+    urls = []
+    with open(url_file, "r", encoding="utf-8") as f:
+        for line in f:
+            line = line.split("#", 1)[0].strip()
+            if line:
+                urls.append(line)
+    return urls
+
 def _initialize_zen_config():
     """Initialize zen component registry configuration"""
-    import yaml
+    from zen.core.project import get_project_state
     
     # Create .zen directory
     zen_dir = Path(".zen")
@@ -426,8 +771,7 @@ def _initialize_zen_config():
     }
     
     config_path = zen_dir / "config.yaml"
-    with open(config_path, "w") as f:
-        yaml.dump(config, f, default_flow_style=False, indent=2)
+    get_project_state().replace(config)
     
     logger.info(f"Created zen configuration: {config_path}")
     
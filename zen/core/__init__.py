@@ -2,12 +2,34 @@
 Core functionality for zen.
 """
 
-from zen.core.exceptions import InstallationError, ConfigurationError
-from zen.core.logger import get_logger, setup_logging
+# Resolved lazily: the logger pulls in rich and the fetch layer pulls in requests
+_LAZY_IMPORTS = {
+    "InstallationError": "zen.core.exceptions",
+    "ConfigurationError": "zen.core.exceptions",
+    "get_logger": "zen.core.logger",
+    "setup_logging": "zen.core.logger",
+    "get_session_manager": "zen.core.http",
+    "configure_session_manager": "zen.core.http",
+    "FetchCache": "zen.core.cache",
+    "get_fetch_cache": "zen.core.cache",
+}
 
 __all__ = [
     "InstallationError",
     "ConfigurationError", 
     "get_logger",
-    "setup_logging"
+    "setup_logging",
+    "get_session_manager",
+    "configure_session_manager",
+    "FetchCache",
+    "get_fetch_cache"
 ]
+
+
+def __getattr__(name):
+    if name in _LAZY_IMPORTS:
+        import importlib
+        value = getattr(importlib.import_module(_LAZY_IMPORTS[name]), name)
+        globals()[name] = value
+        return value
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
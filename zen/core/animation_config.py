@@ -28,6 +28,7 @@ class AnimationConfig:
     wave_speed: float = 0.125
     pulse_speed: float = 0.167
     typewriter_speed: float = 0.05
+    max_fps: float = 12.0  # Frame-rate cap of the shared render loop
     
     # Animation sizes
     connection_width: int = 30
@@ -0,0 +1,100 @@
+"""
+Whole-repository archive fetching for GitHub component sources.
+
+Instead of one raw request per component file, the codeload tarball for the
+referenced branch is downloaded once and streamed through ``tarfile``; only the
+members below the component directory are kept in memory.
+"""
+
+import os
+import posixpath
+import tarfile
+from dataclasses import dataclass
+from typing import Dict, Optional
+from urllib.parse import urlparse
+
+from zen.core.http import get_session_manager
+
+DEFAULT_ARCHIVE_BASE_URL = "https://codeload.github.com"
+
+
+@dataclass
+class GitHubTreeRef:
+    """A parsed ``github.com/<user>/<repo>/tree/<ref>/<dir>`` URL."""
+
+    owner: str
+    repo: str
+    ref: str
+    directory: str = ""
+
+
+def parse_github_tree_url(url: str) -> Optional[GitHubTreeRef]:
+    """Parse a GitHub tree URL, returning None for anything else."""
+    parsed = urlparse(url)
+    if parsed.netloc.lower() != "github.com":
+        return None
+    parts = [p for p in parsed.path.split("/") if p]
+    if len(parts) < 4 or parts[2] != "tree":
+        return None
+    return GitHubTreeRef(owner=parts[0], repo=parts[1], ref=parts[3], directory="/".join(parts[4:]))
+
+
+def archive_mode_enabled(archive: Optional[bool] = None) -> bool:
+    """Resolve an explicit archive flag, falling back to ZEN_GITHUB_ARCHIVE."""
+    if archive is not None:
+        return archive
+    return os.environ.get("ZEN_GITHUB_ARCHIVE", "").lower() in ("1", "true", "yes")
+
+
+def archive_url(ref: GitHubTreeRef) -> str:
+    """Codeload tarball URL for a ref; the host can be overridden via ZEN_GITHUB_ARCHIVE_URL."""
+    base = os.environ.get("ZEN_GITHUB_ARCHIVE_URL", DEFAULT_ARCHIVE_BASE_URL).rstrip("/")
+    return f"{base}/{ref.owner}/{ref.repo}/tar.gz/{ref.ref}"
+
+
+def fetch_github_archive(ref: GitHubTreeRef, timeout: int = 60) -> Dict[str, bytes]:
+    """
+    Download a ref's tarball and return the files below ``ref.directory``.
+
+    The archive is streamed straight from the response, so it is never held in
+    memory as a whole.
+
+    Returns:
+        Mapping of paths relative to ``ref.directory`` to file bytes
+
+    Raises:
+        requests.RequestException or tarfile.TarError when the archive is unavailable
+    """
+    resp = get_session_manager().get(archive_url(ref), timeout=timeout, stream=True)
+    try:
+        resp.raise_for_status()
+        resp.raw.decode_content = True
+        prefix = ref.directory.strip("/")
+        members: Dict[str, bytes] = {}
+        with tarfile.open(fileobj=resp.raw, mode="r|gz") as tar:
+            for member in tar:
+                if not member.isfile():
+                    continue
+                # Drop the "<repo>-<ref>/" top-level directory codeload adds
+                _, _, path = member.name.partition("/")
+                if prefix:
+                    if not path.startswith(prefix + "/"):
+                        continue
+                    path = path[len(prefix) + 1:]
+                extracted = tar.extractfile(member)
+                if extracted is not None:
+                    members[path] = extracted.read()
+        return members
+    finally:
+        resp.close()
+
+
+def archive_member_path(url: str) -> Optional[str]:
+    """Map a relative ComponentFile url to an archive member path, if it stays inside the directory."""
+    parsed = urlparse(url)
+    if parsed.scheme or parsed.netloc or url.startswith("/"):
+        return None
+    path = posixpath.normpath(url)
+    if path == "." or path.startswith("../") or path == "..":
+        return None
+    return path
@@ -0,0 +1,404 @@
+"""
+Persistent fetch cache for zen.
+
+File bodies are stored content-addressed under ``~/.zen/cache/objects`` (keyed
+by their SHA-256), and a small SQLite index maps each fetched URL to the hash of
+its body together with the time it was fetched and the response's ``ETag`` /
+``Last-Modified`` validators, so expired entries can be revalidated cheaply.
+The index also remembers which branch each GitHub repository resolved to and,
+for the TTL, which commit each GitHub ref pointed at. SQLite provides the locking
+needed for several ``zen`` processes sharing one cache, object files are
+written atomically, and the total size is capped with LRU eviction.
+"""
+
+import hashlib
+import os
+import shutil
+import sqlite3
+import tempfile
+import threading
+import time
+from contextlib import contextmanager
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Dict, Optional
+
+# Default cap on the total size of cached bodies (bytes)
+DEFAULT_CACHE_MAX_SIZE = 256 * 1024 * 1024
+# Bump when the index layout changes; older indexes are rebuilt from scratch
+SCHEMA_VERSION = 4
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS objects (
+    sha256 TEXT PRIMARY KEY,
+    size INTEGER NOT NULL,
+    last_access REAL NOT NULL
+);
+CREATE TABLE IF NOT EXISTS urls (
+    url TEXT PRIMARY KEY,
+    sha256 TEXT NOT NULL,
+    fetched_at REAL NOT NULL,
+    etag TEXT,
+    last_modified TEXT
+);
+CREATE TABLE IF NOT EXISTS branches (
+    repo TEXT PRIMARY KEY,
+    branch TEXT NOT NULL,
+    resolved_at REAL NOT NULL
+);
+CREATE TABLE IF NOT EXISTS commits (
+    ref TEXT PRIMARY KEY,
+    sha TEXT NOT NULL,
+    resolved_at REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS objects_last_access ON objects (last_access);
+"""
+
+
+# Number of `revalidating()` blocks currently active, in any thread
+_revalidate_depth = 0
+_revalidate_lock = threading.Lock()
+
+
+@contextmanager
+def revalidating():
+    """
+    Treat every cache entry as expired inside this block.
+
+    Cached bodies are still used, but only after the server confirmed them
+    with a 304, so callers see upstream changes within the TTL without paying
+    for full downloads. Applies to every fetch thread, and blocks may overlap
+    across threads. Offline mode still serves the cache as-is.
+    """
+    global _revalidate_depth
+    with _revalidate_lock:
+        _revalidate_depth += 1
+    try:
+        yield
+    finally:
+        with _revalidate_lock:
+            _revalidate_depth -= 1
+
+
+def _revalidate() -> bool:
+    """Whether a `revalidating()` block is active."""
+    return _revalidate_depth > 0
+
+
+def file_sha256(path: Path) -> str:
+    """Hex SHA-256 of a file's content, read in chunks."""
+    digest = hashlib.sha256()
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(1024 * 1024), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def default_cache_ttl() -> int:
+    """Default TTL in seconds, taken from RegistrySchema.cache_ttl."""
+    # Imported lazily: zen.schemas.component depends on this module
+    from zen.schemas.registry import RegistrySchema
+    return RegistrySchema.model_fields["cache_ttl"].default
+
+
+@dataclass
+class CacheEntry:
+    """A URL's cached body reference."""
+
+    url: str
+    sha256: str
+    fetched_at: float
+    etag: Optional[str] = None
+    last_modified: Optional[str] = None
+
+    def age(self) -> float:
+        """Seconds since the entry was fetched."""
+        return time.time() - self.fetched_at
+
+
+class FetchCache:
+    """Content-addressed on-disk cache of fetched file bodies."""
+
+    def __init__(self, cache_dir: Optional[Path] = None, ttl: Optional[int] = None,
+                 max_size: Optional[int] = None):
+        self.cache_dir = Path(cache_dir) if cache_dir else Path.home() / ".zen" / "cache"
+        self.objects_dir = self.cache_dir / "objects"
+        self.index_path = self.cache_dir / "index.db"
+        self.ttl = default_cache_ttl() if ttl is None else ttl
+        self.max_size = max_size or DEFAULT_CACHE_MAX_SIZE
+        self._local = threading.local()
+
+        self.objects_dir.mkdir(parents=True, exist_ok=True)
+        self._init_schema()
+
+    def _connect(self) -> sqlite3.Connection:
+        """Return this thread's connection to the index."""
+        conn = getattr(self._local, "conn", None)
+        if conn is None:
+            # isolation_level=None lets us issue explicit BEGIN IMMEDIATE
+            conn = sqlite3.connect(str(self.index_path), timeout=30, isolation_level=None)
+            # The index is rebuildable, so trade fsyncs for speed
+            conn.execute("PRAGMA synchronous = OFF")
+            self._local.conn = conn
+        return conn
+
+    def _init_schema(self):
+        """Create the index tables, rebuilding them if the layout is outdated."""
+        conn = self._connect()
+        conn.execute("BEGIN IMMEDIATE")
+        try:
+            version = conn.execute("PRAGMA user_version").fetchone()[0]
+            if version != SCHEMA_VERSION:
+                conn.execute("DROP TABLE IF EXISTS commits")
+                conn.execute("DROP TABLE IF EXISTS branches")
+                conn.execute("DROP TABLE IF EXISTS urls")
+                conn.execute("DROP TABLE IF EXISTS objects")
+            for statement in _SCHEMA.strip().split(";"):
+                if statement.strip():
+                    conn.execute(statement)
+            conn.execute(f"PRAGMA user_version = {SCHEMA_VERSION}")
+            conn.execute("COMMIT")
+        except Exception:
+            conn.execute("ROLLBACK")
+            raise
+
+    def _object_path(self, sha256: str) -> Path:
+        return self.objects_dir / sha256[:2] / sha256
+
+    def lookup(self, url: str) -> Optional[CacheEntry]:
+        """Return the index entry for a URL, fresh or not."""
+        row = self._connect().execute(
+            "SELECT url, sha256, fetched_at, etag, last_modified FROM urls WHERE url = ?", (url,)
+        ).fetchone()
+        return CacheEntry(*row) if row else None
+
+    def is_fresh(self, entry: CacheEntry) -> bool:
+        """Whether an entry is still within the TTL (never inside `revalidating()`)."""
+        return not _revalidate() and self.ttl > 0 and entry.age() < self.ttl
+
+    def read_object(self, sha256: str) -> Optional[bytes]:
+        """Read a cached body by hash, marking it as recently used."""
+        try:
+            data = self._object_path(sha256).read_bytes()
+        except OSError:
+            return None
+        self._connect().execute(
+            "UPDATE objects SET last_access = ? WHERE sha256 = ?", (time.time(), sha256)
+        )
+        return data
+
+    def get(self, url: str) -> Optional[bytes]:
+        """Return the cached body for a URL if it is within the TTL."""
+        entry = self.lookup(url)
+        if entry is None or not self.is_fresh(entry):
+            return None
+        return self.read_object(entry.sha256)
+
+    def conditional_headers(self, entry: CacheEntry) -> Dict[str, str]:
+        """Request headers that revalidate an entry instead of re-downloading it."""
+        headers = {}
+        if entry.etag:
+            headers["If-None-Match"] = entry.etag
+        if entry.last_modified:
+            headers["If-Modified-Since"] = entry.last_modified
+        return headers
+
+    def revalidated(self, url: str, etag: Optional[str] = None, last_modified: Optional[str] = None):
+        """Restart an entry's TTL after the server confirmed it is unchanged (304)."""
+        self._connect().execute(
+            "UPDATE urls SET fetched_at = ?, etag = COALESCE(?, etag), "
+            "last_modified = COALESCE(?, last_modified) WHERE url = ?",
+            (time.time(), etag, last_modified, url),
+        )
+
+    def object_file(self, sha256: str) -> Optional[Path]:
+        """Path of a cached body, marking it as recently used; None if it is gone."""
+        path = self._object_path(sha256)
+        if not path.is_file():
+            return None
+        self._connect().execute(
+            "UPDATE objects SET last_access = ? WHERE sha256 = ?", (time.time(), sha256)
+        )
+        return path
+
+    def put(self, url: str, data: bytes, etag: Optional[str] = None,
+            last_modified: Optional[str] = None) -> str:
+        """Store a body (and its HTTP validators) for a URL and return its content hash."""
+        sha256 = hashlib.sha256(data).hexdigest()
+        path = self._object_path(sha256)
+        if not path.exists():
+            with self._staging_file(path) as f:
+                f.write(data)
+        self._index(url, sha256, len(data), etag, last_modified)
+        return sha256
+
+    def put_file(self, url: str, source: Path, etag: Optional[str] = None,
+                 last_modified: Optional[str] = None) -> str:
+        """Store a body that is already on disk without loading it into memory."""
+        sha256 = file_sha256(source)
+        size = os.path.getsize(source)
+        path = self._object_path(sha256)
+        if not path.exists():
+            with self._staging_file(path) as f, open(source, "rb") as src:
+                shutil.copyfileobj(src, f, 1024 * 1024)
+        self._index(url, sha256, size, etag, last_modified)
+        return sha256
+
+    def link(self, url: str, sha256: str, etag: Optional[str] = None, last_modified: Optional[str] = None):
+        """Point another URL at a body that is already stored (e.g. the same file at a pinned commit)."""
+        conn = self._connect()
+        conn.execute("BEGIN IMMEDIATE")
+        try:
+            if conn.execute("SELECT 1 FROM objects WHERE sha256 = ?", (sha256,)).fetchone() is not None:
+                conn.execute(
+                    "INSERT OR REPLACE INTO urls (url, sha256, fetched_at, etag, last_modified) "
+                    "VALUES (?, ?, ?, ?, ?)",
+                    (url, sha256, time.time(), etag, last_modified),
+                )
+            conn.execute("COMMIT")
+        except Exception:
+            conn.execute("ROLLBACK")
+            raise
+
+    @contextmanager
+    def _staging_file(self, path: Path):
+        """Yield a temp file next to `path` that is renamed onto it on success."""
+        path.parent.mkdir(parents=True, exist_ok=True)
+        # Write to a temp file and rename so readers never see partial bodies
+        fd, tmp = tempfile.mkstemp(dir=str(path.parent), prefix=".tmp-")
+        try:
+            with os.fdopen(fd, "wb") as f:
+                yield f
+            os.replace(tmp, path)
+        except BaseException:
+            if os.path.exists(tmp):
+                os.unlink(tmp)
+            raise
+
+    def _index(self, url: str, sha256: str, size: int, etag: Optional[str], last_modified: Optional[str]):
+        """Record a stored body in the index, then enforce the size cap."""
+        now = time.time()
+        conn = self._connect()
+        conn.execute("BEGIN IMMEDIATE")
+        try:
+            conn.execute(
+                "INSERT OR REPLACE INTO objects (sha256, size, last_access) VALUES (?, ?, ?)",
+                (sha256, size, now),
+            )
+            conn.execute(
+                "INSERT OR REPLACE INTO urls (url, sha256, fetched_at, etag, last_modified) "
+                "VALUES (?, ?, ?, ?, ?)",
+                (url, sha256, now, etag, last_modified),
+            )
+            conn.execute("COMMIT")
+        except Exception:
+            conn.execute("ROLLBACK")
+            raise
+
+        self.evict()
+
+    def get_branch(self, repo: str) -> Optional[str]:
+        """Return the branch a repository's component.json was last found on."""
+        row = self._connect().execute("SELECT branch FROM branches WHERE repo = ?", (repo,)).fetchone()
+        return row[0] if row else None
+
+    def set_branch(self, repo: str, branch: Optional[str]):
+        """Remember (or, with None, forget) the resolved branch of a repository."""
+        conn = self._connect()
+        if branch is None:
+            conn.execute("DELETE FROM branches WHERE repo = ?", (repo,))
+        else:
+            conn.execute(
+                "INSERT OR REPLACE INTO branches (repo, branch, resolved_at) VALUES (?, ?, ?)",
+                (repo, branch, time.time()),
+            )
+
+    def get_commit(self, ref: str) -> Optional[str]:
+        """Return the commit a ref (e.g. ``owner/repo@branch``) resolved to, if within the TTL."""
+        row = self._connect().execute("SELECT sha, resolved_at FROM commits WHERE ref = ?", (ref,)).fetchone()
+        if row is None or _revalidate() or self.ttl <= 0 or time.time() - row[1] >= self.ttl:
+            return None
+        return row[0]
+
+    def set_commit(self, ref: str, sha: str):
+        """Remember the commit a ref resolved to."""
+        self._connect().execute(
+            "INSERT OR REPLACE INTO commits (ref, sha, resolved_at) VALUES (?, ?, ?)",
+            (ref, sha, time.time()),
+        )
+
+    def total_size(self) -> int:
+        """Total size of all cached bodies in bytes."""
+        return self._connect().execute("SELECT COALESCE(SUM(size), 0) FROM objects").fetchone()[0]
+
+    def evict(self, max_size: Optional[int] = None) -> int:
+        """Drop least recently used bodies until the cache fits; return bytes freed."""
+        limit = self.max_size if max_size is None else max_size
+        conn = self._connect()
+        if self.total_size() <= limit:
+            return 0
+
+        freed = 0
+        victims = []
+        conn.execute("BEGIN IMMEDIATE")
+        try:
+            total = self.total_size()
+            for sha256, size in conn.execute("SELECT sha256, size FROM objects ORDER BY last_access ASC").fetchall():
+                if total <= limit:
+                    break
+                conn.execute("DELETE FROM objects WHERE sha256 = ?", (sha256,))
+                conn.execute("DELETE FROM urls WHERE sha256 = ?", (sha256,))
+                victims.append(sha256)
+                total -= size
+                freed += size
+            conn.execute("COMMIT")
+        except Exception:
+            conn.execute("ROLLBACK")
+            raise
+
+        for sha256 in victims:
+            try:
+                self._object_path(sha256).unlink()
+            except OSError:
+                pass
+        return freed
+
+    def clear(self):
+        """Remove every cached body and index entry."""
+        self.evict(max_size=0)
+
+
+# Global fetch cache instance
+_fetch_cache: Optional[FetchCache] = None
+# Set once creating the cache failed, so a broken cache is not retried on every fetch
+_fetch_cache_broken = False
+_fetch_cache_lock = threading.Lock()
+
+
+def _env_int(name: str) -> Optional[int]:
+    try:
+        return int(os.environ[name])
+    except (KeyError, ValueError):
+        return None
+
+
+def get_fetch_cache() -> Optional[FetchCache]:
+    """Get or create the global fetch cache, or None when caching is disabled."""
+    global _fetch_cache, _fetch_cache_broken
+    if os.environ.get("ZEN_NO_CACHE"):
+        return None
+    if _fetch_cache is None and not _fetch_cache_broken:
+        with _fetch_cache_lock:
+            if _fetch_cache is None and not _fetch_cache_broken:
+                cache_dir = os.environ.get("ZEN_CACHE_DIR")
+                try:
+                    _fetch_cache = FetchCache(
+                        cache_dir=Path(cache_dir) if cache_dir else None,
+                        ttl=_env_int("ZEN_CACHE_TTL"),
+                        max_size=_env_int("ZEN_CACHE_MAX_SIZE"),
+                    )
+                except (OSError, sqlite3.Error):
+                    # An unusable cache directory must never break installs;
+                    # it stays disabled for the rest of the process
+                    _fetch_cache_broken = True
+    return _fetch_cache
@@ -0,0 +1,207 @@
+"""
+Pooled HTTP session management for zen.
+
+All network fetches go through a single keep-alive ``requests.Session`` so that
+the files of a component reuse the same TCP+TLS connection instead of opening a
+fresh one per request. Response bodies are read in chunks so byte counts can be
+reported to a transfer listener (e.g. a progress display) while they arrive.
+"""
+
+import io
+import os
+import threading
+from contextlib import contextmanager
+from typing import Any, BinaryIO, Dict, Optional
+
+import requests
+from requests.adapters import HTTPAdapter
+
+# Number of per-host connection pools kept alive at once
+DEFAULT_POOL_CONNECTIONS = 10
+# Maximum number of open connections per host
+DEFAULT_POOL_MAXSIZE = 10
+# Chunk size used when reading response bodies
+READ_CHUNK_SIZE = 64 * 1024
+
+# Listener notified about every body read (see `transfer_listener`)
+_listener: Optional["TransferListener"] = None
+
+
+class TransferListener:
+    """Receives byte-level progress for response bodies read by the SessionManager.
+
+    Methods may be called concurrently from several fetch threads.
+    """
+
+    def started(self, url: str, total: Optional[int]):
+        """A body started downloading; `total` is None when the size is unknown."""
+
+    def advanced(self, url: str, size: int):
+        """`size` more bytes of a body arrived."""
+
+    def finished(self, url: str):
+        """A body was read completely (or the read failed)."""
+
+
+@contextmanager
+def transfer_listener(listener: TransferListener):
+    """Report every body read inside this block to `listener`."""
+    global _listener
+    previous, _listener = _listener, listener
+    try:
+        yield listener
+    finally:
+        _listener = previous
+
+
+def _env_int(name: str, default: int) -> int:
+    """Read a positive integer from the environment, falling back to default."""
+    try:
+        value = int(os.environ.get(name, ""))
+    except ValueError:
+        return default
+    return value if value > 0 else default
+
+
+class SessionManager:
+    """Owns the shared, pooled HTTP session used by every fetch path."""
+
+    def __init__(self, pool_connections: Optional[int] = None, pool_maxsize: Optional[int] = None,
+                 user_agent: Optional[str] = None):
+        self.pool_connections = pool_connections or _env_int("ZEN_HTTP_POOL_CONNECTIONS", DEFAULT_POOL_CONNECTIONS)
+        self.pool_maxsize = pool_maxsize or _env_int("ZEN_HTTP_POOL_SIZE", DEFAULT_POOL_MAXSIZE)
+        self.user_agent = user_agent
+        self._session: Optional[requests.Session] = None
+        self._lock = threading.Lock()
+        self._bytes_received = 0
+
+    @property
+    def session(self) -> requests.Session:
+        """Return the shared session, creating it on first use."""
+        if self._session is None:
+            with self._lock:
+                if self._session is None:
+                    self._session = self._create_session()
+        return self._session
+
+    def _create_session(self) -> requests.Session:
+        """Build a session whose adapters cap open connections per host."""
+        session = requests.Session()
+        # pool_block makes threads wait for a free connection instead of
+        # opening throwaway ones, which enforces the per-host limit.
+        adapter = HTTPAdapter(
+            pool_connections=self.pool_connections,
+            pool_maxsize=self.pool_maxsize,
+            pool_block=True,
+        )
+        session.mount("https://", adapter)
+        session.mount("http://", adapter)
+        if self.user_agent:
+            session.headers["User-Agent"] = self.user_agent
+        return session
+
+    def get(self, url: str, timeout: int = 30, **kwargs: Any) -> requests.Response:
+        """Perform a GET request through the pooled session."""
+        return self.session.get(url, timeout=timeout, **kwargs)
+
+    def read(self, resp: requests.Response, chunk_size: int = READ_CHUNK_SIZE) -> bytes:
+        """Read a response body into memory (see `read_into`)."""
+        buffer = io.BytesIO()
+        self.read_into(resp, buffer, chunk_size=chunk_size)
+        return buffer.getvalue()
+
+    def read_into(self, resp: requests.Response, sink: BinaryIO, chunk_size: int = READ_CHUNK_SIZE) -> int:
+        """
+        Stream a response body into a binary file object, chunk by chunk.
+
+        Progress is reported to the active transfer listener. The response
+        should have been requested with ``stream=True``; it is closed
+        (returning its connection to the pool) once read.
+
+        Returns:
+            Number of bytes written
+        """
+        listener = _listener
+        url = resp.url
+        length = resp.headers.get("Content-Length")
+        total = int(length) if length and length.isdigit() else None
+        if listener is not None:
+            listener.started(url, total)
+
+        written = 0
+        try:
+            for chunk in resp.iter_content(chunk_size=chunk_size):
+                if not chunk:
+                    continue
+                sink.write(chunk)
+                written += len(chunk)
+                with self._lock:
+                    self._bytes_received += len(chunk)
+                if listener is not None:
+                    listener.advanced(url, len(chunk))
+        finally:
+            resp.close()
+            if listener is not None:
+                listener.finished(url)
+        return written
+
+    def stats(self) -> Dict[str, Any]:
+        """Report request and connection reuse counts across all host pools."""
+        requests_made = 0
+        connections_opened = 0
+        if self._session is not None:
+            seen = set()
+            for adapter in self._session.adapters.values():
+                if id(adapter) in seen:
+                    continue
+                seen.add(id(adapter))
+                pools = adapter.poolmanager.pools
+                for key in pools.keys():
+                    pool = pools.get(key)
+                    if pool is None:
+                        continue
+                    requests_made += getattr(pool, "num_requests", 0)
+                    connections_opened += getattr(pool, "num_connections", 0)
+
+        reused = max(requests_made - connections_opened, 0)
+        return {
+            "requests": requests_made,
+            "connections_opened": connections_opened,
+            "connections_reused": reused,
+            "reuse_ratio": (reused / requests_made) if requests_made else 0.0,
+            "bytes_received": self._bytes_received,
+            "pool_maxsize": self.pool_maxsize,
+        }
+
+    def close(self):
+        """Close the session and release all pooled connections."""
+        with self._lock:
+            if self._session is not None:
+                self._session.close()
+                self._session = None
+
+
+# Global session manager instance
+_session_manager: Optional[SessionManager] = None
+_session_manager_lock = threading.Lock()
+
+
+def get_session_manager() -> SessionManager:
+    """Get or create the global session manager."""
+    global _session_manager
+    if _session_manager is None:
+        with _session_manager_lock:
+            if _session_manager is None:
+                _session_manager = SessionManager()
+    return _session_manager
+
+
+def configure_session_manager(pool_connections: Optional[int] = None,
+                              pool_maxsize: Optional[int] = None) -> SessionManager:
+    """Replace the global session manager with one using the given pool sizes."""
+    global _session_manager
+    with _session_manager_lock:
+        if _session_manager is not None:
+            _session_manager.close()
+        _session_manager = SessionManager(pool_connections=pool_connections, pool_maxsize=pool_maxsize)
+    return _session_manager
@@ -2,14 +2,27 @@
 JSON-based component installer for zen.
 """
 
+import hashlib
 import json
 import os
+import shutil
 import requests
+from contextlib import contextmanager
 from pathlib import Path
-from typing import List, Optional
-from zen.schemas.component import ComponentSchema, load_component_from_url, load_component_from_json, fetch_file_content
+from typing import Dict, List, Optional, Tuple
+from zen.schemas.component import (
+    ComponentSchema, load_component_from_url, load_component_from_json, fetch_file_content, download_files,
+    resolve_file_source,
+)
+from zen.core.cache import file_sha256, get_fetch_cache, revalidating
 from zen.core.logger import get_logger
 from zen.core.exceptions import InstallationError
+from zen.core.lockfile import (
+    LOCKFILE_NAME, CommitResolver, load_lockfile, lockfile_path, parse_lockfile, render_lockfile,
+)
+from zen.core.project import get_project_state
+from zen.core.requirements import RequirementsIndex, parse_requirement, parse_requirements, strip_comment
+from zen.core.transaction import InstallTransaction
 
 logger = get_logger()
 
@@ -19,6 +32,14 @@ class ComponentInstaller:
     def __init__(self, project_root: str = "."):
         self.project_root = Path(project_root).resolve()
         self.requirements_file = self.project_root / "requirements.txt"
+        # Transaction every write goes through while an install is running
+        self._transaction: Optional[InstallTransaction] = None
+        # Parsed .zen/config.yaml, shared by every installer for this project
+        self._state = get_project_state(self.project_root)
+        # requirements.txt as seen by the current transaction
+        self._requirements: Optional[RequirementsIndex] = None
+        # GitHub refs resolved to commits for the install in progress
+        self._commits: Optional[CommitResolver] = None
         logger.debug(f"Component installer initialized for: {self.project_root}")
     
     def install_from_url(self, url: str, custom_path: Optional[str] = None, overwrite: bool = False) -> dict:
@@ -40,28 +61,116 @@ class ComponentInstaller:
             component = load_component_from_url(url)
             logger.info(f"Component: {component.name} v{component.version}")
             logger.info(f"Description: {component.description}")
+        except Exception as e:
+            logger.error(f"Installation failed: {e}")
+            raise InstallationError(f"Failed to install component: {e}")
+        
+        return self.install_component(component, url, custom_path, overwrite)
+    
+    def install_component(self, component: ComponentSchema, source_url: str,
+                          custom_path: Optional[str] = None, overwrite: bool = False) -> dict:
+        """
+        Install an already-resolved component.
+        
+        Use this when the caller has loaded the component itself (e.g. to show
+        its details first), so the JSON and file bodies are not fetched twice.
+        
+        Args:
+            component: Component with file contents already resolved
+            source_url: URL the component was loaded from, recorded in the project config
+            custom_path: Custom installation path (optional)
+            overwrite: Whether to overwrite existing files
             
-            # Install files
-            installed_files = self._install_component_files(component, custom_path, overwrite)
+        Returns:
+            Installation summary dict
+        """
+        return self.install_components([(component, source_url)], custom_path, overwrite)[0]
+    
+    def install_components(self, components: List[Tuple[ComponentSchema, str]],
+                           custom_path: Optional[str] = None, overwrite: bool = False) -> List[dict]:
+        """
+        Install several already-resolved components in one pass.
+        
+        All files are written first; requirements.txt and the project config
+        are then updated once for the whole batch. Everything is staged and
+        committed as one transaction, so a failure leaves the project untouched.
+        
+        Args:
+            components: (component, source_url) pairs in installation order
+            custom_path: Custom installation path (optional)
+            overwrite: Whether to overwrite existing files
             
-            # Update dependencies
-            added_deps = self._update_dependencies(component.dependencies)
+        Returns:
+            One installation summary dict per component
+        """
+        try:
+            with self._commit_scope(components), self._transaction_scope():
+                results = []
+                all_dependencies = []
+                reports = {}
+                for component, _ in components:
+                    # Install files
+                    report = self._install_component_files(component, custom_path, overwrite)
+                    reports[component.name] = report
+                    all_dependencies.extend(component.dependencies)
+                    results.append({
+                        "component": component.name,
+                        "version": component.version,
+                        "files_installed": len(report["written"]),
+                        "files_unchanged": len(report["unchanged"]),
+                        "files_conflicting": len(report["conflicting"]),
+                        "dependencies_added": 0,
+                        "install_path": custom_path or self._get_default_path(component.category)
+                    })
             
-            # Update project config
-            self._update_project_config(url, component)
+                # Update dependencies once for the whole batch
+                added_deps = self._update_dependencies(list(dict.fromkeys(all_dependencies)))
             
-            return {
-                "component": component.name,
-                "version": component.version,
-                "files_installed": len(installed_files),
-                "dependencies_added": len(added_deps),
-                "install_path": custom_path or self._get_default_path(component.category)
-            }
+                # Attribute each new dependency to the first component that asked for it
+                remaining = set(added_deps)
+                for (component, _), result in zip(components, results):
+                    mine = [dep for dep in added_deps if dep in remaining and dep in component.dependencies]
+                    reports[component.name]["requirements_added"].extend(mine)
+                    result["dependencies_added"] = len(mine)
+                    remaining.difference_update(mine)
+            
+                # Update project config and lockfile once for the whole batch
+                self._update_project_config_many(components, reports, custom_path)
+                self._update_lockfile(components, reports, custom_path)
+            
+                return results
             
         except Exception as e:
             logger.error(f"Installation failed: {e}")
             raise InstallationError(f"Failed to install component: {e}")
     
+    def install_component_groups(self, groups: Dict[Optional[str], List[Tuple[ComponentSchema, str]]],
+                                 overwrite: bool = False) -> List[dict]:
+        """
+        Install components that go to different paths in one transaction.
+
+        Args:
+            groups: (component, source_url) pairs by custom installation path,
+                    None for the category defaults (e.g. the "path" recorded
+                    for each installed component)
+            overwrite: Whether to overwrite existing files
+
+        Returns:
+            One installation summary dict per component, group by group
+        """
+        pairs = [pair for group in groups.values() for pair in group]
+        try:
+            with self._commit_scope(pairs), self._transaction_scope():
+                results = []
+                for custom_path, group in groups.items():
+                    results.extend(self.install_components(group, custom_path, overwrite))
+                return results
+        except InstallationError:
+            raise
+        except Exception as e:
+            logger.error(f"Installation failed: {e}")
+            raise InstallationError(f"Failed to install component: {e}")
+    
     def install_from_json(self, json_content: str, custom_path: Optional[str] = None, overwrite: bool = False) -> dict:
         """
         Install component from JSON string.
@@ -78,16 +187,19 @@ class ComponentInstaller:
             component = load_component_from_json(json_content)
             logger.info(f"Installing component: {component.name} v{component.version}")
             
-            # Install files
-            installed_files = self._install_component_files(component, custom_path, overwrite)
-            
-            # Update dependencies
-            added_deps = self._update_dependencies(component.dependencies)
+            with self._transaction_scope():
+                # Install files
+                report = self._install_component_files(component, custom_path, overwrite)
+                
+                # Update dependencies
+                added_deps = self._update_dependencies(component.dependencies)
             
             return {
                 "component": component.name,
                 "version": component.version,
-                "files_installed": len(installed_files),
+                "files_installed": len(report["written"]),
+                "files_unchanged": len(report["unchanged"]),
+                "files_conflicting": len(report["conflicting"]),
                 "dependencies_added": len(added_deps),
                 "install_path": custom_path or self._get_default_path(component.category)
             }
@@ -96,106 +208,576 @@ class ComponentInstaller:
             logger.error(f"Installation failed: {e}")
             raise InstallationError(f"Failed to install component: {e}")
     
-    def _install_component_files(self, component: ComponentSchema, custom_path: Optional[str], overwrite: bool) -> List[str]:
-        """Install component files to target locations."""
-        installed_files = []
-        base_path = Path(custom_path) if custom_path else self._get_default_path(component.category)
+    def install_from_lock(self, overwrite: bool = False) -> List[dict]:
+        """
+        Rebuild the project exactly as pinned in zen.lock, without resolving anything.
+
+        File bodies come from the content-addressed fetch cache when present;
+        only missing ones are downloaded from their locked URLs. Every file is
+        verified against its locked sha256 before anything is written, and the
+        whole install is one transaction.
+
+        Args:
+            overwrite: Whether to replace existing files whose content differs
+
+        Returns:
+            One installation summary dict per locked component
+        """
+        lock = load_lockfile(self.project_root)
+        if lock is None:
+            raise InstallationError(f"No {LOCKFILE_NAME} found; run 'zen add' first")
+        if not lock["components"]:
+            raise InstallationError(f"{LOCKFILE_NAME} lists no components")
         
-        logger.progress("Installing component files...")
+        cache = get_fetch_cache()
+        try:
+            with self._transaction_scope() as transaction:
+                results = []
+                records = {}
+                dependencies = []
+                # (url, target, expected sha256) of bodies missing from the cache
+                downloads: List[Tuple[str, Path, str]] = []
+                # target -> expected sha256 of everything staged
+                expected: Dict[Path, str] = {}
+                
+                for name, entry in sorted(lock["components"].items()):
+                    report = {"written": [], "unchanged": [], "conflicting": [], "hashes": {}}
+                    recorded = self._recorded_file_hashes(name)
+                    embedded = None
+                    for key, file_record in sorted(entry.get("files", {}).items()):
+                        target_path = Path(key) if Path(key).is_absolute() else self.project_root / key
+                        sha256 = file_record["sha256"]
+                        if not self._should_write(target_path, sha256, recorded, overwrite, report):
+                            continue
+                        report["written"].append(str(target_path))
+                        expected[target_path] = sha256
+                        
+                        cached = cache.object_file(sha256) if cache is not None else None
+                        if cached is not None:
+                            shutil.copyfile(cached, transaction.stage(target_path))
+                        elif file_record.get("url"):
+                            downloads.append((file_record["url"], target_path, sha256))
+                        else:
+                            # Embedded content: recover it from the locked component.json
+                            if embedded is None:
+                                embedded = self._embedded_bodies(entry)
+                            if sha256 not in embedded:
+                                raise InstallationError(
+                                    f"Locked content of {key} is no longer available from {entry.get('resolved')}"
+                                )
+                            self._write_bytes(target_path, embedded[sha256])
+                    
+                    # requirements.txt lines first, as a regular install merges them first
+                    dependencies.extend(entry.get("requirements", []))
+                    dependencies.extend(entry.get("dependencies", []))
+                    records[name] = {
+                        "name": name,
+                        "version": entry["version"],
+                        "source": entry["source"],
+                        "category": entry.get("category", "utils"),
+                        "dependencies": entry.get("dependencies", []),
+                        "files": report["hashes"],
+                        "requirements": entry.get("requirements", []),
+                    }
+                    if entry.get("path"):
+                        records[name]["path"] = entry["path"]
+                    results.append({
+                        "component": name,
+                        "version": entry["version"],
+                        "files_installed": len(report["written"]),
+                        "files_unchanged": len(report["unchanged"]),
+                        "files_conflicting": len(report["conflicting"]),
+                        "dependencies_added": 0,
+                    })
+                
+                if downloads:
+                    logger.progress(f"Fetching {len(downloads)} files missing from the cache...")
+                    try:
+                        download_files([(url, transaction.stage(target)) for url, target, _ in downloads])
+                    except ValueError as e:
+                        raise InstallationError(str(e))
+                
+                # Verify everything before the transaction commits
+                for target_path, sha256 in expected.items():
+                    actual = file_sha256(transaction.stage(target_path))
+                    if actual != sha256:
+                        raise InstallationError(
+                            f"Hash mismatch for {self._relative_key(target_path)}: "
+                            f"expected {sha256}, got {actual}"
+                        )
+                
+                # The requirements index keeps the first requirement per package, like a regular install
+                added_deps = self._update_dependencies(list(dict.fromkeys(dependencies)))
+                remaining = set(added_deps)
+                for name, result in zip(sorted(lock["components"]), results):
+                    entry = lock["components"][name]
+                    declared = entry.get("dependencies", []) + entry.get("requirements", [])
+                    mine = [dep for dep in added_deps if dep in remaining and dep in declared]
+                    records[name]["requirements_added"] = self._owned_requirements(name, mine)
+                    result["dependencies_added"] = len(mine)
+                    remaining.difference_update(mine)
+                
+                self._write_component_records(records)
+                return results
         
+        except InstallationError:
+            raise
+        except Exception as e:
+            logger.error(f"Installation failed: {e}")
+            raise InstallationError(f"Failed to install from {LOCKFILE_NAME}: {e}")
+    
+    def _embedded_bodies(self, entry: dict) -> Dict[str, bytes]:
+        """Embedded file bodies of a locked component, keyed by sha256."""
+        component = load_component_from_url(entry["resolved"], fetch_files=False)
+        bodies = {}
         for file_info in component.files:
-            # Determine target file path
-            if custom_path:
-                # Use custom path as base
-                target_path = self.project_root / base_path / file_info.name
+            data = file_info.read_bytes()
+            if data is not None:
+                bodies[hashlib.sha256(data).hexdigest()] = data
+        return bodies
+    
+    def update_components(self, names: Optional[List[str]] = None, overwrite: bool = False) -> List[dict]:
+        """
+        Bring installed components up to date with their sources, touching only what changed.
+
+        Upstream definitions are fetched without file bodies. Url files whose
+        declared sha256 matches the installed copy are not fetched at all; the
+        others go through the fetch cache, revalidated with the server, so an
+        unchanged file costs a 304. Only files whose content differs are
+        rewritten, files the new version dropped are removed unless modified,
+        and everything - files, requirements.txt, config and zen.lock - is
+        applied in one transaction.
+
+        Args:
+            names: Components to update (default: all installed)
+            overwrite: Whether to replace files modified since they were installed
+
+        Returns:
+            One installation summary dict per updated component, with its
+            "previous_version", "files_removed" and "bytes_total" (size of all
+            its files once updated)
+        """
+        from zen.core.outdated import check_versions
+        
+        installed = self._state.components
+        names = list(dict.fromkeys(names)) if names else sorted(installed)
+        missing = [name for name in names if name not in installed]
+        if missing:
+            raise InstallationError(f"Component not installed: {', '.join(missing)}")
+        
+        checks = check_versions({name: installed[name] for name in names})
+        # Components installed to a custom path are installed there again
+        groups: Dict[Optional[str], List[Tuple[ComponentSchema, str]]] = {}
+        for check in checks:
+            if check.component is None:
+                logger.warning(f"Skipping {check.name}: {check.error}")
+            elif check.component.name != check.name:
+                logger.warning(f"Skipping {check.name}: its source now provides '{check.component.name}'")
             else:
-                # Use the path specified in the component
-                target_path = self.project_root / file_info.path
-            
-            # Special handling for requirements.txt - merge instead of overwrite
-            if file_info.name == "requirements.txt" and target_path.name == "requirements.txt":
-                self._handle_requirements_file(file_info, target_path)
-                installed_files.append(str(target_path))
-                continue
-            
-            # Create parent directories
-            target_path.parent.mkdir(parents=True, exist_ok=True)
-            
-            # Check if file exists
-            if target_path.exists() and not overwrite:
-                logger.warning(f"File exists, skipping: {target_path}")
-                continue
+                groups.setdefault(installed[check.name].get("path"), []).append((check.component, check.source))
+        if not groups:
+            if checks and all(check.component is None for check in checks):
+                raise InstallationError("Could not load any component from its source")
+            return []
+        
+        updated = [component.name for group in groups.values() for component, _ in group]
+        shared_files = {
+            key for name, record in installed.items() if name not in updated
+            for key in (record.get("files") or {})
+        }
+        results = []
+        removed_paths: List[Path] = []
+        pairs = [pair for group in groups.values() for pair in group]
+        with revalidating(), self._commit_scope(pairs), self._transaction_scope() as transaction:
+            results.extend(self.install_component_groups(groups, overwrite))
             
-            # Write file content. If content is missing but a URL is provided, fetch it.
-            try:
-                content_to_write = getattr(file_info, "content", None)
-                if not content_to_write and getattr(file_info, "url", None):
-                    try:
-                        content_to_write = fetch_file_content(file_info.url, base=self._get_component_base_url())
-                    except Exception as e:
-                        logger.error(f"Failed to fetch file {file_info.name} from {file_info.url}: {e}")
-                        raise InstallationError(f"Failed to fetch file {file_info.name} from {file_info.url}: {e}")
+            for result in results:
+                name = result["component"]
+                previous = installed[name]
+                current = self._state.get_component(name) or {}
+                result["previous_version"] = previous.get("version", "unknown")
+                result["files_removed"] = 0
+                # Files the new version no longer ships
+                dropped = set(previous.get("files") or {}) - set(current.get("files") or {}) - shared_files
+                for key in sorted(dropped):
+                    target_path = Path(key) if Path(key).is_absolute() else self.project_root / key
+                    if transaction.is_staged(target_path) or not target_path.is_file():
+                        continue
+                    if file_sha256(target_path) != previous["files"][key]:
+                        logger.warning(f"Keeping locally modified file no longer in {name}: {target_path}")
+                        continue
+                    transaction.remove(target_path)
+                    removed_paths.append(target_path)
+                    result["files_removed"] += 1
+        
+        self._prune_empty_dirs(removed_paths)
+        for result in results:
+            files = (self._state.get_component(result["component"]) or {}).get("files") or {}
+            result["bytes_total"] = sum(
+                path.stat().st_size for path in
+                (Path(key) if Path(key).is_absolute() else self.project_root / key for key in files)
+                if path.is_file()
+            )
+        return results
+    
+    def remove_components(self, names: List[str]) -> List[dict]:
+        """
+        Uninstall components using the file manifest recorded when they were installed.
+
+        Recorded files are deleted unless their content changed since they were
+        installed (those are kept and reported) or another component also
+        installed them; directories left empty are pruned. Requirement lines a
+        component added to requirements.txt are dropped unless a remaining
+        component declares the same requirement, which then takes them over.
+        Files, requirements.txt, the project config and zen.lock are updated in
+        one transaction.
+
+        Args:
+            names: Names of installed components
+
+        Returns:
+            One removal summary dict per component
+        """
+        components = self._state.components
+        missing = [name for name in names if name not in components]
+        if missing:
+            raise InstallationError(f"Component not installed: {', '.join(missing)}")
+        names = list(dict.fromkeys(names))
+        remaining = {name: record for name, record in components.items() if name not in names}
+        # Files and requirements still needed by the components that stay
+        shared_files = {key for record in remaining.values() for key in (record.get("files") or {})}
+        declared = {name: self._declared_requirements(record) for name, record in remaining.items()}
+        
+        removed_paths: List[Path] = []
+        try:
+            with self._transaction_scope() as transaction:
+                results = []
+                # (component, line) of requirement lines nobody needs any more
+                released: List[Tuple[str, str]] = []
+                # remaining component -> requirement lines it takes over
+                inherited: Dict[str, List[str]] = {}
                 
-                if content_to_write is None:
-                    logger.error(f"No content available for file {file_info.name}")
-                    raise InstallationError(f"No content available for file {file_info.name}")
+                for name in names:
+                    record = components[name]
+                    result = {
+                        "component": name,
+                        "version": record.get("version", "unknown"),
+                        "files_removed": 0,
+                        "files_modified": [],
+                        "files_missing": 0,
+                        "dependencies_removed": 0,
+                    }
+                    files = record.get("files")
+                    if files is None:
+                        logger.warning(f"No file manifest recorded for {name}; only its configuration is removed")
+                    for key, sha256 in sorted((files or {}).items()):
+                        if key in shared_files:
+                            continue
+                        target_path = Path(key) if Path(key).is_absolute() else self.project_root / key
+                        if not target_path.is_file():
+                            result["files_missing"] += 1
+                            continue
+                        if file_sha256(target_path) != sha256:
+                            logger.warning(f"Keeping locally modified file: {target_path}")
+                            result["files_modified"].append(str(target_path))
+                            continue
+                        transaction.remove(target_path)
+                        removed_paths.append(target_path)
+                        result["files_removed"] += 1
+                    
+                    for line in record.get("requirements_added") or []:
+                        requirement = parse_requirement(line)
+                        heir = next((other for other, keys in declared.items()
+                                     if requirement is not None and requirement.key in keys), None)
+                        if heir is not None:
+                            inherited.setdefault(heir, []).append(line)
+                        else:
+                            released.append((name, line))
+                    results.append(result)
+                
+                dropped = self._remove_requirements([line for _, line in released])
+                for result in results:
+                    result["dependencies_removed"] = sum(
+                        1 for name, line in released if name == result["component"] and line in dropped
+                    )
+                
+                for name in names:
+                    self._state.remove_component(name)
+                self._state.update_components({
+                    heir: {**remaining[heir], "requirements_added": list(dict.fromkeys(
+                        [*(remaining[heir].get("requirements_added") or []), *lines]
+                    ))}
+                    for heir, lines in inherited.items()
+                })
+                
+                path = lockfile_path(self.project_root)
+                content = self._read_text(path)
+                if content is not None:
+                    lock = parse_lockfile(content, path)
+                    for name in names:
+                        lock["components"].pop(name, None)
+                    self._write_text(path, render_lockfile(lock))
+        
+        except InstallationError:
+            raise
+        except Exception as e:
+            logger.error(f"Removal failed: {e}")
+            raise InstallationError(f"Failed to remove components: {e}")
+        
+        self._prune_empty_dirs(removed_paths)
+        return results
+    
+    def _declared_requirements(self, record: dict) -> set:
+        """Requirement keys (see `Requirement.key`) an installed component declares."""
+        keys = set()
+        for line in [*(record.get("dependencies") or []), *(record.get("requirements") or [])]:
+            requirement = parse_requirement(line)
+            if requirement is not None:
+                keys.add(requirement.key)
+        return keys
+    
+    def _remove_requirements(self, lines: List[str]) -> set:
+        """
+        Drop requirement lines from requirements.txt.
 
-                with open(target_path, 'w', encoding='utf-8') as f:
-                    f.write(content_to_write)
+        Only lines that still read exactly as zen added them are removed; edited
+        ones are left for the user.
+
+        Returns:
+            The lines that were removed
+        """
+        content = self._read_text(self.requirements_file)
+        if not lines or content is None:
+            return set()
+        wanted = set(lines)
+        removed = set()
+        kept = []
+        for line in content.splitlines(keepends=True):
+            text = strip_comment(line)
+            if text in wanted:
+                removed.add(text)
+            else:
+                kept.append(line)
+        for line in wanted - removed:
+            logger.info(f"Keeping requirement changed since install: {line}")
+        if removed:
+            self._write_text(self.requirements_file, "".join(kept))
+            self._requirements = None
+        return removed
+    
+    def _prune_empty_dirs(self, paths: List[Path]):
+        """Remove directories left empty by deleted files, up to the project root."""
+        for path in paths:
+            directory = path.parent
+            while directory != self.project_root and self.project_root in directory.parents:
+                try:
+                    directory.rmdir()
+                except OSError:
+                    # Not empty (or not ours to remove)
+                    break
+                directory = directory.parent
+    
+    def _install_component_files(self, component: ComponentSchema, custom_path: Optional[str],
+                                 overwrite: bool) -> dict:
+        """
+        Install component files to target locations.
+
+        Files whose content already matches the target are left alone (their
+        mtime does not change). Existing files with different content are
+        replaced when they still match what zen installed, and otherwise only
+        with `overwrite`; without it they are reported as conflicting.
+
+        Returns:
+            Dict with "written", "unchanged" and "conflicting" target paths;
+            "hashes", the sha256 of every file now matching the component, and
+            "files", the sha256 and resolved url of every component file, both
+            keyed by project-relative path; "requirements", the lines of the
+            component's requirements.txt; and "requirements_added", those of
+            them that were new to the project's requirements.txt
+        """
+        report = {"written": [], "unchanged": [], "conflicting": [], "hashes": {}, "files": {},
+                  "requirements": [], "requirements_added": []}
+        base_path = Path(custom_path) if custom_path else self._get_default_path(component.category)
+        recorded = self._recorded_file_hashes(component.name)
+        
+        logger.progress("Installing component files...")
+
+        # Files that only have a url are streamed to disk together at the end,
+        # with the sha256 the component declares for them, if any
+        downloads: List[Tuple[str, Path, Optional[str]]] = []
+
+        with self._transaction_scope() as transaction:
+            for file_info in component.files:
+                # Determine target file path
+                if custom_path:
+                    # Use custom path as base
+                    target_path = self.project_root / base_path / file_info.name
+                else:
+                    # Use the path specified in the component
+                    target_path = self.project_root / file_info.path
+                
+                # Special handling for requirements.txt - merge instead of overwrite
+                if file_info.name == "requirements.txt" and target_path.name == "requirements.txt":
+                    declared, added = self._handle_requirements_file(file_info, target_path,
+                                                                     base=component.source_base)
+                    report["requirements"].extend(declared)
+                    report["requirements_added"].extend(added)
+                    report["written" if added else "unchanged"].append(str(target_path))
+                    continue
                 
-                installed_files.append(str(target_path))
-                logger.debug(f"Installed: {file_info.name} -> {target_path}")
+                # A file already staged by an earlier component in the batch wins
+                if transaction.is_staged(target_path) and not overwrite:
+                    logger.warning(f"File exists, skipping: {target_path}")
+                    report["conflicting"].append(str(target_path))
+                    continue
                 
-            except Exception as e:
-                logger.error(f"Failed to write file {target_path}: {e}")
-                raise InstallationError(f"Failed to write file {target_path}: {e}")
+                if not file_info.has_content and getattr(file_info, "url", None):
+                    if file_info.sha256:
+                        # A declared hash settles it without downloading anything
+                        report["files"][self._relative_key(target_path)] = {
+                            "sha256": file_info.sha256,
+                            "url": resolve_file_source(file_info.url, component.source_base)[0],
+                        }
+                        if not self._should_write(target_path, file_info.sha256, recorded, overwrite, report):
+                            continue
+                    # Streamed byte for byte, so binary files need no special casing;
+                    # compared against the existing file once downloaded
+                    downloads.append((file_info.url, target_path, file_info.sha256))
+                    continue
+
+                if not file_info.has_content:
+                    logger.error(f"No content available for file {file_info.name}")
+                    raise InstallationError(f"No content available for file {file_info.name}")
+
+                data = file_info.read_bytes()
+                new_hash = hashlib.sha256(data).hexdigest()
+                source = resolve_file_source(file_info.url, component.source_base)[0] if file_info.url else None
+                report["files"][self._relative_key(target_path)] = {"sha256": new_hash, "url": source}
+                if not self._should_write(target_path, new_hash, recorded, overwrite, report):
+                    continue
+
+                try:
+                    if file_info.binary:
+                        # Binary files are written verbatim, never decoded
+                        self._write_bytes(target_path, data)
+                    else:
+                        self._write_text(target_path, file_info.content, encoding=file_info.encoding)
+                    
+                    report["written"].append(str(target_path))
+                    logger.debug(f"Installed: {file_info.name} -> {target_path}")
+                    
+                except Exception as e:
+                    logger.error(f"Failed to write file {target_path}: {e}")
+                    raise InstallationError(f"Failed to write file {target_path}: {e}")
+
+            if downloads:
+                try:
+                    # GitHub files are requested at the commit their ref resolved to
+                    download_files([(url, transaction.stage(target)) for url, target, _ in downloads],
+                                   base=component.source_base,
+                                   pin=self._commits.pin if self._commits is not None else None)
+                except ValueError as e:
+                    logger.error(str(e))
+                    raise InstallationError(str(e))
+                for url, target_path, expected in downloads:
+                    new_hash = file_sha256(transaction.stage(target_path))
+                    if expected:
+                        if new_hash != expected:
+                            raise InstallationError(
+                                f"Hash mismatch for {url}: expected {expected}, got {new_hash}"
+                            )
+                        # Already decided to write it before downloading
+                        report["written"].append(str(target_path))
+                        logger.debug(f"Downloaded: {url} -> {target_path}")
+                        continue
+                    report["files"][self._relative_key(target_path)] = {
+                        "sha256": new_hash, "url": resolve_file_source(url, component.source_base)[0],
+                    }
+                    if self._should_write(target_path, new_hash, recorded, overwrite, report):
+                        report["written"].append(str(target_path))
+                        logger.debug(f"Downloaded: {url} -> {target_path}")
+                    else:
+                        transaction.unstage(target_path)
+        
+        logger.success(f"Installed {len(report['written'])} files")
+        if report["unchanged"]:
+            logger.info(f"{len(report['unchanged'])} files unchanged")
+        if report["conflicting"]:
+            logger.warning(f"{len(report['conflicting'])} files conflict with local changes (use --overwrite to replace)")
+        return report
+    
+    def _should_write(self, target_path: Path, new_hash: str, recorded: dict, overwrite: bool,
+                      report: dict) -> bool:
+        """
+        Decide whether a file with content `new_hash` must be written to `target_path`.
+
+        Files still matching the hash recorded when zen installed them are
+        replaced; files changed since are only replaced with `overwrite`.
+        Unchanged and conflicting files are added to `report`; the hash of every
+        file that ends up matching the component is recorded in it.
+        """
+        key = self._relative_key(target_path)
+        if not target_path.exists():
+            report["hashes"][key] = new_hash
+            return True
+        
+        current_hash = file_sha256(target_path)
+        if current_hash == new_hash:
+            report["unchanged"].append(str(target_path))
+            report["hashes"][key] = new_hash
+            return False
+        
+        if recorded.get(key) == current_hash:
+            # Still exactly what zen installed: safe to replace with the new version
+            report["hashes"][key] = new_hash
+            return True
         
-        logger.success(f"Installed {len(installed_files)} files")
-        return installed_files
+        if not overwrite:
+            logger.warning(f"File exists, skipping: {target_path}")
+            report["conflicting"].append(str(target_path))
+            # Keep whatever was recorded for the file before
+            if key in recorded:
+                report["hashes"][key] = recorded[key]
+            return False
+        
+        if recorded.get(key) not in (None, current_hash):
+            logger.warning(f"Overwriting locally modified file: {target_path}")
+        report["hashes"][key] = new_hash
+        return True
     
-    def _handle_requirements_file(self, file_info, target_path: Path):
-        """Handle requirements.txt files by merging dependencies."""
+    def _handle_requirements_file(self, file_info, target_path: Path,
+                                  base: Optional[str] = None) -> Tuple[List[str], List[str]]:
+        """
+        Handle requirements.txt files by merging dependencies.
+
+        Returns:
+            Tuple of (requirement lines the file declares, lines added to the project's)
+        """
+        component_deps: List[str] = []
         try:
             # Get component requirements content
             content_to_merge = getattr(file_info, "content", None)
             if not content_to_merge and getattr(file_info, "url", None):
-                content_to_merge = fetch_file_content(file_info.url, base=self._get_component_base_url())
+                content_to_merge = fetch_file_content(file_info.url, base=base)
             
             if not content_to_merge:
-                return
+                return component_deps, []
             
             # Parse component requirements
-            component_deps = []
-            for line in content_to_merge.strip().split('\n'):
-                line = line.strip()
-                if line and not line.startswith('#'):
-                    component_deps.append(line)
-            
-            if not component_deps:
-                return
-            
-            # Read existing requirements
-            existing_deps = self._read_requirements()
+            component_deps = [requirement.line for requirement in parse_requirements(content_to_merge)]
             
             # Find new dependencies
-            new_deps = []
-            for dep in component_deps:
-                dep_name = self._extract_package_name(dep)
-                if not any(self._extract_package_name(existing) == dep_name for existing in existing_deps):
-                    new_deps.append(dep)
+            index = self._requirements_index()
+            new_deps = [dep for dep in component_deps if index.add(dep)]
             
             if new_deps:
                 self._append_requirements(new_deps)
                 logger.info(f"Merged {len(new_deps)} dependencies into requirements.txt")
+            return component_deps, new_deps
             
         except Exception as e:
             logger.warning(f"Failed to merge requirements.txt: {e}")
-    
-    def _get_component_base_url(self) -> Optional[str]:
-        """Get the base URL for the current component being installed."""
-        # This would be set during installation - for now return None
-        # In a full implementation, this would be passed through the installation context
-        return None
+            return component_deps, []
     
     def _update_dependencies(self, dependencies: List[str]) -> List[str]:
         """Update requirements.txt with new dependencies."""
@@ -204,15 +786,9 @@ class ComponentInstaller:
         
         logger.progress("Updating dependencies...")
         
-        # Read existing requirements
-        existing_deps = self._read_requirements()
-        
         # Find new dependencies
-        new_deps = []
-        for dep in dependencies:
-            dep_name = self._extract_package_name(dep)
-            if not any(self._extract_package_name(existing) == dep_name for existing in existing_deps):
-                new_deps.append(dep)
+        index = self._requirements_index()
+        new_deps = [dep for dep in dependencies if index.add(dep)]
         
         if new_deps:
             # Append new dependencies
@@ -223,41 +799,105 @@ class ComponentInstaller:
         
         return new_deps
     
-    def _read_requirements(self) -> List[str]:
-        """Read existing requirements.txt."""
-        if not self.requirements_file.exists():
-            return []
-        
-        with open(self.requirements_file, 'r', encoding='utf-8') as f:
-            lines = f.readlines()
-        
-        # Filter out comments and empty lines
-        return [line.strip() for line in lines if line.strip() and not line.startswith('#')]
+    def _requirements_index(self) -> RequirementsIndex:
+        """Index of requirements.txt, built once per transaction and kept current as lines are added."""
+        if self._transaction is None:
+            return RequirementsIndex.load(self.requirements_file, read_text=self._read_text)
+        if self._requirements is None:
+            self._requirements = RequirementsIndex.load(self.requirements_file, read_text=self._read_text)
+        return self._requirements
     
     def _append_requirements(self, new_deps: List[str]):
         """Append new dependencies to requirements.txt."""
-        # Create file if it doesn't exist
-        if not self.requirements_file.exists():
-            self.requirements_file.touch()
-        
-        with open(self.requirements_file, 'a', encoding='utf-8') as f:
-            # Add newline if file doesn't end with one
-            if self.requirements_file.stat().st_size > 0:
-                with open(self.requirements_file, 'rb') as check_f:
-                    check_f.seek(-1, 2)
-                    if check_f.read(1) != b'\n':
-                        f.write('\n')
-            
-            # Add dependencies
-            for dep in new_deps:
-                f.write(f'{dep}\n')
+        content = self._read_text(self.requirements_file) or ""
+        
+        # Add newline if file doesn't end with one
+        if content and not content.endswith('\n'):
+            content += '\n'
+        
+        # Add dependencies
+        content += ''.join(f'{dep}\n' for dep in new_deps)
+        self._write_text(self.requirements_file, content)
+    
+    @contextmanager
+    def _commit_scope(self, components: List[Tuple[ComponentSchema, str]]):
+        """
+        Resolve the GitHub refs of components and their files to commits for the block.
+
+        Runs before the transaction takes the project lock, so no API call is
+        made while other zen processes wait. Files are then downloaded from the
+        pinned commit, making the bytes hashed into zen.lock the ones its
+        commit holds even if the branch moves during the install.
+        """
+        if self._commits is not None:
+            # Already resolved by an enclosing install
+            yield self._commits
+            return
+        resolver = CommitResolver()
+        urls = []
+        for component, _ in components:
+            urls.append(component.source_url)
+            urls.extend(
+                resolve_file_source(f.url, component.source_base)[0]
+                for f in component.files if getattr(f, "url", None)
+            )
+        resolver.resolve(urls)
+        self._commits = resolver
+        try:
+            yield resolver
+        finally:
+            self._commits = None
+    
+    @contextmanager
+    def _transaction_scope(self):
+        """Route every write made inside the block through one InstallTransaction."""
+        if self._transaction is not None:
+            # Already inside a transaction: join it
+            yield self._transaction
+            return
+        # The project lock is held until the transaction has committed
+        with self._state.batch(), InstallTransaction(self.project_root) as transaction:
+            self._transaction = transaction
+            self._requirements = None
+            try:
+                yield transaction
+                # Stage the config once, with every component recorded in the block
+                self._state.flush(write=self._write_text)
+            finally:
+                self._transaction = None
+                self._requirements = None
+    
+    def _write_path(self, target: Path) -> Path:
+        """Where a file for `target` should be written: its staging file during a transaction."""
+        if self._transaction is not None:
+            return self._transaction.stage(target)
+        target.parent.mkdir(parents=True, exist_ok=True)
+        return target
     
-    def _extract_package_name(self, dep: str) -> str:
-        """Extract package name from dependency specification."""
-        import re
-        # Extract name before version specifiers
-        match = re.match(r'^([a-zA-Z0-9_.-]+)', dep)
-        return match.group(1).lower() if match else dep.lower()
+    def _exists(self, path: Path) -> bool:
+        """Whether a file exists, counting files staged in the current transaction."""
+        if self._transaction is not None:
+            return self._transaction.exists(path)
+        return path.exists()
+    
+    def _read_text(self, path: Path) -> Optional[str]:
+        """Read a file as the current transaction sees it; None if it does not exist."""
+        if self._transaction is not None:
+            return self._transaction.read_text(path)
+        if not path.exists():
+            return None
+        with open(path, 'r', encoding='utf-8') as f:
+            return f.read()
+    
+    def _write_text(self, path: Path, text: str, encoding: str = 'utf-8'):
+        """Write a text file through the current transaction, if any."""
+        with open(self._write_path(path), 'w', encoding=encoding) as f:
+            f.write(text)
+    
+    def _write_bytes(self, path: Path, data: bytes):
+        """Write a binary file through the current transaction, if any."""
+        with open(self._write_path(path), 'wb') as f:
+            f.write(data)
     
     def _get_default_path(self, category: str) -> Path:
         """Get default installation path for category."""
@@ -272,38 +912,108 @@ class ComponentInstaller:
         }
         return Path(category_paths.get(category, "src/components"))
     
+    def _relative_key(self, path: Path) -> str:
+        """Key a file is recorded under in the project config: its project-relative posix path."""
+        try:
+            return path.resolve().relative_to(self.project_root).as_posix()
+        except ValueError:
+            # Installed outside the project (absolute custom path)
+            return path.resolve().as_posix()
+    
+    def _recorded_file_hashes(self, name: str) -> Dict[str, str]:
+        """File hashes recorded for an installed component, keyed like `_relative_key`."""
+        try:
+            entry = self._state.get_component(name) or {}
+        except Exception:
+            return {}
+        files = entry.get("files") or {}
+        return dict(files) if isinstance(files, dict) else {}
+    
     def _update_project_config(self, source_url: str, component: ComponentSchema):
         """Update project configuration with installed component."""
-        config_path = self.project_root / ".zen" / "config.yaml"
-        
-        if not config_path.exists():
-            logger.warning("No project configuration found")
-            return
-        
-        try:
-            import yaml
-            
-            # Read existing config
-            with open(config_path, 'r', encoding='utf-8') as f:
-                config = yaml.safe_load(f) or {}
-            
-            # Update components section
-            if "components" not in config:
-                config["components"] = {}
-            
-            config["components"][component.name] = {
+        self._update_project_config_many([(component, source_url)])
+    
+    def _update_project_config_many(self, components: List[Tuple[ComponentSchema, str]],
+                                    reports: Optional[Dict[str, dict]] = None,
+                                    custom_path: Optional[str] = None):
+        """
+        Record installed components in the project configuration with a single write.
+
+        `reports` maps component names to their `_install_component_files`
+        report. The sha256 of each installed file is used to skip unchanged
+        files on the next install; the files, together with the requirement
+        lines a component declared and added, are what `remove_components`
+        cleans up. A `custom_path` is recorded so updates install to it again.
+        """
+        records = {}
+        for component, source_url in components:
+            records[component.name] = {
                 "name": component.name,
                 "version": component.version,
                 "source": source_url,
                 "category": component.category,
                 "dependencies": component.dependencies
             }
-            
-            # Write updated config
-            with open(config_path, 'w', encoding='utf-8') as f:
-                yaml.dump(config, f, default_flow_style=False, indent=2)
-                
-            logger.debug(f"Updated project configuration for {component.name}")
+            if reports and component.name in reports:
+                report = reports[component.name]
+                records[component.name].update(
+                    files=report["hashes"],
+                    requirements=report["requirements"],
+                    requirements_added=self._owned_requirements(component.name, report["requirements_added"]),
+                )
+            if custom_path:
+                records[component.name]["path"] = str(custom_path)
+        self._write_component_records(records)
+    
+    def _owned_requirements(self, name: str, added: List[str]) -> List[str]:
+        """Requirement lines a component added now or in an earlier install and that are still present."""
+        previous = (self._state.get_component(name) or {}).get("requirements_added") or []
+        index = self._requirements_index()
+        return [line for line in dict.fromkeys([*previous, *added]) if line in index]
+    
+    def _write_component_records(self, records: Dict[str, dict]):
+        """Store component entries in the components section of the project configuration."""
+        if not self._state.exists:
+            logger.warning("No project configuration found")
+            return
+        
+        try:
+            # Written once, when the surrounding transaction finishes
+            self._state.update_components(records)
+            logger.debug(f"Updated project configuration for {', '.join(records)}")
             
         except Exception as e:
             logger.warning(f"Failed to update project configuration: {e}")
+    
+    def _update_lockfile(self, components: List[Tuple[ComponentSchema, str]], reports: Dict[str, dict],
+                         custom_path: Optional[str] = None):
+        """Pin installed components (resolved URLs, commit, file hashes) in zen.lock."""
+        path = lockfile_path(self.project_root)
+        lock = parse_lockfile(self._read_text(path), path)
+        # Normally resolved by `_commit_scope` before the project was locked
+        resolver = self._commits or CommitResolver()
+        
+        for component, source_url in components:
+            report = reports[component.name]
+            files = report["files"]
+            # The commit of component.json, else of the first GitHub-hosted file
+            commit = resolver.commit_for(component.source_url)
+            if commit is None:
+                commit = next((c for c in (resolver.commit_for(f["url"]) for f in files.values()) if c), None)
+            lock["components"][component.name] = {
+                "version": component.version,
+                "source": source_url,
+                "resolved": resolver.pin(component.source_url),
+                "commit": commit,
+                "category": component.category,
+                "dependencies": component.dependencies,
+                "requirements": report["requirements"],
+                "files": {
+                    key: {"sha256": record["sha256"], "url": resolver.pin(record["url"])}
+                    for key, record in sorted(files.items())
+                },
+            }
+            if custom_path:
+                lock["components"][component.name]["path"] = str(custom_path)
+        
+        self._write_text(path, render_lockfile(lock))
@@ -0,0 +1,199 @@
+"""
+Lockfile (``zen.lock``) support for zen.
+
+The lockfile pins every installed component to exact bytes: the URL each
+component and file was resolved to, the commit SHA for GitHub sources and the
+sha256 of every file. ``zen install --frozen`` rebuilds a project from it,
+taking file bodies from the content-addressed fetch cache where possible and
+refusing anything whose hash does not match.
+
+Unlike ``.zen/config.yaml`` the lockfile is meant to be committed.
+"""
+
+import json
+import os
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import Dict, Iterable, Optional, Tuple
+from urllib.parse import urlparse
+
+from zen.core.exceptions import ConfigurationError
+
+LOCKFILE_NAME = "zen.lock"
+LOCKFILE_VERSION = 1
+DEFAULT_GITHUB_API_URL = "https://api.github.com"
+
+
+def lockfile_path(project_root: Path) -> Path:
+    """Location of a project's lockfile."""
+    return Path(project_root) / LOCKFILE_NAME
+
+
+def parse_lockfile(content: Optional[str], path: Optional[Path] = None) -> dict:
+    """
+    Parse lockfile content; None or empty content yields an empty lock.
+
+    Raises:
+        ConfigurationError: If the content is not a lockfile this version understands
+    """
+    if not content:
+        return {"version": LOCKFILE_VERSION, "components": {}}
+    try:
+        data = json.loads(content)
+    except json.JSONDecodeError as e:
+        raise ConfigurationError(f"Invalid {LOCKFILE_NAME}: {e}", config_path=str(path) if path else None)
+    if not isinstance(data, dict) or data.get("version") != LOCKFILE_VERSION:
+        raise ConfigurationError(f"Unsupported {LOCKFILE_NAME} version: {data.get('version') if isinstance(data, dict) else data!r}",
+                                 config_path=str(path) if path else None)
+    data.setdefault("components", {})
+    return data
+
+
+def load_lockfile(project_root: Path) -> Optional[dict]:
+    """Read a project's lockfile, or None when it has none."""
+    path = lockfile_path(project_root)
+    if not path.exists():
+        return None
+    with open(path, "r", encoding="utf-8") as f:
+        return parse_lockfile(f.read(), path)
+
+
+def render_lockfile(lock: dict) -> str:
+    """Serialize a lock deterministically, so unchanged installs produce identical files."""
+    return json.dumps(lock, indent=2, sort_keys=True) + "\n"
+
+
+def github_raw_ref(url: str) -> Optional[Tuple[str, str, str]]:
+    """(owner, repo, ref) of a raw.githubusercontent.com URL, else None."""
+    parsed = urlparse(url)
+    if parsed.netloc.lower() != "raw.githubusercontent.com":
+        return None
+    parts = [p for p in parsed.path.split("/") if p]
+    if len(parts) < 4:
+        return None
+    return parts[0], parts[1], parts[2]
+
+
+def pin_url(url: str, commit: str) -> str:
+    """Replace the ref of a raw.githubusercontent.com URL with a commit SHA."""
+    parsed = urlparse(url)
+    parts = parsed.path.split("/")
+    # ['', owner, repo, ref, ...]
+    parts[3] = commit
+    return parsed._replace(path="/".join(parts)).geturl()
+
+
+# (owner, repo, ref) -> commit, or None when it could not be resolved; shared
+# by every resolver in the process
+_commits: Dict[Tuple[str, str, str], Optional[str]] = {}
+_commits_lock = threading.Lock()
+# Set once the API refused (rate limit) or failed to answer; later refs are
+# then locked unpinned without another round trip
+_api_unavailable = False
+
+
+def resolve_github_commit(owner: str, repo: str, ref: str, timeout: int = 5) -> Optional[str]:
+    """
+    Resolve a branch or tag to its commit SHA through the GitHub API.
+
+    Best effort: returns None offline or when the API cannot answer (rate
+    limits, private repositories), in which case URLs are locked unpinned.
+    Each ref is asked for at most once per process (outside
+    `zen.core.cache.revalidating()`), answers are kept in the fetch cache for
+    its TTL, and once the API is rate limited or unreachable it is not asked
+    again. Requests are authenticated with GITHUB_TOKEN when it is set. The
+    API host can be overridden via ZEN_GITHUB_API_URL.
+    """
+    global _api_unavailable
+    from zen.core.cache import _revalidate, get_fetch_cache
+    from zen.core.http import get_session_manager
+    from zen.core.mirror import is_offline
+
+    if len(ref) == 40 and all(c in "0123456789abcdef" for c in ref.lower()):
+        # Already a commit
+        return ref.lower()
+    memo_key = (owner, repo, ref)
+    if not _revalidate():
+        with _commits_lock:
+            if memo_key in _commits:
+                return _commits[memo_key]
+    cache = get_fetch_cache()
+    key = f"{owner}/{repo}@{ref}"
+    if cache is not None:
+        try:
+            cached = cache.get_commit(key)
+        except Exception:
+            # A broken cache only costs an API call
+            cached = None
+        if cached:
+            with _commits_lock:
+                _commits[memo_key] = cached
+            return cached
+    if is_offline() or _api_unavailable:
+        return None
+    base = os.environ.get("ZEN_GITHUB_API_URL", DEFAULT_GITHUB_API_URL).rstrip("/")
+    headers = {"Accept": "application/vnd.github.sha"}
+    token = os.environ.get("GITHUB_TOKEN")
+    if token:
+        headers["Authorization"] = f"Bearer {token}"
+    sha = None
+    try:
+        resp = get_session_manager().get(
+            f"{base}/repos/{owner}/{repo}/commits/{ref}",
+            timeout=timeout,
+            headers=headers,
+        )
+        if resp.status_code == 200:
+            sha = resp.text.strip()
+        elif resp.status_code in (403, 429):
+            # Rate limited: every other ref would be refused too
+            _api_unavailable = True
+    except Exception:
+        _api_unavailable = True
+    if sha is not None and len(sha) != 40:
+        sha = None
+    with _commits_lock:
+        _commits[memo_key] = sha
+    if sha is not None and cache is not None:
+        try:
+            cache.set_commit(key, sha)
+        except Exception:
+            pass
+    return sha
+
+
+class CommitResolver:
+    """Resolves GitHub refs to commits, asking for each (owner, repo, ref) once."""
+
+    def __init__(self):
+        self._resolved: Dict[Tuple[str, str, str], Optional[str]] = {}
+        self._lock = threading.Lock()
+
+    def resolve(self, urls: Iterable[Optional[str]], max_workers: int = 8):
+        """Resolve the refs of several GitHub raw URLs up front, concurrently."""
+        candidates = dict.fromkeys(github_raw_ref(url) for url in urls if url)
+        refs = [ref for ref in candidates if ref is not None and ref not in self._resolved]
+        if not refs:
+            return
+        with ThreadPoolExecutor(max_workers=min(max_workers, len(refs)), thread_name_prefix="zen-commit") as executor:
+            for ref, commit in zip(refs, executor.map(lambda r: resolve_github_commit(*r), refs)):
+                with self._lock:
+                    self._resolved[ref] = commit
+
+    def commit_for(self, url: Optional[str]) -> Optional[str]:
+        """Commit SHA a GitHub raw URL resolves to, or None."""
+        ref = github_raw_ref(url) if url else None
+        if ref is None:
+            return None
+        with self._lock:
+            if ref in self._resolved:
+                return self._resolved[ref]
+        commit = resolve_github_commit(*ref)
+        with self._lock:
+            return self._resolved.setdefault(ref, commit)
+
+    def pin(self, url: Optional[str]) -> Optional[str]:
+        """`url` with its GitHub ref replaced by the resolved commit, when there is one."""
+        commit = self.commit_for(url)
+        return pin_url(url, commit) if commit else url
@@ -2,25 +2,23 @@
 Logging configuration for Zenive with beautiful animations.
 """
 
+import atexit
 import logging
+import os
 import sys
 import time
 import threading
 import random
-from typing import Optional, Any, List, Tuple
+from typing import Optional, Any, Callable, List, Tuple
 from contextlib import contextmanager
 from rich.console import Console
 from rich.logging import RichHandler
 from rich.text import Text
-from rich.spinner import Spinner
-from rich.progress import Progress, SpinnerColumn, TextColumn, BarColumn, TaskProgressColumn
 from rich.panel import Panel
 from rich.align import Align
-from rich.live import Live
-from rich.table import Table
-from rich.columns import Columns
-from rich.box import ROUNDED, DOUBLE, HEAVY
-from rich.style import Style
+from rich.box import ROUNDED
+# rich.live, rich.progress and rich.table are imported where they are used:
+# most commands never need them and they add noticeably to start-up time.
 
 # Import animation configuration
 try:
@@ -48,6 +46,10 @@ except ImportError:
         return MockConfig()
 
 
+# Environment variables set by common CI providers
+_CI_ENV_VARS = ("CI", "GITHUB_ACTIONS", "GITLAB_CI", "BUILDKITE", "JENKINS_URL", "TF_BUILD", "TEAMCITY_VERSION")
+
+
 class ConnectingLinesAnimation:
     """Elegant interconnecting lines with small diamonds animation."""
     
@@ -135,6 +137,198 @@ class PulseAnimation:
         return frame
 
 
+class StatusWidget:
+    """A status block drawn by the RenderScheduler.
+    
+    Either cycles through precomputed `frames` (built once, so a frame costs
+    no renderable construction) or calls `render(elapsed)` every tick for
+    effects whose content depends on time.
+    """
+    
+    def __init__(self, frames: Optional[List[Any]] = None, frame_interval: float = 0.1,
+                 render: Optional[Callable[[float], Any]] = None, duration: Optional[float] = None,
+                 on_finish: Optional[Callable[[], None]] = None):
+        self.frames = frames
+        self.frame_interval = max(frame_interval, 0.01)
+        self.render = render
+        self.duration = duration
+        self.on_finish = on_finish
+        self.started = time.monotonic()
+        self.finished = threading.Event()
+        self._last_index = -1
+        self._finish_lock = threading.Lock()
+        self._finalized = False
+    
+    def current(self, now: float) -> Tuple[Any, bool]:
+        """Return the renderable for `now` and whether it changed since the last tick."""
+        elapsed = now - self.started
+        if self.frames:
+            index = int(elapsed / self.frame_interval) % len(self.frames)
+            changed = index != self._last_index
+            self._last_index = index
+            return self.frames[index], changed
+        return self.render(elapsed), True
+    
+    def expired(self, now: float) -> bool:
+        return self.duration is not None and now - self.started >= self.duration
+    
+    def finish(self):
+        """Run `on_finish` exactly once, then mark the widget finished."""
+        with self._finish_lock:
+            if self._finalized:
+                return
+            self._finalized = True
+        if self.on_finish:
+            self.on_finish()
+        self.finished.set()
+
+
+class RenderScheduler:
+    """One long-lived render loop multiplexing every active status widget.
+    
+    Loaders and effects register widgets instead of starting their own thread
+    and Live display, so nested or parallel loaders (e.g. one per download)
+    share a single transient Live region refreshed at a capped frame rate.
+    """
+    
+    def __init__(self, console: Console, max_fps: float = 12.0):
+        self.console = console
+        self.frame_interval = 1.0 / max(max_fps, 1.0)
+        self._widgets: List[StatusWidget] = []
+        self._lock = threading.Lock()
+        self._wake = threading.Event()
+        self._idle = threading.Event()
+        self._idle.set()
+        self._thread: Optional[threading.Thread] = None
+    
+    def add(self, widget: StatusWidget) -> StatusWidget:
+        """Start drawing a widget."""
+        with self._lock:
+            self._widgets.append(widget)
+            self._idle.clear()
+            if self._thread is None:
+                self._thread = threading.Thread(target=self._loop, name="zen-render", daemon=True)
+                self._thread.start()
+        self._wake.set()
+        return widget
+    
+    def remove(self, widget: StatusWidget, wait: float = 1.0):
+        """Stop drawing a widget; if it was the last one, wait for the display to clear."""
+        with self._lock:
+            if widget in self._widgets:
+                self._widgets.remove(widget)
+            last = not self._widgets
+        self._wake.set()
+        if last:
+            self._idle.wait(timeout=wait)
+    
+    def active(self) -> List[StatusWidget]:
+        with self._lock:
+            return list(self._widgets)
+    
+    def _loop(self):
+        from rich.console import Group
+        from rich.live import Live
+        
+        while True:
+            self._wake.wait()
+            self._wake.clear()
+            if not self.active():
+                self._idle.set()
+                continue
+            
+            with Live(console=self.console, auto_refresh=False, transient=True) as live:
+                shown: List[StatusWidget] = []
+                while True:
+                    now = time.monotonic()
+                    for widget in self.active():
+                        if widget.expired(now):
+                            self.remove(widget, wait=0)
+                            widget.finish()
+                    widgets = self.active()
+                    if not widgets:
+                        break
+                    
+                    renderables, changed = [], widgets != shown
+                    for widget in widgets:
+                        renderable, widget_changed = widget.current(now)
+                        renderables.append(renderable)
+                        changed = changed or widget_changed
+                    if changed:
+                        live.update(Group(*renderables), refresh=True)
+                        shown = widgets
+                    
+                    self._wake.wait(self.frame_interval)
+                    self._wake.clear()
+            
+            with self._lock:
+                if not self._widgets:
+                    self._idle.set()
+            # Widgets added while the display was closing start a new one
+            if self.active():
+                self._wake.set()
+
+
+class DownloadProgress:
+    """Transfer listener that drives a rich Progress view from real byte counts.
+    
+    Shows one row per file being downloaded plus an aggregate row, each with
+    size, throughput and ETA, so slow mirrors and stragglers stand out.
+    """
+    
+    def __init__(self, description: str):
+        from rich.progress import (
+            BarColumn, DownloadColumn, Progress, TextColumn, TimeRemainingColumn, TransferSpeedColumn
+        )
+        
+        self.progress = Progress(
+            TextColumn("[progress.description]{task.description}"),
+            BarColumn(bar_width=30),
+            DownloadColumn(),
+            TransferSpeedColumn(),
+            TimeRemainingColumn(),
+            auto_refresh=False,
+        )
+        self.header = Text.from_markup(f"[cyan]{description}[/cyan]", overflow="ellipsis")
+        self.header.no_wrap = True
+        self.total_task = self.progress.add_task("[bold cyan]Total[/bold cyan]", total=0)
+        self._tasks = {}  # url -> [task id, declared size or None, bytes read]
+        self._aggregate_total = 0
+        self._lock = threading.Lock()
+    
+    def started(self, url: str, total: Optional[int]):
+        name = url.rstrip("/").rsplit("/", 1)[-1] or url
+        if len(name) > 28:
+            name = name[:27] + "…"
+        with self._lock:
+            self._tasks[url] = [self.progress.add_task(f"  {name}", total=total), total, 0]
+            if total:
+                self._aggregate_total += total
+                self.progress.update(self.total_task, total=self._aggregate_total)
+    
+    def advanced(self, url: str, size: int):
+        with self._lock:
+            entry = self._tasks.get(url)
+            if entry is not None:
+                entry[2] += size
+                self.progress.advance(entry[0], size)
+            self.progress.advance(self.total_task, size)
+    
+    def finished(self, url: str):
+        with self._lock:
+            entry = self._tasks.get(url)
+            if entry is not None and entry[1] is None:
+                # Unknown sizes become complete once the body has been read
+                task, _, read = entry
+                self.progress.update(task, total=read, completed=read)
+                self._aggregate_total += read
+                self.progress.update(self.total_task, total=self._aggregate_total)
+    
+    def __rich__(self):
+        from rich.console import Group
+        return Group(self.header, self.progress.get_renderable())
+
+
 class ZeniveLogger:
     """Custom logger for Zenive with rich formatting and beautiful animations."""
     
@@ -168,10 +362,71 @@ class ZeniveLogger:
         self.wave_anim = WaveAnimation()
         self.pulse_anim = PulseAnimation()
         
-        # Animation state
-        self._current_spinner = None
-        self._animation_thread = None
-        self._stop_animation = False
+        # Animation state: one shared render loop for every loader and effect
+        self._scheduler: Optional[RenderScheduler] = None
+        self._effects_enabled: Optional[bool] = None
+        self._background_effects: List[StatusWidget] = []
+        self._atexit_registered = False
+        
+        # Seconds the calling thread spent blocked on UI effects
+        self.ui_time = 0.0
+    
+    def effects_enabled(self) -> bool:
+        """Whether animated effects should run at all.
+        
+        Effects are skipped when output is not an interactive terminal (pipes,
+        files, CI logs) or when running under CI, where they only add latency.
+        """
+        if self._effects_enabled is None:
+            in_ci = any(os.environ.get(var) for var in _CI_ENV_VARS)
+            self._effects_enabled = self.console.is_terminal and not in_ci
+        return self._effects_enabled
+    
+    @contextmanager
+    def _ui_timer(self):
+        """Accumulate time the caller spends blocked on UI into `ui_time`."""
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.ui_time += time.perf_counter() - start
+    
+    @property
+    def scheduler(self) -> RenderScheduler:
+        """The shared render loop, created on first use."""
+        if self._scheduler is None:
+            config = get_animation_config()
+            self._scheduler = RenderScheduler(self.console, max_fps=getattr(config, "max_fps", 12.0))
+        return self._scheduler
+    
+    def _run_in_background(self, widget: StatusWidget):
+        """Draw an effect widget that is cut short at process exit."""
+        self._background_effects.append(widget)
+        if not self._atexit_registered:
+            atexit.register(self.finish_effects)
+            self._atexit_registered = True
+        self.scheduler.add(widget)
+    
+    def finish_effects(self, timeout: float = 0.2):
+        """Stop background effects, printing each one's final state."""
+        with self._ui_timer():
+            effects, self._background_effects = self._background_effects, []
+            for widget in effects:
+                self.scheduler.remove(widget, wait=timeout)
+                widget.finish()
+    
+    @contextmanager
+    def _status(self, widget: StatusWidget):
+        """Draw a widget for the duration of a with-block."""
+        self.scheduler.add(widget)
+        try:
+            yield widget
+        except Exception as e:
+            self.error(f"Failed: {e}")
+            raise
+        finally:
+            with self._ui_timer():
+                self.scheduler.remove(widget)
     
     def info(self, message: str, **kwargs):
         """Log info message with rich formatting."""
@@ -208,132 +463,92 @@ class ZeniveLogger:
     @contextmanager
     def spinner(self, message: str, spinner_style: str = "dots"):
         """Context manager for showing a spinner during operations."""
-        with self.console.status(f"[cyan]{message}[/cyan]", spinner=spinner_style) as status:
-            try:
-                yield status
-            except Exception as e:
-                self.error(f"Failed: {e}")
-                raise
+        from rich.spinner import Spinner
+        
+        spinner = Spinner(spinner_style, text=Text.from_markup(f"[cyan]{message}[/cyan]"))
+        with self._status(StatusWidget(render=lambda elapsed: spinner)) as widget:
+            yield widget
+    
+    def _loader_frames(self, lines: List[str], border_style: str) -> List[Panel]:
+        """Precompute one panel per animation frame so drawing a frame costs nothing."""
+        return [
+            Panel(Align.center(Text.from_markup(line)), border_style=border_style, box=ROUNDED)
+            for line in lines
+        ]
     
     @contextmanager
     def connection_loader(self, message: str):
         """Context manager for showing elegant connecting lines animation."""
         config = get_animation_config()
         
+        if not self.effects_enabled():
+            # Nothing to animate for pipes and CI logs
+            yield
+            return
+        
         if not config.enable_animations or not config.enable_connection_loader:
             # Fallback to simple spinner
             with self.spinner(message):
                 yield
             return
         
-        self._stop_animation = False
-        
-        def animate():
-            with Live(console=self.console, refresh_per_second=8) as live:
-                while not self._stop_animation:
-                    connection_frame = self.connection_anim.get_next_frame()
-                    content = f"[{config.primary_color}]{message}[/{config.primary_color}]\n\n[bold blue]{connection_frame}[/bold blue]"
-                    panel = Panel(
-                        Align.center(content),
-                        border_style=config.primary_color,
-                        box=ROUNDED
-                    )
-                    live.update(panel)
-                    time.sleep(0.15)
-        
-        self._animation_thread = threading.Thread(target=animate)
-        self._animation_thread.daemon = True
-        self._animation_thread.start()
-        
-        try:
+        frames = self._loader_frames(
+            [f"[{config.primary_color}]{message}[/{config.primary_color}]\n\n[bold blue]{frame}[/bold blue]"
+             for frame in self.connection_anim.frames],
+            config.primary_color,
+        )
+        with self._status(StatusWidget(frames, frame_interval=config.connection_speed)):
             yield
-        except Exception as e:
-            self.error(f"Failed: {e}")
-            raise
-        finally:
-            self._stop_animation = True
-            if self._animation_thread:
-                self._animation_thread.join(timeout=1)
     
     @contextmanager
     def wave_loader(self, message: str):
         """Context manager for showing wave animation during operations."""
         config = get_animation_config()
         
+        if not self.effects_enabled():
+            # Nothing to animate for pipes and CI logs
+            yield
+            return
+        
         if not config.enable_animations or not config.enable_wave_loader:
             # Fallback to simple spinner
             with self.spinner(message):
                 yield
             return
         
-        self._stop_animation = False
-        
-        def animate():
-            with Live(console=self.console, refresh_per_second=8) as live:
-                while not self._stop_animation:
-                    wave_frame = self.wave_anim.get_next_frame()
-                    content = f"[{config.primary_color}]{message}[/{config.primary_color}]\n\n[bold {config.success_color}]{wave_frame}[/bold {config.success_color}]"
-                    panel = Panel(
-                        Align.center(content),
-                        border_style=config.success_color,
-                        box=ROUNDED
-                    )
-                    live.update(panel)
-                    time.sleep(config.wave_speed)
-        
-        self._animation_thread = threading.Thread(target=animate)
-        self._animation_thread.daemon = True
-        self._animation_thread.start()
-        
-        try:
+        color = config.success_color
+        frames = self._loader_frames(
+            [f"[{config.primary_color}]{message}[/{config.primary_color}]\n\n[bold {color}]{frame}[/bold {color}]"
+             for frame in self.wave_anim.frames],
+            color,
+        )
+        with self._status(StatusWidget(frames, frame_interval=config.wave_speed)):
             yield
-        except Exception as e:
-            self.error(f"Failed: {e}")
-            raise
-        finally:
-            self._stop_animation = True
-            if self._animation_thread:
-                self._animation_thread.join(timeout=1)
     
     @contextmanager
     def pulse_loader(self, message: str):
         """Context manager for showing pulse animation during operations."""
         config = get_animation_config()
         
+        if not self.effects_enabled():
+            # Nothing to animate for pipes and CI logs
+            yield
+            return
+        
         if not config.enable_animations or not config.enable_pulse_loader:
             # Fallback to simple spinner
             with self.spinner(message):
                 yield
             return
         
-        self._stop_animation = False
-        
-        def animate():
-            with Live(console=self.console, refresh_per_second=6) as live:
-                while not self._stop_animation:
-                    pulse_frame = self.pulse_anim.get_next_frame()
-                    content = f"[bold {config.warning_color}]{pulse_frame}[/bold {config.warning_color}] [{config.primary_color}]{message}[/{config.primary_color}] [bold {config.warning_color}]{pulse_frame}[/bold {config.warning_color}]"
-                    panel = Panel(
-                        Align.center(content),
-                        border_style=config.warning_color,
-                        box=ROUNDED
-                    )
-                    live.update(panel)
-                    time.sleep(config.pulse_speed)
-        
-        self._animation_thread = threading.Thread(target=animate)
-        self._animation_thread.daemon = True
-        self._animation_thread.start()
-        
-        try:
+        color = getattr(config, "warning_color", "yellow")
+        frames = self._loader_frames(
+            [f"[bold {color}]{frame}[/bold {color}] [{config.primary_color}]{message}[/{config.primary_color}] [bold {color}]{frame}[/bold {color}]"
+             for frame in self.pulse_anim.frames],
+            color,
+        )
+        with self._status(StatusWidget(frames, frame_interval=config.pulse_speed)):
             yield
-        except Exception as e:
-            self.error(f"Failed: {e}")
-            raise
-        finally:
-            self._stop_animation = True
-            if self._animation_thread:
-                self._animation_thread.join(timeout=1)
     
     def show_banner(self, title: str, subtitle: str = None):
         """Show a clean, professional banner."""
@@ -356,31 +571,44 @@ class ZeniveLogger:
     
     def show_animated_banner(self, title: str, subtitle: str = None):
         """Show an animated banner with typewriter effect."""
-        self.console.print()
-        
-        # Typewriter effect for title
-        title_text = Text()
-        for char in title:
-            title_text.append(char, style="bold cyan")
-            self.console.print(Align.center(title_text), end="\r")
-            time.sleep(0.05)
-        
-        self.console.print()
-        
-        if subtitle:
-            time.sleep(0.3)
-            subtitle_text = Text()
-            for char in subtitle:
-                subtitle_text.append(char, style="dim")
-                self.console.print(Align.center(subtitle_text), end="\r")
-                time.sleep(0.03)
+        config = get_animation_config()
+        if not self.effects_enabled() or not config.enable_typewriter_effect:
+            # Same banner without the per-character sleeps
             self.console.print()
+            self.console.print(Align.center(Text(title, style="bold cyan")))
+            if subtitle:
+                self.console.print(Align.center(Text(subtitle, style="dim")))
+            self.console.print()
+            return
         
-        self.console.print()
+        with self._ui_timer():
+            self.console.print()
+            
+            # Typewriter effect for title
+            title_text = Text()
+            for char in title:
+                title_text.append(char, style="bold cyan")
+                self.console.print(Align.center(title_text), end="\r")
+                time.sleep(0.05)
+            
+            self.console.print()
+            
+            if subtitle:
+                time.sleep(0.3)
+                subtitle_text = Text()
+                for char in subtitle:
+                    subtitle_text.append(char, style="dim")
+                    self.console.print(Align.center(subtitle_text), end="\r")
+                    time.sleep(0.03)
+                self.console.print()
+            
+            self.console.print()
     
     def show_component_info(self, name: str, version: str, description: str, 
                           category: str, dependencies: list, files_count: int):
         """Show component information in a beautiful format with enhanced styling."""
+        from rich.table import Table
+        
         # Create a beautiful info table
         table = Table(show_header=False, box=None, padding=(0, 1))
         table.add_column("Label", style="bold yellow", width=12)
@@ -405,14 +633,21 @@ class ZeniveLogger:
         self.console.print(panel)
     
     def show_success_summary(self, component: str, files_installed: int, 
-                           dependencies_added: int, install_path: str):
+                           dependencies_added: int, install_path: str,
+                           files_unchanged: int = 0, files_conflicting: int = 0):
         """Show installation success summary with clean, professional styling."""
+        from rich.table import Table
+        
         # Create success table
         table = Table(show_header=False, box=None, padding=(0, 1))
         table.add_column("Icon", width=3)
         table.add_column("Info", style="white")
         
         table.add_row("📁", f"[cyan]Files installed:[/cyan] [bold white]{files_installed}[/bold white]")
+        if files_unchanged:
+            table.add_row("💤", f"[cyan]Files unchanged:[/cyan] [bold white]{files_unchanged}[/bold white]")
+        if files_conflicting:
+            table.add_row("⚠️", f"[cyan]Files conflicting:[/cyan] [bold yellow]{files_conflicting}[/bold yellow]")
         table.add_row("📦", f"[cyan]Dependencies added:[/cyan] [bold white]{dependencies_added}[/bold white]")
         table.add_row("📍", f"[cyan]Install path:[/cyan] [dim]{install_path}[/dim]")
         
@@ -420,6 +655,8 @@ class ZeniveLogger:
         header = f"[bold green]✓ Successfully installed {component}[/bold green]"
         
         footer = "\n[dim]Component is ready to use[/dim]"
+        if files_conflicting > 0:
+            footer += "\n[dim]💡 Conflicting files were kept; use --overwrite to replace them[/dim]"
         if dependencies_added > 0:
             footer += "\n[dim]💡 Run 'pip install -r requirements.txt' to install new dependencies[/dim]"
         
@@ -443,8 +680,28 @@ class ZeniveLogger:
         self.console.print(final_panel)
         self.console.print()
     
+    @contextmanager
+    def download_progress(self, description: str = "Downloading"):
+        """Context manager showing per-file and aggregate download progress.
+        
+        Every response body read through the pooled HTTP session inside the
+        block is reported with real byte counts. Outside interactive terminals
+        nothing is drawn.
+        """
+        if not self.effects_enabled():
+            yield None
+            return
+        
+        from zen.core.http import transfer_listener
+        
+        listener = DownloadProgress(description)
+        with transfer_listener(listener), self._status(StatusWidget(render=lambda elapsed: listener)):
+            yield listener
+    
     def show_progress_bar(self, total: int, description: str = "Processing"):
         """Show a beautiful progress bar."""
+        from rich.progress import Progress, SpinnerColumn, TextColumn, BarColumn, TaskProgressColumn
+        
         return Progress(
             SpinnerColumn(),
             TextColumn("[progress.description]{task.description}"),
@@ -461,59 +718,92 @@ class ZeniveLogger:
     
     def show_loading_dots(self, message: str, duration: float = 2.0):
         """Show animated loading dots."""
-        dots = ""
-        start_time = time.time()
+        if not self.effects_enabled():
+            self.console.print(f"[green]{message}... Done![/green]")
+            return
         
-        while time.time() - start_time < duration:
-            for i in range(4):
-                dots = "." * i
-                self.console.print(f"\r[cyan]{message}{dots}[/cyan]   ", end="")
-                time.sleep(0.3)
+        with self._ui_timer():
+            dots = ""
+            start_time = time.time()
+            
+            while time.time() - start_time < duration:
+                for i in range(4):
+                    dots = "." * i
+                    self.console.print(f"\r[cyan]{message}{dots}[/cyan]   ", end="")
+                    time.sleep(0.3)
+            
+            self.console.print(f"\r[green]{message}... Done![/green]")
+    
+    def show_matrix_transition(self, message: str, duration: float = 1.5, block: bool = False,
+                               then: Optional[Callable[[], None]] = None):
+        """Show a single line matrix effect that transitions to actual content.
+        
+        By default the effect renders on a background thread and this returns
+        immediately; it is cut short (showing the final message) when the
+        process exits, so it never delays exit. Outside interactive terminals
+        only the final message is printed.
+        
+        Args:
+            message: Message revealed at the end of the effect
+            duration: Full length of the effect in seconds
+            block: Wait for the effect to finish before returning
+            then: Called right after the final message is printed, so output
+                  that belongs after the effect (e.g. a summary) stays in order
+                  even though the effect finishes in the background
+        """
+        def finish():
+            self.console.print(f"[cyan]{message}[/cyan]")
+            if then is not None:
+                then()
+        
+        config = get_animation_config()
+        if not self.effects_enabled() or not getattr(config, "enable_matrix_transitions", True):
+            finish()
+            return
         
-        self.console.print(f"\r[green]{message}... Done![/green]")
-    
-    def show_matrix_transition(self, message: str, duration: float = 1.5):
-        """Show a single line matrix effect that transitions to actual content."""
         chars = "01"
         width = len(message) + 10
+        matrix_duration = duration * 0.6
+        transition_duration = duration * 0.4
         
-        with Live(console=self.console, refresh_per_second=15) as live:
-            # Matrix phase - single line of random characters
-            matrix_duration = duration * 0.6
-            start_time = time.time()
-            
-            while time.time() - start_time < matrix_duration:
+        def render(elapsed: float) -> str:
+            if elapsed < matrix_duration:
+                # Matrix phase - single line of random characters
                 matrix_line = "".join(random.choice(chars) for _ in range(width))
-                live.update(f"[green]{matrix_line}[/green]")
-                time.sleep(0.067)
-            
+                return f"[green]{matrix_line}[/green]"
             # Transition phase - gradually replace with actual message
-            transition_duration = duration * 0.4
-            start_time = time.time()
-            
-            while time.time() - start_time < transition_duration:
-                progress = (time.time() - start_time) / transition_duration
-                reveal_length = int(len(message) * progress)
-                
-                revealed = message[:reveal_length]
-                remaining_matrix = "".join(random.choice(chars) for _ in range(width - len(revealed)))
-                
-                content = f"[cyan]{revealed}[/cyan][green]{remaining_matrix}[/green]"
-                live.update(content)
-                time.sleep(0.05)
-            
-            # Final message
-            live.update(f"[cyan]{message}[/cyan]")
-            time.sleep(0.3)
+            progress = min((elapsed - matrix_duration) / transition_duration, 1.0) if transition_duration else 1.0
+            revealed = message[:int(len(message) * progress)]
+            remaining_matrix = "".join(random.choice(chars) for _ in range(width - len(revealed)))
+            return f"[cyan]{revealed}[/cyan][green]{remaining_matrix}[/green]"
+        
+        widget = StatusWidget(
+            render=render,
+            duration=duration,
+            # Final message (and what follows it) stays once the transient effect is gone
+            on_finish=finish,
+        )
+        if block:
+            with self._ui_timer():
+                self.scheduler.add(widget)
+                widget.finished.wait()
+        else:
+            self._run_in_background(widget)
     
     def animate_text(self, text: str, delay: float = 0.05):
         """Animate text character by character with typewriter effect."""
-        animated_text = Text()
-        for char in text:
-            animated_text.append(char)
-            self.console.print(animated_text, end="\r")
-            time.sleep(delay)
-        self.console.print()  # New line at the end
+        config = get_animation_config()
+        if not self.effects_enabled() or not config.enable_typewriter_effect:
+            self.console.print(text)
+            return
+        
+        with self._ui_timer():
+            animated_text = Text()
+            for char in text:
+                animated_text.append(char)
+                self.console.print(animated_text, end="\r")
+                time.sleep(delay)
+            self.console.print()  # New line at the end
     
     def rainbow_text(self, text: str):
         """Display text with rainbow colors."""
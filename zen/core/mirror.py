@@ -0,0 +1,116 @@
+"""
+Local mirror and offline mode for zen.
+
+A mirror is a plain directory tree laid out as ``<root>/<host>/<path>``, one
+file per fetched URL. When ``ZEN_MIRROR`` points at a mirror, every http(s)
+fetch is served from it first. In offline mode (``--offline`` or
+``ZEN_OFFLINE=1``) anything missing from the mirror must come from the fetch
+cache; no network request is ever made.
+"""
+
+import os
+import shutil
+import tempfile
+import threading
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Optional
+from urllib.parse import urlparse
+
+_TRUTHY = ("1", "true", "yes")
+
+# Explicit offline override set by the CLI; None defers to ZEN_OFFLINE
+_offline: Optional[bool] = None
+# Mirror that every successful fetch is written into (see `recording`)
+_recording: Optional["Mirror"] = None
+_recording_lock = threading.Lock()
+
+
+class Mirror:
+    """A directory tree holding one file per mirrored URL."""
+
+    def __init__(self, root: Path):
+        self.root = Path(root).expanduser().resolve()
+
+    def path_for(self, url: str) -> Optional[Path]:
+        """Location of a URL inside the mirror, or None for non-http(s) URLs."""
+        parsed = urlparse(url)
+        if parsed.scheme not in ("http", "https") or not parsed.netloc:
+            return None
+        parts = [p for p in parsed.path.split("/") if p and p not in (".", "..")]
+        if not parts:
+            return None
+        # "host:port" is not a valid directory name everywhere
+        host = parsed.netloc.lower().replace(":", "_")
+        return self.root.joinpath(host, *parts)
+
+    def read(self, url: str) -> Optional[bytes]:
+        """Return the mirrored body of a URL, if present."""
+        path = self.path_for(url)
+        if path is None:
+            return None
+        try:
+            return path.read_bytes()
+        except OSError:
+            return None
+
+    def write(self, url: str, data: bytes):
+        """Store a URL's body in the mirror atomically."""
+        self._store(url, lambda tmp: Path(tmp).write_bytes(data))
+
+    def write_file(self, url: str, source: Path):
+        """Store a URL's body that is already on disk, copying file to file."""
+        self._store(url, lambda tmp: shutil.copyfile(source, tmp))
+
+    def _store(self, url: str, fill):
+        """Create a URL's mirror file via `fill(tmp_path)` and rename it into place."""
+        path = self.path_for(url)
+        if path is None:
+            return
+        path.parent.mkdir(parents=True, exist_ok=True)
+        fd, tmp = tempfile.mkstemp(dir=str(path.parent), prefix=".tmp-")
+        try:
+            os.close(fd)
+            fill(tmp)
+            os.replace(tmp, path)
+        except BaseException:
+            if os.path.exists(tmp):
+                os.unlink(tmp)
+            raise
+
+
+def set_offline_mode(offline: Optional[bool]):
+    """Force offline mode on or off; None falls back to ZEN_OFFLINE."""
+    global _offline
+    _offline = offline
+
+
+def is_offline() -> bool:
+    """Whether network access is forbidden."""
+    if _offline is not None:
+        return _offline
+    return os.environ.get("ZEN_OFFLINE", "").lower() in _TRUTHY
+
+
+def get_mirror() -> Optional[Mirror]:
+    """The mirror configured through ZEN_MIRROR, if any."""
+    root = os.environ.get("ZEN_MIRROR")
+    return Mirror(Path(root)) if root else None
+
+
+def get_recording_mirror() -> Optional[Mirror]:
+    """The mirror currently being populated, if any."""
+    return _recording
+
+
+@contextmanager
+def recording(mirror: Mirror):
+    """Write every URL fetched inside this block into `mirror`."""
+    global _recording
+    with _recording_lock:
+        previous, _recording = _recording, mirror
+    try:
+        yield mirror
+    finally:
+        with _recording_lock:
+            _recording = previous
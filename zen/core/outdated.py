@@ -0,0 +1,102 @@
+"""
+Upstream version checks for installed components.
+
+`check_versions` fetches the ``component.json`` of every installed component
+concurrently - no file bodies - through the pooled session and the fetch
+cache. Cached copies are revalidated with conditional requests, so
+components that did not change upstream cost a 304 each.
+"""
+
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from dataclasses import dataclass
+from typing import Dict, List, Optional
+
+from zen.core.cache import revalidating
+from zen.schemas.component import ComponentSchema, _default_fetch_concurrency, load_component_from_url
+
+
+def compare_versions(installed: str, latest: str) -> int:
+    """
+    Compare two versions: negative if `installed` is older, 0 if equal, positive if newer.
+
+    Uses PEP 440 ordering (which covers semantic versions); versions it cannot
+    parse are only told apart by equality.
+    """
+    from packaging.version import InvalidVersion, Version
+
+    try:
+        a, b = Version(installed), Version(latest)
+    except InvalidVersion:
+        return 0 if installed == latest else -1
+    return (a > b) - (a < b)
+
+
+@dataclass
+class VersionCheck:
+    """An installed component next to its upstream counterpart."""
+
+    name: str
+    installed: str
+    source: Optional[str]
+    # None when the upstream component could not be loaded
+    component: Optional[ComponentSchema] = None
+    error: Optional[str] = None
+
+    @property
+    def latest(self) -> Optional[str]:
+        return self.component.version if self.component is not None else None
+
+    @property
+    def status(self) -> str:
+        """One of "outdated", "up-to-date", "ahead" (installed is newer) or "error"."""
+        if self.component is None:
+            return "error"
+        order = compare_versions(self.installed, self.latest)
+        if order < 0:
+            return "outdated"
+        return "ahead" if order > 0 else "up-to-date"
+
+    @property
+    def outdated(self) -> bool:
+        return self.status == "outdated"
+
+
+def check_versions(components: Dict[str, dict], max_workers: Optional[int] = None) -> List[VersionCheck]:
+    """
+    Load the upstream definition of installed components, concurrently.
+
+    Unlike `load_components_from_urls`, one failing source does not stop the
+    others: its error is reported on its VersionCheck.
+
+    Args:
+        components: Installed component records by name, as in .zen/config.yaml
+        max_workers: Maximum number of definitions fetched at once
+
+    Returns:
+        One VersionCheck per component, sorted by name
+    """
+    checks = {
+        name: VersionCheck(name=name, installed=str(record.get("version", "unknown")), source=record.get("source"))
+        for name, record in components.items()
+    }
+    pending = [check for check in checks.values() if check.source]
+    for check in checks.values():
+        if not check.source:
+            check.error = "no source recorded"
+    if not pending:
+        return [checks[name] for name in sorted(checks)]
+
+    def load(source: str) -> ComponentSchema:
+        # Only component.json: never the archive or any file body
+        return load_component_from_url(source, archive=False, fetch_files=False)
+
+    workers = min(max_workers or _default_fetch_concurrency(), len(pending))
+    with revalidating(), ThreadPoolExecutor(max_workers=workers, thread_name_prefix="zen-outdated") as executor:
+        futures = {executor.submit(load, check.source): check for check in pending}
+        for future in as_completed(futures):
+            check = futures[future]
+            try:
+                check.component = future.result()
+            except Exception as e:
+                check.error = str(e)
+    return [checks[name] for name in sorted(checks)]
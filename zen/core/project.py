@@ -0,0 +1,271 @@
+"""
+Project state (``.zen/config.yaml``) for zen.
+
+`ProjectState` parses the project config once per process - with libyaml's
+``CSafeLoader`` / ``CSafeDumper`` when PyYAML was built with it - and only
+re-parses it when the file changes on disk. Mutations are collected and
+written in a single atomic rename. Read-modify-write cycles hold an exclusive
+lock on ``.zen/config.lock``, so concurrent ``zen`` processes merge their
+changes instead of clobbering each other.
+"""
+
+import os
+import tempfile
+import threading
+from contextlib import contextmanager
+from pathlib import Path
+from typing import TYPE_CHECKING, Callable, Dict, Optional, Tuple
+
+try:
+    import fcntl
+except ImportError:  # Windows
+    fcntl = None
+try:
+    import msvcrt
+except ImportError:  # POSIX
+    msvcrt = None
+
+if TYPE_CHECKING:
+    from zen.core.project_index import ProjectIndex
+
+# Relative to the project root
+CONFIG_PATH = Path(".zen") / "config.yaml"
+LOCK_PATH = Path(".zen") / "config.lock"
+
+# Marks a component removed in `ProjectState._pending`
+_REMOVED = object()
+
+
+def _yaml():
+    """PyYAML plus the fastest safe loader and dumper it provides."""
+    # Imported lazily to keep CLI start-up fast
+    import yaml
+    loader = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+    dumper = getattr(yaml, "CSafeDumper", yaml.SafeDumper)
+    return yaml, loader, dumper
+
+
+def load_config(text: Optional[str]) -> dict:
+    """Parse config.yaml content; empty content yields an empty config."""
+    yaml, loader, _ = _yaml()
+    return yaml.load(text or "", Loader=loader) or {}
+
+
+def dump_config(config: dict) -> str:
+    """Serialize a project config the way zen has always written it."""
+    yaml, _, dumper = _yaml()
+    return yaml.dump(config, Dumper=dumper, default_flow_style=False, indent=2)
+
+
+class FileLock:
+    """Exclusive advisory lock on a file (``fcntl`` on POSIX, ``msvcrt`` on Windows).
+
+    Reentrant within a process. Where neither is available locking is a no-op.
+    """
+
+    def __init__(self, path: Path):
+        self.path = Path(path)
+        self._fd: Optional[int] = None
+        self._depth = 0
+        self._lock = threading.RLock()
+
+    def acquire(self):
+        self._lock.acquire()
+        self._depth += 1
+        if self._depth > 1 or not self.path.parent.is_dir():
+            # Already held, or no project to protect yet
+            return
+        fd = os.open(self.path, os.O_RDWR | os.O_CREAT, 0o644)
+        try:
+            if fcntl is not None:
+                fcntl.flock(fd, fcntl.LOCK_EX)
+            elif msvcrt is not None:
+                while True:
+                    try:
+                        # LK_LOCK gives up after ~10 seconds of retries
+                        msvcrt.locking(fd, msvcrt.LK_LOCK, 1)
+                        break
+                    except OSError:
+                        continue
+        except BaseException:
+            os.close(fd)
+            self._depth -= 1
+            self._lock.release()
+            raise
+        self._fd = fd
+
+    def release(self):
+        self._depth -= 1
+        try:
+            if self._depth == 0 and self._fd is not None:
+                fd, self._fd = self._fd, None
+                try:
+                    if fcntl is not None:
+                        fcntl.flock(fd, fcntl.LOCK_UN)
+                    elif msvcrt is not None:
+                        os.lseek(fd, 0, os.SEEK_SET)
+                        msvcrt.locking(fd, msvcrt.LK_UNLCK, 1)
+                finally:
+                    os.close(fd)
+        finally:
+            self._lock.release()
+
+    def __enter__(self) -> "FileLock":
+        self.acquire()
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.release()
+        return False
+
+
+class ProjectState:
+    """In-memory view of a project's ``.zen/config.yaml`` with batched, locked writes."""
+
+    def __init__(self, project_root: Path):
+        self.project_root = Path(project_root).resolve()
+        self.config_path = self.project_root / CONFIG_PATH
+        self.lock = FileLock(self.project_root / LOCK_PATH)
+        self._config: Optional[dict] = None
+        # (mtime_ns, size) of the file `_config` was parsed from
+        self._stamp: Optional[Tuple[int, int]] = None
+        # component name -> new record, or _REMOVED
+        self._pending: Dict[str, object] = {}
+        self._batch_depth = 0
+        self._index = None
+
+    @property
+    def exists(self) -> bool:
+        """Whether the project has been initialized."""
+        return self.config_path.exists()
+
+    @property
+    def config(self) -> dict:
+        """The parsed config, re-read only when the file changed since it was last parsed."""
+        stamp = self._file_stamp()
+        if self._config is None or stamp != self._stamp:
+            if stamp is None:
+                self._config = {}
+            else:
+                with open(self.config_path, "r", encoding="utf-8") as f:
+                    self._config = load_config(f.read())
+            self._stamp = stamp
+        return self._config
+
+    @property
+    def index(self) -> "ProjectIndex":
+        """SQLite side index for reading components without parsing the config."""
+        if self._index is None:
+            # Imported lazily: zen.core.project_index depends on this module
+            from zen.core.project_index import ProjectIndex
+            self._index = ProjectIndex(self.project_root)
+        return self._index
+
+    @property
+    def components(self) -> Dict[str, dict]:
+        """Installed components by name, including changes not written yet."""
+        components = dict(self.config.get("components") or {})
+        for name, record in self._pending.items():
+            if record is _REMOVED:
+                components.pop(name, None)
+            else:
+                components[name] = record
+        return components
+
+    def get_component(self, name: str) -> Optional[dict]:
+        """A component's record, or None when it is not installed."""
+        return self.components.get(name)
+
+    def update_components(self, records: Dict[str, dict]):
+        """Add or replace component records."""
+        with self.batch():
+            self._pending.update(records)
+
+    def remove_component(self, name: str):
+        """Drop a component's record."""
+        with self.batch():
+            self._pending[name] = _REMOVED
+
+    @contextmanager
+    def batch(self, write: Optional[Callable[[Path, str], None]] = None):
+        """
+        Hold the project lock and write every mutation made in the block at once.
+
+        Nested batches join the outermost one. The config is re-read on entry
+        if another process changed it, and pending mutations are discarded if
+        the block raises.
+
+        Args:
+            write: Writer for the rendered config (e.g. one staging it in an
+                   install transaction); defaults to an atomic write
+        """
+        with self.lock:
+            self._batch_depth += 1
+            try:
+                yield self
+                if self._batch_depth == 1:
+                    self.flush(write)
+            finally:
+                self._batch_depth -= 1
+                if self._batch_depth == 0:
+                    self._pending.clear()
+
+    def flush(self, write: Optional[Callable[[Path, str], None]] = None):
+        """Write pending mutations, if any, merged into the latest config on disk."""
+        if not self._pending:
+            return
+        with self.lock:
+            config = dict(self.config)
+            config["components"] = self.components
+            self._pending.clear()
+            self.replace(config, write)
+
+    def replace(self, config: dict, write: Optional[Callable[[Path, str], None]] = None):
+        """Write a whole config."""
+        text = dump_config(config)
+        with self.lock:
+            if write is not None:
+                write(self.config_path, text)
+                # Not on disk until the caller commits it: parse again on next access
+                self._config = self._stamp = None
+                return
+            _atomic_write(self.config_path, text)
+            self._config, self._stamp = config, self._file_stamp()
+
+    def _file_stamp(self) -> Optional[Tuple[int, int]]:
+        try:
+            st = self.config_path.stat()
+        except OSError:
+            return None
+        return st.st_mtime_ns, st.st_size
+
+
+def _atomic_write(path: Path, text: str):
+    """Write a file through a temp file and rename, so readers never see it half-written."""
+    path.parent.mkdir(parents=True, exist_ok=True)
+    fd, tmp = tempfile.mkstemp(dir=str(path.parent), prefix=f".{path.name}.", suffix=".tmp")
+    try:
+        # mkstemp creates 0600 files; keep the mode the config had
+        os.chmod(tmp, path.stat().st_mode & 0o777 if path.exists() else 0o644)
+        with os.fdopen(fd, "w", encoding="utf-8") as f:
+            f.write(text)
+        os.replace(tmp, path)
+    except BaseException:
+        if os.path.exists(tmp):
+            os.unlink(tmp)
+        raise
+
+
+# One state per project root and process
+_states: Dict[Path, ProjectState] = {}
+_states_lock = threading.Lock()
+
+
+def get_project_state(project_root: Path = Path(".")) -> ProjectState:
+    """Get or create the shared state for a project."""
+    root = Path(project_root).resolve()
+    with _states_lock:
+        state = _states.get(root)
+        if state is None:
+            state = _states[root] = ProjectState(root)
+    return state
@@ -0,0 +1,140 @@
+"""
+Side index of ``.zen/config.yaml`` for fast reads.
+
+Parsing the whole YAML config to show one component gets slow in projects
+with hundreds of them. `ProjectIndex` keeps a SQLite copy of the components
+section in ``.zen/index.db``: a lookup is a primary-key query and listing
+streams rows straight from a cursor. The index remembers the config's
+mtime, size and SHA-256 and is rebuilt whenever the config changed, so it is
+never consulted stale and can be deleted at any time.
+"""
+
+import hashlib
+import json
+import sqlite3
+from pathlib import Path
+from typing import Iterator, Optional, Tuple
+
+from zen.core.project import CONFIG_PATH, load_config
+
+# Relative to the project root
+INDEX_PATH = Path(".zen") / "index.db"
+# Bump when the layout changes; older indexes are rebuilt from scratch
+SCHEMA_VERSION = 1
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS meta (
+    key TEXT PRIMARY KEY,
+    value TEXT NOT NULL
+);
+CREATE TABLE IF NOT EXISTS components (
+    key TEXT PRIMARY KEY,
+    name TEXT NOT NULL,
+    version TEXT,
+    category TEXT,
+    source TEXT,
+    record TEXT NOT NULL
+);
+"""
+
+
+def _text(value) -> Optional[str]:
+    return None if value is None else str(value)
+
+
+class ProjectIndex:
+    """SQLite index of the components recorded in a project's config."""
+
+    def __init__(self, project_root: Path):
+        self.project_root = Path(project_root).resolve()
+        self.config_path = self.project_root / CONFIG_PATH
+        self.index_path = self.project_root / INDEX_PATH
+        self._conn: Optional[sqlite3.Connection] = None
+
+    def _connect(self) -> sqlite3.Connection:
+        """Open the index, creating or upgrading its tables, and bring it up to date."""
+        if self._conn is None:
+            # isolation_level=None lets us issue explicit BEGIN IMMEDIATE
+            conn = sqlite3.connect(str(self.index_path), timeout=30, isolation_level=None)
+            # The index is rebuildable, so trade fsyncs for speed
+            conn.execute("PRAGMA synchronous = OFF")
+            conn.execute("BEGIN IMMEDIATE")
+            try:
+                if conn.execute("PRAGMA user_version").fetchone()[0] != SCHEMA_VERSION:
+                    conn.execute("DROP TABLE IF EXISTS components")
+                    conn.execute("DROP TABLE IF EXISTS meta")
+                for statement in _SCHEMA.strip().split(";"):
+                    if statement.strip():
+                        conn.execute(statement)
+                conn.execute(f"PRAGMA user_version = {SCHEMA_VERSION}")
+                conn.execute("COMMIT")
+            except Exception:
+                conn.execute("ROLLBACK")
+                conn.close()
+                raise
+            self._conn = conn
+        self._refresh(self._conn)
+        return self._conn
+
+    def _refresh(self, conn: sqlite3.Connection):
+        """Rebuild the index if the config changed since it was built."""
+        try:
+            st = self.config_path.stat()
+        except OSError:
+            st = None
+        stamp = f"{st.st_mtime_ns}:{st.st_size}" if st else ""
+        meta = dict(conn.execute("SELECT key, value FROM meta"))
+        if meta.get("stamp") == stamp:
+            return
+
+        # Hash and parse the very same bytes
+        data = self.config_path.read_bytes() if st else b""
+        sha256 = hashlib.sha256(data).hexdigest()
+        conn.execute("BEGIN IMMEDIATE")
+        try:
+            # Same content (e.g. touched by a checkout): only the stamp needs updating
+            if meta.get("sha256") != sha256:
+                self._rebuild(conn, data)
+            conn.executemany(
+                "INSERT OR REPLACE INTO meta (key, value) VALUES (?, ?)",
+                [("stamp", stamp), ("sha256", sha256)],
+            )
+            conn.execute("COMMIT")
+        except Exception:
+            conn.execute("ROLLBACK")
+            raise
+
+    def _rebuild(self, conn: sqlite3.Connection, data: bytes):
+        config = load_config(data.decode("utf-8")) if data else {}
+        conn.execute("DELETE FROM components")
+        conn.executemany(
+            "INSERT INTO components (key, name, version, category, source, record) VALUES (?, ?, ?, ?, ?, ?)",
+            (
+                (key, str(info.get("name", key)), _text(info.get("version")), _text(info.get("category")),
+                 _text(info.get("source")), json.dumps(info, default=str))
+                for key, info in (config.get("components") or {}).items()
+                if isinstance(info, dict)
+            ),
+        )
+
+    def __len__(self) -> int:
+        return self._connect().execute("SELECT COUNT(*) FROM components").fetchone()[0]
+
+    def __contains__(self, key: str) -> bool:
+        return self._connect().execute("SELECT 1 FROM components WHERE key = ?", (key,)).fetchone() is not None
+
+    def lookup(self, key: str) -> Optional[dict]:
+        """A component's full config record, or None when it is not installed."""
+        row = self._connect().execute("SELECT record FROM components WHERE key = ?", (key,)).fetchone()
+        return json.loads(row[0]) if row else None
+
+    def rows(self) -> Iterator[Tuple[str, Optional[str], Optional[str], Optional[str]]]:
+        """(name, version, category, source) of every component, in config order, read lazily."""
+        yield from self._connect().execute(
+            "SELECT name, version, category, source FROM components ORDER BY rowid"
+        )
+
+    def close(self):
+        if self._conn is not None:
+            self._conn.close()
+            self._conn = None
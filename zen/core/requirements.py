@@ -0,0 +1,157 @@
+"""
+requirements.txt parsing for zen.
+
+`RequirementsIndex` reads a requirements file once - following ``-r``
+includes, skipping comments and pip options - and maps each requirement to
+its PEP 503 normalized name, so checking whether a dependency is already
+present is a set lookup rather than a scan over every line.
+"""
+
+import re
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Callable, Dict, List, Optional, Set, Tuple
+
+# name, optional [extras], then version specifiers / "@ url" / "; markers"
+_REQUIREMENT_RE = re.compile(
+    r"^\s*(?P<name>[A-Za-z0-9](?:[A-Za-z0-9._-]*[A-Za-z0-9])?)\s*"
+    r"(?:\[(?P<extras>[^\]]*)\])?\s*"
+    r"(?P<rest>[^;]*?)\s*"
+    r"(?:;\s*(?P<marker>.*?))?\s*$"
+)
+_NORMALIZE_RE = re.compile(r"[-_.]+")
+# "-r file", "--requirement file", "--requirement=file"
+_INCLUDE_RE = re.compile(r"^(?:-r|--requirement)(?:\s+|=)(?P<path>\S+)")
+# Inline comments need whitespace before the "#" (URLs may contain "#egg=")
+_COMMENT_RE = re.compile(r"(^|\s)#.*$")
+# Bare URL / VCS requirements ("git+https://...#egg=name") name their project in the fragment
+_URL_RE = re.compile(r"^[A-Za-z][A-Za-z0-9+.-]*://")
+_EGG_RE = re.compile(r"[#&]egg=(?P<name>[A-Za-z0-9][A-Za-z0-9._-]*)")
+
+
+def canonicalize_name(name: str) -> str:
+    """PEP 503 normalized project name (``Foo_Bar.baz`` -> ``foo-bar-baz``)."""
+    return _NORMALIZE_RE.sub("-", name).lower()
+
+
+@dataclass(frozen=True)
+class Requirement:
+    """One parsed requirement line."""
+
+    line: str
+    name: str
+    extras: Tuple[str, ...] = ()
+    specifier: str = ""
+    marker: Optional[str] = None
+
+    @property
+    def key(self) -> Tuple[str, Optional[str]]:
+        """Identity used for de-duplication: the same project under different markers is distinct."""
+        return self.name, self.marker
+
+
+def strip_comment(line: str) -> str:
+    """Drop a requirements.txt comment and surrounding whitespace."""
+    return _COMMENT_RE.sub("", line).strip()
+
+
+def parse_requirement(line: str) -> Optional[Requirement]:
+    """Parse a requirement line; None for blanks, comments, options and unparseable lines."""
+    text = strip_comment(line)
+    if not text or text.startswith("-"):
+        return None
+    if _URL_RE.match(text):
+        egg = _EGG_RE.search(text)
+        return Requirement(line=text, name=canonicalize_name(egg.group("name")), specifier=text) if egg else None
+    match = _REQUIREMENT_RE.match(text)
+    if match is None:
+        return None
+    extras = tuple(sorted(
+        canonicalize_name(e.strip()) for e in (match.group("extras") or "").split(",") if e.strip()
+    ))
+    marker = match.group("marker")
+    return Requirement(
+        line=text,
+        name=canonicalize_name(match.group("name")),
+        extras=extras,
+        specifier=match.group("rest") or "",
+        # Whitespace inside markers is insignificant
+        marker=" ".join(marker.split()) if marker else None,
+    )
+
+
+def parse_requirements(content: str) -> List[Requirement]:
+    """Parse every requirement line of a requirements.txt body (includes are not followed)."""
+    requirements = []
+    for line in content.splitlines():
+        requirement = parse_requirement(line)
+        if requirement is not None:
+            requirements.append(requirement)
+    return requirements
+
+
+@dataclass
+class RequirementsIndex:
+    """Requirements already declared by a project, keyed by normalized name and marker."""
+
+    path: Path
+    requirements: Dict[Tuple[str, Optional[str]], Requirement] = field(default_factory=dict)
+
+    @classmethod
+    def load(cls, path: Path, read_text: Optional[Callable[[Path], Optional[str]]] = None) -> "RequirementsIndex":
+        """
+        Index a requirements file and everything it includes with ``-r``.
+
+        Args:
+            path: The requirements file
+            read_text: Reader for the top-level file, returning None when it does
+                       not exist (e.g. to see content staged in a transaction)
+        """
+        index = cls(path=Path(path))
+        top = read_text(index.path) if read_text else _read(index.path)
+        index._index(index.path, top or "", seen={index.path.resolve()})
+        return index
+
+    def _index(self, path: Path, content: str, seen: Set[Path]):
+        for line in content.splitlines():
+            text = strip_comment(line)
+            include = _INCLUDE_RE.match(text)
+            if include:
+                included = (path.parent / include.group("path")).resolve()
+                # Guard against include cycles
+                if included not in seen:
+                    seen.add(included)
+                    self._index(included, _read(included) or "", seen)
+                continue
+            requirement = parse_requirement(text)
+            if requirement is not None:
+                self._record(requirement)
+
+    def _record(self, requirement: Requirement):
+        self.requirements.setdefault(requirement.key, requirement)
+
+    def __contains__(self, requirement) -> bool:
+        if isinstance(requirement, str):
+            requirement = parse_requirement(requirement)
+            if requirement is None:
+                return False
+        return requirement.key in self.requirements
+
+    def __len__(self) -> int:
+        return len(self.requirements)
+
+    def add(self, line: str) -> bool:
+        """Record a requirement; returns False when it (or a blank/comment) adds nothing new."""
+        requirement = parse_requirement(line)
+        if requirement is None or requirement in self:
+            return False
+        self._record(requirement)
+        return True
+
+
+def _read(path: Path) -> Optional[str]:
+    try:
+        with open(path, "r", encoding="utf-8") as f:
+            return f.read()
+    except OSError:
+        return None
@@ -0,0 +1,245 @@
+"""
+Registry dependency resolution for zen.
+
+A component's ``registry_dependencies`` name other components, either by URL
+(any format ``zen add`` accepts) or by a path relative to the component's own
+component.json. The resolver walks that graph breadth-first, fetching every
+component it discovers concurrently, and returns the components in
+topological order (dependencies first) so they can be installed in one batch.
+"""
+
+import posixpath
+import time
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+from urllib.parse import urljoin, urlparse
+
+from zen.core.exceptions import DependencyConflictError
+from zen.schemas.component import ComponentSchema, load_component_from_url, _default_fetch_concurrency
+
+
+@dataclass
+class DependencyGraph:
+    """Result of resolving a set of components and their registry dependencies."""
+
+    # Component URLs in installation order: every dependency before its dependents
+    order: List[str]
+    components: Dict[str, ComponentSchema]
+    # URL -> URLs of its direct registry dependencies
+    edges: Dict[str, List[str]]
+    # URL -> seconds spent fetching and parsing that component
+    fetch_times: Dict[str, float] = field(default_factory=dict)
+    # Wall-clock seconds for the whole resolution
+    elapsed: float = 0.0
+
+    def ordered(self) -> List[Tuple[ComponentSchema, str]]:
+        """(component, url) pairs in installation order."""
+        return [(self.components[url], url) for url in self.order]
+
+    def critical_path(self) -> Tuple[List[str], float]:
+        """
+        The chain of fetches that bounds resolution time.
+
+        A component's dependencies are only discovered once it has been
+        fetched, so resolving a chain costs the sum of its fetch times no
+        matter how many workers are available.
+
+        Returns:
+            Tuple of (URLs from a root down to a leaf, summed fetch seconds)
+        """
+        cost: Dict[str, float] = {}
+        child: Dict[str, Optional[str]] = {}
+        # `order` lists dependencies first, so each child is costed before its parents
+        for url in self.order:
+            deps = self.edges.get(url, [])
+            best = max(deps, key=lambda d: cost[d], default=None)
+            cost[url] = self.fetch_times.get(url, 0.0) + (cost[best] if best else 0.0)
+            child[url] = best
+        if not cost:
+            return [], 0.0
+
+        start = max(self.order, key=lambda u: cost[u])
+        path = [start]
+        while child[path[-1]] is not None:
+            path.append(child[path[-1]])
+        return path, cost[start]
+
+
+def resolve_dependency_reference(reference: str, dependent_url: Optional[str]) -> str:
+    """
+    Turn a registry_dependencies entry into a loadable component URL.
+
+    Absolute URLs are used as-is. Anything else is a path relative to the
+    dependent's component.json; a path that does not end in ``.json`` names a
+    component directory.
+    """
+    parsed = urlparse(reference)
+    if parsed.scheme or not dependent_url:
+        return reference
+
+    relative = reference if reference.endswith(".json") else reference.rstrip("/") + "/component.json"
+    base = urlparse(dependent_url)
+    if base.scheme in ("http", "https"):
+        return urljoin(dependent_url, relative)
+    if base.scheme == "file":
+        return "file://" + posixpath.normpath(posixpath.join(posixpath.dirname(base.path), relative))
+    return str((Path(dependent_url).parent / relative).resolve())
+
+
+def resolve_dependency_graph(urls: List[str], max_workers: Optional[int] = None,
+                             archive: Optional[bool] = None, fetch_files: bool = False) -> DependencyGraph:
+    """
+    Fetch components and, transitively, their registry dependencies.
+
+    Every newly discovered component is fetched as soon as its dependent has
+    been parsed, concurrently with everything else in flight. Components
+    reached through several paths are fetched once.
+
+    Args:
+        urls: Root component URLs
+        max_workers: Maximum number of components fetched at once
+        archive: Passed through to load_component_from_url
+        fetch_files: Passed through to load_component_from_url
+
+    Returns:
+        DependencyGraph with components in installation order
+
+    Raises:
+        ValueError: If a component cannot be loaded (pending fetches are cancelled)
+        DependencyConflictError: On dependency cycles, or when two different
+                                 URLs provide a component with the same name
+    """
+    started = time.perf_counter()
+    workers = max_workers or _default_fetch_concurrency()
+    components: Dict[str, ComponentSchema] = {}
+    edges: Dict[str, List[str]] = {}
+    fetch_times: Dict[str, float] = {}
+    # Discovery order keeps the result deterministic across runs
+    discovered: List[str] = []
+    seen = set()
+    # A component reached through different URLs (e.g. a tree URL and a relative
+    # path) is one node: later URLs alias the first one by resolved location
+    by_location: Dict[str, str] = {}
+    aliases: Dict[str, str] = {}
+
+    def load(url: str) -> Tuple[ComponentSchema, float]:
+        t0 = time.perf_counter()
+        component = load_component_from_url(url, archive=archive, fetch_files=fetch_files)
+        return component, time.perf_counter() - t0
+
+    executor = ThreadPoolExecutor(max_workers=workers, thread_name_prefix="zen-resolve")
+    pending = {}
+    failed = False
+
+    def submit(url: str):
+        if url in seen:
+            return
+        seen.add(url)
+        discovered.append(url)
+        pending[executor.submit(load, url)] = url
+
+    try:
+        for url in dict.fromkeys(urls):
+            submit(url)
+        while pending:
+            done, _ = wait(pending, return_when=FIRST_COMPLETED)
+            for future in done:
+                url = pending.pop(future)
+                try:
+                    component, seconds = future.result()
+                except Exception as e:
+                    failed = True
+                    for other in pending:
+                        other.cancel()
+                    raise ValueError(f"Failed to load component from {url}: {e}")
+                location = component.source_url or url
+                if location in by_location:
+                    aliases[url] = by_location[location]
+                    continue
+                by_location[location] = url
+                components[url] = component
+                fetch_times[url] = seconds
+                deps = [
+                    resolve_dependency_reference(ref, component.source_url or url)
+                    for ref in component.registry_dependencies
+                ]
+                edges[url] = list(dict.fromkeys(deps))
+                for dep in edges[url]:
+                    submit(dep)
+    finally:
+        # Don't wait on in-flight fetches when bailing out after a failure
+        executor.shutdown(wait=not failed)
+
+    discovered = [url for url in discovered if url not in aliases]
+    edges = {url: list(dict.fromkeys(aliases.get(dep, dep) for dep in deps)) for url, deps in edges.items()}
+    _check_duplicate_names(discovered, components)
+    order = _topological_order(discovered, edges, labels={url: c.name for url, c in components.items()})
+    return DependencyGraph(
+        order=order,
+        components=components,
+        edges=edges,
+        fetch_times=fetch_times,
+        elapsed=time.perf_counter() - started,
+    )
+
+
+def _check_duplicate_names(urls: List[str], components: Dict[str, ComponentSchema]):
+    """Refuse graphs where two URLs provide the same component name."""
+    seen: Dict[str, str] = {}
+    for url in urls:
+        name = components[url].name
+        if name in seen and seen[name] != url:
+            raise DependencyConflictError(
+                f"Component '{name}' is provided by both {seen[name]} and {url}",
+                conflicts=[seen[name], url],
+            )
+        seen.setdefault(name, url)
+
+
+def _topological_order(nodes: List[str], edges: Dict[str, List[str]],
+                       labels: Optional[Dict[str, str]] = None) -> List[str]:
+    """
+    Kahn's algorithm over `edges` (node -> its dependencies); dependencies come first.
+
+    `labels` gives readable names for nodes in the cycle error message.
+    """
+    remaining = {node: len(edges.get(node, [])) for node in nodes}
+    dependents: Dict[str, List[str]] = {node: [] for node in nodes}
+    for node in nodes:
+        for dep in edges.get(node, []):
+            dependents[dep].append(node)
+
+    ready = [node for node in nodes if remaining[node] == 0]
+    order: List[str] = []
+    while ready:
+        node = ready.pop(0)
+        order.append(node)
+        for dependent in dependents[node]:
+            remaining[dependent] -= 1
+            if remaining[dependent] == 0:
+                ready.append(dependent)
+
+    if len(order) != len(nodes):
+        cycle = _find_cycle([n for n in nodes if remaining[n] > 0], edges)
+        labels = labels or {}
+        raise DependencyConflictError(
+            f"Circular registry dependency: {' -> '.join(labels.get(n, n) for n in cycle)}",
+            conflicts=cycle,
+        )
+    return order
+
+
+def _find_cycle(nodes: List[str], edges: Dict[str, List[str]]) -> List[str]:
+    """Return one cycle among `nodes` as a closed path (first node repeated at the end)."""
+    candidates = set(nodes)
+    node = nodes[0]
+    path: List[str] = []
+    position: Dict[str, int] = {}
+    # Every unresolved node has an unresolved dependency, so walking them must loop
+    while node not in position:
+        position[node] = len(path)
+        path.append(node)
+        node = next(dep for dep in edges.get(node, []) if dep in candidates)
+    return path[position[node]:] + [node]
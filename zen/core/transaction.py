@@ -0,0 +1,279 @@
+"""
+Transactional file installation for zen.
+
+Every file an install writes - component files, ``requirements.txt`` and
+``.zen/config.yaml`` - is first staged under ``.zen/tmp/<transaction>/``, on
+the same filesystem as the project. Only when everything has been staged are
+the files moved into place with ``os.replace``. Files that get replaced or
+removed are moved aside first, so a failure during commit restores them. A journal written
+before the commit starts lets the next transaction roll back one that was
+interrupted by a crash.
+"""
+
+import errno
+import itertools
+import json
+import os
+import shutil
+import tempfile
+from pathlib import Path
+from typing import Dict, List, Optional
+
+# Staging area, relative to the project root
+STAGING_DIR = Path(".zen") / "tmp"
+JOURNAL_NAME = "journal.json"
+
+
+class InstallTransaction:
+    """Stages file writes and commits them all at once, or not at all.
+
+    Use as a context manager: the transaction commits when the block exits
+    normally and rolls back when it raises.
+    """
+
+    def __init__(self, project_root: Path):
+        self.project_root = Path(project_root).resolve()
+        staging_root = self.project_root / STAGING_DIR
+        staging_root.mkdir(parents=True, exist_ok=True)
+        recover_transactions(self.project_root)
+        # The pid in the name tells recovery whether the owner is still running
+        self.path = Path(tempfile.mkdtemp(dir=str(staging_root), prefix=f"tx-{os.getpid()}-"))
+        # target -> staged file (None for removals), in staging order
+        self._staged: Dict[Path, Optional[Path]] = {}
+        # Numbers staging files; never reused, even after unstage()
+        self._sequence = itertools.count()
+        self._committed = False
+
+    def __enter__(self) -> "InstallTransaction":
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        if exc_type is None:
+            self.commit()
+        else:
+            self.rollback()
+        return False
+
+    def stage(self, target: Path) -> Path:
+        """Reserve a staging file for `target` and return its path; the caller fills it."""
+        target = Path(target).resolve()
+        staged = self._staged.get(target)
+        if staged is None:
+            staged = self.path / "files" / f"{next(self._sequence):05d}-{target.name}"
+            staged.parent.mkdir(parents=True, exist_ok=True)
+            self._staged[target] = staged
+        return staged
+
+    def unstage(self, target: Path):
+        """Drop a staged file (or removal) so the commit leaves `target` untouched."""
+        staged = self._staged.pop(Path(target).resolve(), None)
+        if staged is not None and staged.exists():
+            staged.unlink()
+
+    def remove(self, target: Path):
+        """Stage the removal of `target`."""
+        self.unstage(target)
+        self._staged[Path(target).resolve()] = None
+
+    def is_removed(self, target: Path) -> bool:
+        """Whether this transaction removes `target`."""
+        target = Path(target).resolve()
+        return target in self._staged and self._staged[target] is None
+
+    def write_text(self, target: Path, text: str, encoding: str = "utf-8"):
+        """Stage a text file."""
+        with open(self.stage(target), "w", encoding=encoding) as f:
+            f.write(text)
+
+    def write_bytes(self, target: Path, data: bytes):
+        """Stage a binary file."""
+        with open(self.stage(target), "wb") as f:
+            f.write(data)
+
+    def is_staged(self, target: Path) -> bool:
+        """Whether `target` has been staged (written) in this transaction."""
+        return self._staged.get(Path(target).resolve()) is not None
+
+    def exists(self, target: Path) -> bool:
+        """Whether `target` exists on disk or will exist once committed."""
+        if self.is_removed(target):
+            return False
+        return self.is_staged(target) or Path(target).exists()
+
+    def read_text(self, target: Path, encoding: str = "utf-8") -> Optional[str]:
+        """Current content of `target` as this transaction sees it, or None if absent."""
+        target = Path(target).resolve()
+        source = self._staged.get(target, target)
+        if source is None or not source.exists():
+            return None
+        with open(source, "r", encoding=encoding) as f:
+            return f.read()
+
+    @property
+    def targets(self) -> List[Path]:
+        """Every file this transaction writes or removes."""
+        return list(self._staged)
+
+    def commit(self):
+        """Move every staged file into place, restoring everything if any move fails."""
+        if self._committed:
+            return
+        entries = []
+        for i, (target, staged) in enumerate(self._staged.items()):
+            entries.append({
+                "target": str(target),
+                "staged": str(staged) if staged is not None else None,
+                "backup": str(self.path / "backup" / f"{i:05d}-{target.name}"),
+                "existed": target.exists(),
+            })
+        _write_journal(self.path, {"state": "committing", "entries": entries})
+
+        created_dirs: List[str] = []
+        try:
+            for entry in entries:
+                target = Path(entry["target"])
+                if entry["staged"] is None:
+                    # Removal: moving the file aside is all there is to it
+                    if entry["existed"]:
+                        backup = Path(entry["backup"])
+                        backup.parent.mkdir(parents=True, exist_ok=True)
+                        os.replace(target, backup)
+                    continue
+                created_dirs.extend(_make_parents(target.parent))
+                if entry["existed"]:
+                    backup = Path(entry["backup"])
+                    backup.parent.mkdir(parents=True, exist_ok=True)
+                    os.replace(target, backup)
+                _move(Path(entry["staged"]), target)
+            _write_journal(self.path, {"state": "committed", "entries": entries})
+        except BaseException:
+            _undo(entries)
+            for directory in reversed(created_dirs):
+                _remove_empty_dir(Path(directory))
+            self._cleanup()
+            raise
+
+        self._committed = True
+        self._cleanup()
+
+    def rollback(self):
+        """Discard everything staged; nothing outside the staging area was touched."""
+        if not self._committed:
+            self._cleanup()
+
+    def _cleanup(self):
+        """Delete the staging directory, and the staging area itself once empty."""
+        shutil.rmtree(self.path, ignore_errors=True)
+        staging_root = self.project_root / STAGING_DIR
+        _remove_empty_dir(staging_root)
+        _remove_empty_dir(staging_root.parent)
+
+
+def recover_transactions(project_root: Path) -> int:
+    """
+    Roll back transactions left behind by a crashed process.
+
+    Transactions whose owning process is still running are left alone.
+
+    Returns:
+        Number of leftover transactions cleaned up
+    """
+    staging_root = Path(project_root) / STAGING_DIR
+    if not staging_root.is_dir():
+        return 0
+    recovered = 0
+    for path in staging_root.iterdir():
+        if not path.is_dir() or not path.name.startswith("tx-"):
+            continue
+        if _owner_alive(path.name):
+            continue
+        journal = _read_journal(path)
+        if journal is not None and journal.get("state") == "committing":
+            _undo(journal.get("entries", []))
+        shutil.rmtree(path, ignore_errors=True)
+        recovered += 1
+    return recovered
+
+
+def _undo(entries: List[dict]):
+    """Reverse the commit of journal entries, newest first."""
+    for entry in reversed(entries):
+        target, backup = Path(entry["target"]), Path(entry["backup"])
+        staged = Path(entry["staged"]) if entry.get("staged") else None
+        if staged is not None and not staged.exists() and target.exists():
+            # The staged file was moved into place - take it out again
+            target.unlink()
+        if backup.exists():
+            os.replace(backup, target)
+
+
+def _owner_alive(name: str) -> bool:
+    """Whether the process that created a ``tx-<pid>-*`` directory is still running."""
+    try:
+        pid = int(name.split("-")[1])
+    except (IndexError, ValueError):
+        return False
+    if pid == os.getpid():
+        return True
+    if os.name == "nt":
+        # os.kill would terminate the process on Windows; never steal a transaction there
+        return True
+    try:
+        os.kill(pid, 0)
+    except ProcessLookupError:
+        return False
+    except OSError:
+        # Exists but belongs to someone else
+        return True
+    return True
+
+
+def _move(source: Path, target: Path):
+    """Rename a file into place, copying when it crosses filesystems."""
+    try:
+        os.replace(source, target)
+    except OSError as e:
+        if e.errno != errno.EXDEV:
+            raise
+        # e.g. a custom install path on another filesystem
+        shutil.move(str(source), str(target))
+
+
+def _make_parents(directory: Path) -> List[str]:
+    """Create a directory and its parents, returning the ones that were created."""
+    created = []
+    missing = []
+    while not directory.exists():
+        missing.append(directory)
+        directory = directory.parent
+    for d in reversed(missing):
+        d.mkdir(exist_ok=True)
+        created.append(str(d))
+    return created
+
+
+def _remove_empty_dir(directory: Path):
+    """Remove a directory if it is empty."""
+    try:
+        directory.rmdir()
+    except OSError:
+        pass
+
+
+def _write_journal(path: Path, journal: dict):
+    """Write the journal atomically so a crash never leaves it half-written."""
+    tmp = path / (JOURNAL_NAME + ".tmp")
+    with open(tmp, "w", encoding="utf-8") as f:
+        json.dump(journal, f)
+        f.flush()
+        os.fsync(f.fileno())
+    os.replace(tmp, path / JOURNAL_NAME)
+
+
+def _read_journal(path: Path) -> Optional[dict]:
+    """Read a transaction's journal; None if it was never written or is unreadable."""
+    try:
+        with open(path / JOURNAL_NAME, "r", encoding="utf-8") as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return None
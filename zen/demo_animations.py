@@ -89,7 +89,7 @@ def main():
     
     # Matrix transition demo
     logger.info("🔢 Matrix Transition Demo:")
-    logger.show_matrix_transition("Loading complete - Welcome to Zenive!", 2.5)
+    logger.show_matrix_transition("Loading complete - Welcome to Zenive!", 2.5, block=True)
     time.sleep(1)
     
     # Typewriter effect demo
@@ -2,11 +2,34 @@
 Schema definitions for zen.
 """
 
-from zen.schemas.component import ComponentSchema, ComponentFile, load_component_from_json, load_component_from_url
+# Resolved lazily: zen.schemas.component pulls in pydantic and requests
+_LAZY_IMPORTS = {
+    "ComponentSchema": "zen.schemas.component",
+    "ComponentFile": "zen.schemas.component",
+    "download_file": "zen.schemas.component",
+    "download_files": "zen.schemas.component",
+    "fetch_missing_file_contents": "zen.schemas.component",
+    "load_component_from_json": "zen.schemas.component",
+    "load_component_from_url": "zen.schemas.component",
+    "load_components_from_urls": "zen.schemas.component",
+}
 
 __all__ = [
     "ComponentSchema",
     "ComponentFile", 
+    "download_file",
+    "download_files",
+    "fetch_missing_file_contents",
     "load_component_from_json",
-    "load_component_from_url"
+    "load_component_from_url",
+    "load_components_from_urls"
 ]
+
+
+def __getattr__(name):
+    if name in _LAZY_IMPORTS:
+        import importlib
+        value = getattr(importlib.import_module(_LAZY_IMPORTS[name]), name)
+        globals()[name] = value
+        return value
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -13,14 +13,37 @@ Supported file sources:
 """
 from __future__ import annotations
 
+import base64
 import json
+import os
 import re
-from typing import Dict, List, Optional, Any
-from pydantic import BaseModel, Field, validator, model_validator
+import secrets
+import shutil
+import tarfile
+import threading
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from typing import Callable, Dict, List, Optional, Any, Tuple
+from pydantic import BaseModel, Field, PrivateAttr, validator, model_validator
 from pathlib import Path
 from urllib.parse import urlparse, urljoin
 import requests
 
+from zen.core.archive import (
+    archive_member_path,
+    archive_mode_enabled,
+    fetch_github_archive,
+    parse_github_tree_url,
+)
+from zen.core.cache import get_fetch_cache
+from zen.core.exceptions import NetworkError
+from zen.core.http import get_session_manager
+from zen.core.mirror import get_mirror, get_recording_mirror, is_offline
+
+# Default number of component files fetched in parallel
+DEFAULT_FETCH_CONCURRENCY = 8
+# Branches probed for component.json when given a bare repository URL
+DEFAULT_BRANCHES = ("main", "master")
+
 class ComponentFile(BaseModel):
     """Represents a file in a component.
 
@@ -28,11 +51,22 @@ class ComponentFile(BaseModel):
     preferred workflow components should provide `url` (local relative path,
     file://, or http(s) URL). If `url` is provided but `content` is missing,
     loaders will fetch content automatically.
+
+    Binary files (`binary: true`) are never decoded: their bytes are copied
+    verbatim, and embedded `content` is expected to be base64. An optional
+    `sha256` of the bytes lets installs and updates skip url files that are
+    already present without fetching them; downloads are verified against it.
     """
     name: str = Field(..., description="Name of the file")
     path: str = Field(..., description="Target path where file should be installed")
     content: Optional[str] = Field(None, description="File content (embedded). Deprecated; prefer `url`.")
     url: Optional[str] = Field(None, description="URL or local path to fetch file content from (file://, http(s), or relative path)")
+    binary: bool = Field(False, description="Copy the file byte for byte; embedded content is base64")
+    encoding: str = Field("utf-8", description="Text encoding of the file (ignored for binary files)")
+    sha256: Optional[str] = Field(None, description="Hex SHA-256 of the file's bytes; lets installs skip unchanged url files without downloading them")
+
+    # Raw bytes of a binary file fetched into memory
+    _data: Optional[bytes] = PrivateAttr(default=None)
 
     @model_validator(mode='before')
     @classmethod
@@ -43,6 +77,35 @@ class ComponentFile(BaseModel):
                 raise ValueError("Either 'content' or 'url' must be provided for each file")
         return values
 
+    @validator('sha256')
+    def validate_sha256(cls, v):
+        """Validate the digest is 64 hex characters."""
+        if v is not None and (len(v) != 64 or any(c not in "0123456789abcdefABCDEF" for c in v)):
+            raise ValueError('sha256 must be a 64 character hex digest')
+        return v.lower() if v else v
+
+    @property
+    def has_content(self) -> bool:
+        """Whether the file's body is available without fetching it."""
+        return bool(self.content) or self._data is not None
+
+    def set_data(self, data: bytes):
+        """Store a fetched body: binary files keep the bytes, text files are decoded."""
+        if self.binary:
+            self._data = data
+        else:
+            self.content = data.decode(self.encoding, errors="replace")
+
+    def read_bytes(self) -> Optional[bytes]:
+        """The file's body as bytes, or None when it still has to be fetched."""
+        if self._data is not None:
+            return self._data
+        if not self.content:
+            return None
+        if self.binary:
+            return base64.b64decode(self.content)
+        return self.content.encode(self.encoding)
+
 class ComponentSchema(BaseModel):
     """JSON schema for component definitions."""
     name: str = Field(..., description="Component name")
@@ -66,6 +129,21 @@ class ComponentSchema(BaseModel):
     keywords: List[str] = Field(default_factory=list, description="Component keywords")
     homepage: Optional[str] = Field(None, description="Component homepage URL")
 
+    # Base path/URL the file urls were resolved against when loaded
+    _source_base: Optional[str] = PrivateAttr(default=None)
+    # Where component.json itself was actually read from
+    _source_url: Optional[str] = PrivateAttr(default=None)
+
+    @property
+    def source_base(self) -> Optional[str]:
+        """Base used to resolve relative file urls (set by the loaders)."""
+        return self._source_base
+
+    @property
+    def source_url(self) -> Optional[str]:
+        """Resolved location of component.json (set by `load_component_from_url`)."""
+        return self._source_url
+
     @validator('name')
     def validate_name(cls, v):
         """Validate component name format."""
@@ -88,9 +166,131 @@ class ComponentSchema(BaseModel):
             raise ValueError('Component must have at least one file')
         return v
 
-def fetch_file_content(url: str, base: Optional[str] = None, timeout: int = 30) -> str:
+def _http_get(url: str, timeout: int = 30) -> str:
+    """
+    GET a URL through the mirror, the fetch cache and the shared pooled session.
+
+    A configured mirror (ZEN_MIRROR) always wins. Fresh cache entries are
+    served from disk. Expired entries are revalidated with If-None-Match /
+    If-Modified-Since, so an unchanged file costs only a 304 response instead
+    of a full download. In offline mode no request is made at all: stale
+    cache entries are used as-is and anything else raises NetworkError.
     """
-    Fetch file content from various sources, with enhanced GitHub support.
+    return _http_get_bytes(url, timeout=timeout).decode("utf-8", errors="replace")
+
+def _http_get_bytes(url: str, timeout: int = 30) -> bytes:
+    """Like `_http_get`, but return the undecoded body."""
+    data = _fetch_remote(url, timeout=timeout)
+    recorder = get_recording_mirror()
+    if recorder is not None:
+        recorder.write(url, data)
+    return data
+
+def _deliver(path: Path, dest: Optional[Path]) -> Optional[bytes]:
+    """Return a local body's bytes, or copy it to `dest` when one is given."""
+    if dest is None:
+        return path.read_bytes()
+    shutil.copyfile(path, dest)
+    return None
+
+def _fetch_remote(url: str, timeout: int = 30, dest: Optional[Path] = None,
+                  fetch_url: Optional[str] = None, use_cache: bool = True) -> Optional[bytes]:
+    """
+    Resolve a URL's body from the mirror, cache or network (see `_http_get`).
+
+    Without `dest` the body is returned as bytes. With `dest` it is streamed
+    chunk by chunk into that file instead and None is returned, so large files
+    are never held in memory.
+
+    `fetch_url`, when given, is where the body is requested from - the same
+    file pinned to an immutable commit. The mirror and the cache stay keyed on
+    `url`, so a new commit still revalidates the copy cached for the branch
+    (an unchanged file costs a 304), and a body already cached for the pinned
+    URL is served without any request.
+
+    Another zen process may evict a cached body between the lookup and the
+    copy; that counts as a cache miss. `use_cache=False` skips the lookup (the
+    response is still stored).
+    """
+    mirror = get_mirror()
+    if mirror is not None:
+        mirrored = mirror.path_for(url)
+        if mirrored is not None and mirrored.is_file():
+            return _deliver(mirrored, dest)
+
+    pinned = fetch_url if fetch_url and fetch_url != url else None
+    cache = get_fetch_cache()
+    entry = cached = None
+    if cache is not None and use_cache:
+        try:
+            pinned_entry = cache.lookup(pinned) if pinned else None
+            pinned_body = cache.object_file(pinned_entry.sha256) if pinned_entry is not None else None
+            entry = cache.lookup(url)
+            if entry is not None:
+                cached = cache.object_file(entry.sha256)
+        except Exception:
+            # A broken cache must never fail the fetch itself: treat it as a miss
+            pinned_body = entry = cached = None
+        try:
+            if pinned_body is not None:
+                # Content at a commit never changes
+                return _deliver(pinned_body, dest)
+            if cached is not None and ((cache.is_fresh(entry) and not pinned) or is_offline()):
+                return _deliver(cached, dest)
+        except OSError:
+            # Evicted since the lookup: fetch it like any other miss
+            entry = cached = None
+
+    if is_offline():
+        raise NetworkError(f"{url} is not in the mirror or fetch cache (offline mode)", endpoint=url)
+
+    headers = cache.conditional_headers(entry) if cached is not None else {}
+    session = get_session_manager()
+    resp = session.get(pinned or url, timeout=timeout, headers=headers, stream=True)
+    if resp.status_code == 304 and cached is not None:
+        resp.close()
+        etag, last_modified = resp.headers.get("ETag"), resp.headers.get("Last-Modified")
+        try:
+            cache.revalidated(url, etag, last_modified)
+            if pinned:
+                cache.link(pinned, entry.sha256, etag, last_modified)
+        except Exception:
+            # Only the TTL restart is lost; the cached body is still valid
+            pass
+        try:
+            return _deliver(cached, dest)
+        except OSError:
+            # Evicted while revalidating: download it unconditionally
+            return _fetch_remote(url, timeout=timeout, dest=dest, fetch_url=fetch_url, use_cache=False)
+
+    try:
+        resp.raise_for_status()
+    except requests.HTTPError:
+        resp.close()
+        raise
+    etag, last_modified = resp.headers.get("ETag"), resp.headers.get("Last-Modified")
+    if dest is None:
+        data = session.read(resp)
+    else:
+        data = None
+        with open(dest, "wb") as f:
+            session.read_into(resp, f)
+    if cache is not None:
+        try:
+            if data is None:
+                sha256 = cache.put_file(url, dest, etag=etag, last_modified=last_modified)
+            else:
+                sha256 = cache.put(url, data, etag=etag, last_modified=last_modified)
+            if pinned:
+                cache.link(pinned, sha256, etag, last_modified)
+        except Exception:
+            # A broken cache must never fail the fetch itself
+            pass
+    return data
+
+def resolve_file_source(url: str, base: Optional[str] = None) -> Tuple[str, bool]:
+    """
+    Work out where a file's bytes live, with enhanced GitHub support.
 
     Supported sources:
     - GitHub repositories (blob URLs, raw URLs, API URLs)
@@ -98,6 +298,10 @@ def fetch_file_content(url: str, base: Optional[str] = None, timeout: int = 30)
     - file:// URLs
     - Local absolute/relative paths
     - GitHub tree URLs (for component.json discovery)
+
+    Returns:
+        Tuple of (source, is_remote): an http(s) URL when is_remote is True,
+        otherwise a local filesystem path
     """
     parsed = urlparse(url)
 
@@ -107,35 +311,18 @@ def fetch_file_content(url: str, base: Optional[str] = None, timeout: int = 30)
         if "/blob/" in parsed.path:
             # github.com/user/repo/blob/branch/path -> raw.githubusercontent.com/user/repo/branch/path
             raw_path = parsed.path.replace("/blob/", "/")
-            raw_url = f"https://raw.githubusercontent.com{raw_path}"
-            resp = requests.get(raw_url, timeout=timeout)
-            resp.raise_for_status()
-            return resp.text
+            return f"https://raw.githubusercontent.com{raw_path}", True
         elif "/tree/" in parsed.path:
             # github.com/user/repo/tree/branch/path -> look for component.json
             tree_path = parsed.path.replace("/tree/", "/")
-            component_url = f"https://raw.githubusercontent.com{tree_path}/component.json"
-            resp = requests.get(component_url, timeout=timeout)
-            resp.raise_for_status()
-            return resp.text
+            return f"https://raw.githubusercontent.com{tree_path}/component.json", True
         else:
             # Try as raw URL directly
-            raw_url = f"https://raw.githubusercontent.com{parsed.path}"
-            resp = requests.get(raw_url, timeout=timeout)
-            resp.raise_for_status()
-            return resp.text
-
-    # raw.githubusercontent.com URLs
-    if parsed.netloc.lower() == "raw.githubusercontent.com":
-        resp = requests.get(url, timeout=timeout)
-        resp.raise_for_status()
-        return resp.text
+            return f"https://raw.githubusercontent.com{parsed.path}", True
 
-    # Absolute HTTP(S)
-    if parsed.scheme in ("http", "https"):
-        resp = requests.get(url, timeout=timeout)
-        resp.raise_for_status()
-        return resp.text
+    # raw.githubusercontent.com URLs and absolute HTTP(S)
+    if parsed.netloc.lower() == "raw.githubusercontent.com" or parsed.scheme in ("http", "https"):
+        return url, True
 
     # No scheme but base is an HTTP URL -> join and fetch via HTTP
     if (not parsed.scheme or parsed.scheme == "") and base:
@@ -144,18 +331,12 @@ def fetch_file_content(url: str, base: Optional[str] = None, timeout: int = 30)
             # For relative URLs starting with ./, remove the ./ and join properly
             clean_url = url.lstrip('./')
             if base.endswith('/'):
-                joined = base + clean_url
-            else:
-                joined = base + '/' + clean_url
-            resp = requests.get(joined, timeout=timeout)
-            resp.raise_for_status()
-            return resp.text
+                return base + clean_url, True
+            return base + '/' + clean_url, True
 
     # file:// URLs
     if parsed.scheme == "file":
-        path = Path(parsed.path)
-        with open(path, "r", encoding="utf-8") as f:
-            return f.read()
+        return parsed.path, False
 
     # Local path (absolute or relative)
     p = Path(url)
@@ -165,10 +346,7 @@ def fetch_file_content(url: str, base: Optional[str] = None, timeout: int = 30)
             base_parsed = urlparse(base)
             if base_parsed.scheme in ("http", "https"):
                 # Should have been handled earlier — fall through to HTTP join if needed
-                joined = urljoin(base, url)
-                resp = requests.get(joined, timeout=timeout)
-                resp.raise_for_status()
-                return resp.text
+                return urljoin(base, url), True
             else:
                 # base is a filesystem path or file:// path
                 base_path = Path(base)
@@ -179,10 +357,213 @@ def fetch_file_content(url: str, base: Optional[str] = None, timeout: int = 30)
         else:
             p = p.resolve()
 
-    with open(p, "r", encoding="utf-8") as f:
+    return str(p), False
+
+def fetch_file_content(url: str, base: Optional[str] = None, timeout: int = 30) -> str:
+    """Fetch file content from any source supported by `resolve_file_source`."""
+    source, remote = resolve_file_source(url, base)
+    if remote:
+        return _http_get(source, timeout=timeout)
+    with open(source, "r", encoding="utf-8") as f:
+        return f.read()
+
+def fetch_file_bytes(url: str, base: Optional[str] = None, timeout: int = 30) -> bytes:
+    """Fetch a file's raw bytes (no decoding) from any source supported by `resolve_file_source`."""
+    source, remote = resolve_file_source(url, base)
+    if remote:
+        return _http_get_bytes(source, timeout=timeout)
+    with open(source, "rb") as f:
         return f.read()
 
-def load_component_from_json(json_content: str, base: Optional[str] = None) -> ComponentSchema:
+def _create_part_file(dest: Path) -> str:
+    """Create an empty, uniquely named temp file next to `dest` and return its path.
+
+    Unlike mkstemp (always 0600) the file gets the usual 0666 minus the
+    process umask, applied by the kernel, so downloads get normal permissions.
+    """
+    while True:
+        tmp = str(dest.parent / f".{dest.name}.{secrets.token_hex(4)}.part")
+        try:
+            os.close(os.open(tmp, os.O_CREAT | os.O_EXCL | os.O_WRONLY, 0o666))
+            return tmp
+        except FileExistsError:
+            continue
+
+def download_file(url: str, dest: Path, base: Optional[str] = None, timeout: int = 30,
+                  pin: Optional[Callable[[str], str]] = None) -> int:
+    """
+    Stream a file straight to `dest` without holding it in memory.
+
+    Remote bodies are written to disk chunk by chunk as they arrive (and
+    stored in the fetch cache from there); mirror, cache and local sources are
+    copied file to file with shutil.copyfile, which uses kernel-side copies
+    (sendfile/fcopyfile) where available. Bytes are never decoded. The body lands in a temp file next to `dest` that is
+    renamed over it once complete, so an interrupted download never leaves a
+    truncated file behind.
+
+    Args:
+        url: File url, resolved like in `fetch_file_content`
+        dest: Target path
+        base: Base path/URL used to resolve a relative url
+        pin: Maps the resolved remote URL to the URL actually requested
+             (e.g. its GitHub ref replaced by a commit); the mirror and the
+             fetch cache stay keyed on the unpinned URL
+
+    Returns:
+        Number of bytes written
+    """
+    source, remote = resolve_file_source(url, base)
+    dest = Path(dest)
+    dest.parent.mkdir(parents=True, exist_ok=True)
+    tmp = _create_part_file(dest)
+    try:
+        if remote:
+            _fetch_remote(source, timeout=timeout, dest=Path(tmp), fetch_url=pin(source) if pin else None)
+            recorder = get_recording_mirror()
+            if recorder is not None:
+                recorder.write_file(source, Path(tmp))
+        else:
+            shutil.copyfile(source, tmp)
+        size = os.path.getsize(tmp)
+        os.replace(tmp, dest)
+        return size
+    except BaseException:
+        if os.path.exists(tmp):
+            os.unlink(tmp)
+        raise
+
+def _default_fetch_concurrency() -> int:
+    """Concurrency limit for file fetches, overridable via ZEN_FETCH_CONCURRENCY."""
+    try:
+        value = int(os.environ.get("ZEN_FETCH_CONCURRENCY", ""))
+    except ValueError:
+        return DEFAULT_FETCH_CONCURRENCY
+    return value if value > 0 else DEFAULT_FETCH_CONCURRENCY
+
+def _resolve_files_base(base: Optional[str]) -> Optional[str]:
+    """Convert GitHub tree base URLs to raw URLs for file fetching."""
+    if base and "github.com" in base and "/tree/" in base:
+        return base.replace("github.com", "raw.githubusercontent.com").replace("/tree/", "/")
+    return base
+
+def fetch_missing_file_contents(files: List[ComponentFile], base: Optional[str] = None,
+                                max_workers: Optional[int] = None) -> None:
+    """
+    Fetch the content of every file that only has a `url`, concurrently.
+
+    Results are assigned back to their own ComponentFile, so the order of
+    `files` is preserved regardless of completion order. The first failure
+    cancels every fetch that has not started yet and is re-raised as ValueError.
+
+    Args:
+        files: Component files to populate in place
+        base: Base path/URL used to resolve relative file urls
+        max_workers: Maximum number of concurrent fetches (defaults to
+                     ZEN_FETCH_CONCURRENCY or DEFAULT_FETCH_CONCURRENCY)
+    """
+    pending = [f for f in files if not f.has_content and f.url]
+    if not pending:
+        return
+
+    resolved_base = _resolve_files_base(base)
+    workers = min(max_workers or _default_fetch_concurrency(), len(pending))
+
+    if workers <= 1:
+        for f in pending:
+            try:
+                f.set_data(fetch_file_bytes(f.url, base=resolved_base))
+            except Exception as e:
+                raise ValueError(f"Failed to fetch file '{f.name}' from '{f.url}': {e}")
+        return
+
+    failed = threading.Event()
+
+    def fetch(f: ComponentFile) -> bytes:
+        # Queued fetches that start after a failure bail out immediately
+        if failed.is_set():
+            raise RuntimeError("cancelled after an earlier fetch failed")
+        return fetch_file_bytes(f.url, base=resolved_base)
+
+    executor = ThreadPoolExecutor(max_workers=workers, thread_name_prefix="zen-fetch")
+    futures = {executor.submit(fetch, f): f for f in pending}
+    try:
+        for future in as_completed(futures):
+            f = futures[future]
+            try:
+                f.set_data(future.result())
+            except Exception as e:
+                failed.set()
+                for other in futures:
+                    other.cancel()
+                raise ValueError(f"Failed to fetch file '{f.name}' from '{f.url}': {e}")
+    finally:
+        # Don't wait on in-flight requests when bailing out after a failure
+        executor.shutdown(wait=not failed.is_set())
+
+def download_files(downloads: List[Tuple[str, Path]], base: Optional[str] = None,
+                   max_workers: Optional[int] = None, pin: Optional[Callable[[str], str]] = None) -> List[int]:
+    """
+    Stream several files to disk concurrently (see `download_file`).
+
+    The first failure cancels every download that has not started yet and is
+    re-raised as ValueError once the ones in flight have finished, so no
+    download writes to its destination after this returns (e.g. into the
+    staging area of a transaction being rolled back).
+
+    Args:
+        downloads: (url, destination path) pairs
+        base: Base path/URL used to resolve relative urls
+        max_workers: Maximum number of concurrent downloads (defaults to
+                     ZEN_FETCH_CONCURRENCY or DEFAULT_FETCH_CONCURRENCY)
+        pin: Passed through to download_file
+
+    Returns:
+        Bytes written per download, in the order of `downloads`
+    """
+    if not downloads:
+        return []
+
+    workers = min(max_workers or _default_fetch_concurrency(), len(downloads))
+    if workers <= 1:
+        sizes = []
+        for url, dest in downloads:
+            try:
+                sizes.append(download_file(url, dest, base=base, pin=pin))
+            except Exception as e:
+                raise ValueError(f"Failed to download '{url}': {e}")
+        return sizes
+
+    failed = threading.Event()
+
+    def download(url: str, dest: Path) -> int:
+        # Queued downloads that start after a failure bail out immediately
+        if failed.is_set():
+            raise RuntimeError("cancelled after an earlier download failed")
+        return download_file(url, dest, base=base, pin=pin)
+
+    sizes: List[int] = [0] * len(downloads)
+    executor = ThreadPoolExecutor(max_workers=workers, thread_name_prefix="zen-fetch")
+    futures = {executor.submit(download, url, dest): i for i, (url, dest) in enumerate(downloads)}
+    try:
+        for future in as_completed(futures):
+            i = futures[future]
+            try:
+                sizes[i] = future.result()
+            except Exception as e:
+                failed.set()
+                for other in futures:
+                    other.cancel()
+                url = downloads[i][0]
+                raise ValueError(f"Failed to download '{url}': {e}")
+    finally:
+        # In-flight downloads still write to their destinations: let them finish
+        executor.shutdown(wait=True)
+    return sizes
+
+def load_component_from_json(json_content: str, base: Optional[str] = None,
+                             max_workers: Optional[int] = None,
+                             prefetched: Optional[Dict[str, bytes]] = None,
+                             fetch_files: bool = True) -> ComponentSchema:
     """
     Load component from JSON string and fetch any file contents referenced by URL.
 
@@ -191,6 +572,12 @@ def load_component_from_json(json_content: str, base: Optional[str] = None) -> C
         base: Optional base path/URL used to resolve relative file urls. When the
               component JSON was read from disk, this should be the JSON file path.
               When fetched from HTTP, this should be the JSON URL.
+        max_workers: Maximum number of files fetched concurrently
+        prefetched: File bodies already downloaded (e.g. from a repository
+                    archive), keyed by path relative to the component directory.
+                    Files found here are not fetched again.
+        fetch_files: When False, url-only files are left without content so the
+                     installer can stream them straight to disk (see `download_file`)
 
     Returns:
         ComponentSchema instance with file content populated when possible
@@ -198,26 +585,130 @@ def load_component_from_json(json_content: str, base: Optional[str] = None) -> C
     try:
         data = json.loads(json_content)
         comp = ComponentSchema(**data)
-        # For each file, if url provided and content missing -> fetch
-        for f in comp.files:
-            if not f.content and f.url:
-                try:
-                    # Convert GitHub tree base URLs to raw URLs for file fetching
-                    resolved_base = base
-                    if base and "github.com" in base and "/tree/" in base:
-                        # Convert tree URL to raw URL base
-                        resolved_base = base.replace("github.com", "raw.githubusercontent.com").replace("/tree/", "/")
-                    
-                    f.content = fetch_file_content(f.url, base=resolved_base)
-                except Exception as e:
-                    raise ValueError(f"Failed to fetch file '{f.name}' from '{f.url}': {e}")
+        comp._source_base = _resolve_files_base(base)
+        if prefetched:
+            for f in comp.files:
+                if not f.has_content and f.url:
+                    member = archive_member_path(f.url)
+                    if member in prefetched:
+                        f.set_data(prefetched[member])
+        if fetch_files:
+            # Fetch every file that has a url but no content
+            fetch_missing_file_contents(comp.files, base=base, max_workers=max_workers)
         return comp
     except json.JSONDecodeError as e:
         raise ValueError(f"Invalid JSON: {e}")
     except Exception as e:
         raise ValueError(f"Invalid component schema: {e}")
 
-def load_component_from_url(url: str) -> ComponentSchema:
+def _default_branches() -> List[str]:
+    """Branch candidates for bare repository URLs: ZEN_DEFAULT_BRANCHES first, then main/master."""
+    configured = [b.strip() for b in os.environ.get("ZEN_DEFAULT_BRANCHES", "").split(",") if b.strip()]
+    # Keep priority order but drop duplicates
+    return list(dict.fromkeys(configured + list(DEFAULT_BRANCHES)))
+
+def _probe_branches(repo_url: str, branches: List[str]) -> Tuple[str, str]:
+    """
+    Fetch component.json from every candidate branch concurrently.
+
+    A success is accepted as soon as every higher-priority candidate has failed,
+    so the result does not depend on which request happens to finish first.
+
+    Returns:
+        Tuple of (component.json content, branch it was found on)
+    """
+    if len(branches) == 1:
+        return fetch_file_content(f"{repo_url}/blob/{branches[0]}/component.json"), branches[0]
+
+    executor = ThreadPoolExecutor(max_workers=len(branches), thread_name_prefix="zen-probe")
+    futures = {
+        executor.submit(fetch_file_content, f"{repo_url}/blob/{branch}/component.json"): branch
+        for branch in branches
+    }
+    outcomes: Dict[str, Any] = {}
+    try:
+        for future in as_completed(futures):
+            try:
+                outcomes[futures[future]] = (True, future.result())
+            except Exception as e:
+                outcomes[futures[future]] = (False, e)
+            for branch in branches:
+                if branch not in outcomes:
+                    break
+                ok, value = outcomes[branch]
+                if ok:
+                    return value, branch
+        # Every candidate failed - surface the highest-priority error
+        raise outcomes[branches[0]][1]
+    finally:
+        # Losing probes are not waited for
+        for future in futures:
+            future.cancel()
+        executor.shutdown(wait=False)
+
+def _fetch_repository_component_json(repo_url: str) -> Tuple[str, str]:
+    """
+    Locate component.json for a bare GitHub repository URL.
+
+    The branch it was found on is remembered in the fetch cache, so later
+    installs from the same repository skip probing entirely.
+
+    Returns:
+        Tuple of (component.json content, component.json blob URL)
+    """
+    cache = get_fetch_cache()
+    known = None
+    if cache is not None:
+        try:
+            known = cache.get_branch(repo_url)
+        except Exception:
+            # A broken cache only costs a probe
+            known = None
+    if known:
+        component_url = f"{repo_url}/blob/{known}/component.json"
+        try:
+            return fetch_file_content(component_url), component_url
+        except Exception:
+            # Branch was renamed or removed; forget it and probe again
+            _remember_branch(cache, repo_url, None)
+
+    content, branch = _probe_branches(repo_url, _default_branches())
+    _remember_branch(cache, repo_url, branch)
+    return content, f"{repo_url}/blob/{branch}/component.json"
+
+def _remember_branch(cache, repo_url: str, branch: Optional[str]):
+    """Store (or forget) a repository's branch in the fetch cache, if it is usable."""
+    if cache is None:
+        return
+    try:
+        cache.set_branch(repo_url, branch)
+    except Exception:
+        # A broken cache must never fail the fetch itself
+        pass
+
+def _load_component_from_github_archive(url: str, max_workers: Optional[int] = None,
+                                        fetch_files: bool = True) -> Optional[ComponentSchema]:
+    """
+    Load a GitHub tree component from a single repository tarball.
+
+    Returns None when the archive is unavailable or has no component.json, so
+    callers can fall back to fetching files one by one.
+    """
+    tree_ref = parse_github_tree_url(url)
+    if tree_ref is None or is_offline():
+        return None
+    try:
+        members = fetch_github_archive(tree_ref)
+    except (requests.RequestException, tarfile.TarError, OSError):
+        return None
+    if "component.json" not in members:
+        return None
+    content = members["component.json"].decode("utf-8", errors="replace")
+    return load_component_from_json(content, base=url, max_workers=max_workers, prefetched=members,
+                                    fetch_files=fetch_files)
+
+def load_component_from_url(url: str, max_workers: Optional[int] = None,
+                            archive: Optional[bool] = None, fetch_files: bool = True) -> ComponentSchema:
     """
     Load component from various URL formats, with enhanced GitHub support.
 
@@ -229,6 +720,11 @@ def load_component_from_url(url: str) -> ComponentSchema:
 
     Args:
         url: URL pointing to component or repository
+        max_workers: Maximum number of files fetched concurrently
+        archive: For GitHub tree URLs, download the repository tarball once and
+                 serve every file from it instead of one request per file.
+                 Defaults to the ZEN_GITHUB_ARCHIVE environment setting.
+        fetch_files: Passed through to load_component_from_json
 
     Returns:
         ComponentSchema instance with file content fetched/resolved
@@ -238,44 +734,92 @@ def load_component_from_url(url: str) -> ComponentSchema:
         
         # Handle GitHub repository URLs
         if parsed_url.netloc.lower() == "github.com":
-            if "/tree/" in parsed_url.path or "/blob/" in parsed_url.path:
+            component = None
+            if "/tree/" in parsed_url.path and archive_mode_enabled(archive):
+                # One tarball download; falls back to per-file fetching below
+                component = _load_component_from_github_archive(url, max_workers=max_workers,
+                                                                fetch_files=fetch_files)
+            if component is not None:
+                resolved = resolve_file_source(url)[0]
+            elif "/tree/" in parsed_url.path or "/blob/" in parsed_url.path:
                 # GitHub tree or blob URL - fetch component.json from that path
                 content = fetch_file_content(url)
-                return load_component_from_json(content, base=url)
+                component = load_component_from_json(content, base=url, max_workers=max_workers, fetch_files=fetch_files)
+                resolved = resolve_file_source(url)[0]
             elif parsed_url.path.endswith('.json'):
                 # Direct JSON file URL
                 content = fetch_file_content(url)
-                return load_component_from_json(content, base=url)
+                component = load_component_from_json(content, base=url, max_workers=max_workers, fetch_files=fetch_files)
+                resolved = resolve_file_source(url)[0]
             else:
-                # Repository root - try to find component.json
-                repo_url = f"https://github.com{parsed_url.path}"
-                component_url = f"{repo_url}/blob/main/component.json"
-                try:
-                    content = fetch_file_content(component_url)
-                    return load_component_from_json(content, base=component_url)
-                except:
-                    # Try master branch
-                    component_url = f"{repo_url}/blob/master/component.json"
-                    content = fetch_file_content(component_url)
-                    return load_component_from_json(content, base=component_url)
+                # Repository root - find component.json on the default branch
+                repo_url = f"https://github.com{parsed_url.path.rstrip('/')}"
+                content, component_url = _fetch_repository_component_json(repo_url)
+                component = load_component_from_json(content, base=component_url, max_workers=max_workers, fetch_files=fetch_files)
+                resolved = resolve_file_source(component_url)[0]
         
         # Handle file:// URLs
-        if parsed_url.scheme == 'file':
+        elif parsed_url.scheme == 'file':
             file_path = parsed_url.path
             base = file_path  # filesystem path for resolving relative file urls
             with open(file_path, 'r', encoding='utf-8') as f:
                 content = f.read()
-            return load_component_from_json(content, base=base)
+            component = load_component_from_json(content, base=base, max_workers=max_workers, fetch_files=fetch_files)
+            resolved = url
         
         # Handle HTTP/HTTPS URLs
-        response = requests.get(url, timeout=30)
-        response.raise_for_status()
-        # Use the directory containing the JSON as base for resolving relative file urls
-        base_url = url.rsplit('/', 1)[0] + '/'
-        return load_component_from_json(response.text, base=base_url)
-    except (requests.RequestException, FileNotFoundError, OSError) as e:
+        else:
+            content = _http_get(url, timeout=30)
+            # Use the directory containing the JSON as base for resolving relative file urls
+            base_url = url.rsplit('/', 1)[0] + '/'
+            component = load_component_from_json(content, base=base_url, max_workers=max_workers, fetch_files=fetch_files)
+            resolved = url
+
+        component._source_url = resolved
+        return component
+    except (requests.RequestException, NetworkError, FileNotFoundError, OSError) as e:
         raise ValueError(f"Failed to fetch component from {url}: {e}")
 
+def load_components_from_urls(urls: List[str], max_workers: Optional[int] = None,
+                              archive: Optional[bool] = None, fetch_files: bool = True) -> List[ComponentSchema]:
+    """
+    Load several components concurrently.
+
+    Components are returned in the order of `urls`. The first failure cancels
+    every load that has not started yet and is raised as ValueError.
+
+    Args:
+        urls: Component URLs (any format accepted by load_component_from_url)
+        max_workers: Maximum number of components resolved at once
+        archive: Passed through to load_component_from_url
+        fetch_files: Passed through to load_component_from_url
+
+    Returns:
+        List of ComponentSchema instances, one per URL
+    """
+    if len(urls) <= 1:
+        return [load_component_from_url(url, archive=archive, fetch_files=fetch_files) for url in urls]
+
+    workers = min(max_workers or _default_fetch_concurrency(), len(urls))
+    results: List[Optional[ComponentSchema]] = [None] * len(urls)
+    executor = ThreadPoolExecutor(max_workers=workers, thread_name_prefix="zen-resolve")
+    futures = {executor.submit(load_component_from_url, url, archive=archive,
+                               fetch_files=fetch_files): i for i, url in enumerate(urls)}
+    failed = False
+    try:
+        for future in as_completed(futures):
+            i = futures[future]
+            try:
+                results[i] = future.result()
+            except Exception as e:
+                failed = True
+                for other in futures:
+                    other.cancel()
+                raise ValueError(f"Failed to load component from {urls[i]}: {e}")
+    finally:
+        executor.shutdown(wait=not failed)
+    return results
+
 def create_sample_component_json() -> str:
     """Create a sample component JSON for testing (uses url-based files)."""
     sample = {